@@ -22,6 +22,10 @@ from .pymfcad import (
 
 from .backend import (
     set_fn,
+    set_chord_error,
+    set_lazy_csg,
+    set_mesh_cache_dir,
+    set_slice_tolerance,
     Shape,
     Cube,
     Cylinder,
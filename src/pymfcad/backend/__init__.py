@@ -5,6 +5,9 @@ Module that provides 3D manifold shapes and transforms as well as polychannel (c
 from .color import Color
 from .manifold3d import (
     set_fn,
+    set_chord_error,
+    set_lazy_csg,
+    set_mesh_cache_dir,
     Shape,
     Cube,
     Cylinder,
@@ -16,7 +19,18 @@ from .manifold3d import (
 )
 from .render import render_component
 
-from .slice import slice_component, rle_decode_packed, rle_encode_packed, rle_is_all_non_zeros, rle_is_all_zeros
+from .slice import (
+    set_slice_tolerance,
+    slice_component,
+    iter_layers,
+    rasterize_layer,
+    build_composite_shape,
+    compute_layer_windows,
+    rle_decode_packed,
+    rle_encode_packed,
+    rle_is_all_non_zeros,
+    rle_is_all_zeros,
+)
 from .polychannel import (
     Polychannel,
     PolychannelShape,
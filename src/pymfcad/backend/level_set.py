@@ -0,0 +1,334 @@
+"""
+Grid-based level set meshing for vectorizable implicit functions.
+
+Manifold.level_set calls its function once per sample point from C++, which
+dominates the cost for TPMS lattices. These helpers evaluate the function over
+the whole sample grid with array arguments and mesh the result with marching
+tetrahedra before handing it to Manifold.
+"""
+
+from __future__ import annotations
+
+import itertools
+import numpy as np
+from numba import njit
+from collections.abc import Callable
+from manifold3d import Manifold, Mesh, Error
+
+# Maximum number of samples evaluated per function call.
+_EVALUATION_CHUNK = 1 << 21
+
+# Every tetrahedron edge runs from a grid point along one of these offsets.
+_EDGE_DIRS = np.array(
+    [
+        (1, 0, 0),
+        (0, 1, 0),
+        (0, 0, 1),
+        (1, 1, 0),
+        (1, 0, 1),
+        (0, 1, 1),
+        (1, 1, 1),
+    ],
+    dtype=np.int64,
+)
+# Key slot used for vertices that sit exactly on a grid point.
+_POINT_SLOT = len(_EDGE_DIRS)
+
+
+def _permutation_parity(perm: tuple[int, ...]) -> int:
+    """
+    Return 0 for even permutations and 1 for odd permutations.
+
+    Parameters:
+
+    - perm (tuple[int, ...]): Permutation of range(len(perm)).
+
+    Returns:
+
+    - int: Parity of the permutation.
+    """
+    perm = list(perm)
+    parity = 0
+    for i in range(len(perm)):
+        while perm[i] != i:
+            j = perm[i]
+            perm[i], perm[j] = perm[j], perm[i]
+            parity ^= 1
+    return parity
+
+
+def _build_tables() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build the marching tetrahedra lookup tables.
+
+    Each grid cube is split into six positively oriented tetrahedra sharing the
+    (0, 0, 0)-(1, 1, 1) diagonal, so neighbouring cubes agree on every shared
+    edge and face. Triangle corners are stored as pairs of tetrahedron corners
+    and are wound so normals point away from the inside (positive) region.
+
+    Returns:
+
+    - np.ndarray: Tetrahedron corner offsets, shape (6, 4, 3).
+    - np.ndarray: Triangles per inside-corner mask, shape (16, 2, 3, 2), -1 when unused.
+    - np.ndarray: Edge direction index for each offset, shape (2, 2, 2).
+    """
+    corners = []
+    for axes in itertools.permutations(range(3)):
+        point = [0, 0, 0]
+        tet = [tuple(point)]
+        for axis in axes:
+            point[axis] += 1
+            tet.append(tuple(point))
+        a, b, c, d = (np.array(p, dtype=float) for p in tet)
+        if np.linalg.det(np.array([b - a, c - a, d - a])) < 0:
+            tet[2], tet[3] = tet[3], tet[2]
+        corners.append(tet)
+
+    even = [p for p in itertools.permutations(range(4)) if not _permutation_parity(p)]
+    triangles = np.full((16, 2, 3, 2), -1, dtype=np.int64)
+    for mask in range(16):
+        inside = [i for i in range(4) if mask >> i & 1]
+        if len(inside) == 1:
+            a, b, c, d = next(p for p in even if p[0] == inside[0])
+            triangles[mask, 0] = [(a, b), (a, c), (a, d)]
+        elif len(inside) == 3:
+            outside = next(i for i in range(4) if i not in inside)
+            a, b, c, d = next(p for p in even if p[0] == outside)
+            triangles[mask, 0] = [(a, b), (a, d), (a, c)]
+        elif len(inside) == 2:
+            a, b, c, d = next(p for p in even if set(p[:2]) == set(inside))
+            triangles[mask, 0] = [(a, c), (a, d), (b, d)]
+            triangles[mask, 1] = [(a, c), (b, d), (b, c)]
+
+    dir_index = np.full((2, 2, 2), -1, dtype=np.int64)
+    for i, (x, y, z) in enumerate(_EDGE_DIRS):
+        dir_index[x, y, z] = i
+
+    return np.array(corners, dtype=np.int64), triangles, dir_index
+
+
+_TET_CORNERS, _TET_TRIANGLES, _EDGE_DIR_INDEX = _build_tables()
+
+
+@njit
+def _march_tetrahedra(
+    values: np.ndarray,
+    corners: np.ndarray,
+    triangles: np.ndarray,
+    dir_index: np.ndarray,
+    keys: np.ndarray,
+) -> int:
+    """
+    Run marching tetrahedra over a sampled grid (uses @njit decorator for performance).
+
+    Each triangle corner is written as an integer key naming the grid edge it
+    lies on, or a grid point when the crossing collapses onto it: either the
+    point's value is exactly 0, or the edge leads into the padding layer that
+    surrounds the samples. Pass an empty keys array to only count triangles.
+
+    Parameters:
+
+    - values (np.ndarray): Sampled values padded by one outside layer, positive inside, shape (nx, ny, nz).
+    - corners (np.ndarray): Tetrahedron corner offsets from _build_tables.
+    - triangles (np.ndarray): Triangle table from _build_tables.
+    - dir_index (np.ndarray): Edge direction index table from _build_tables.
+    - keys (np.ndarray): Output edge keys, shape (triangle_count, 3) or (0, 3).
+
+    Returns:
+
+    - int: Number of triangles.
+    """
+    nx, ny, nz = values.shape
+    count = 0
+    for i in range(nx - 1):
+        for j in range(ny - 1):
+            for k in range(nz - 1):
+                for t in range(6):
+                    mask = 0
+                    for v in range(4):
+                        if (
+                            values[
+                                i + corners[t, v, 0],
+                                j + corners[t, v, 1],
+                                k + corners[t, v, 2],
+                            ]
+                            > 0
+                        ):
+                            mask |= 1 << v
+                    if mask == 0 or mask == 15:
+                        continue
+                    for tri in range(2):
+                        if triangles[mask, tri, 0, 0] < 0:
+                            break
+                        if keys.shape[0] > 0:
+                            for e in range(3):
+                                va = triangles[mask, tri, e, 0]
+                                vb = triangles[mask, tri, e, 1]
+                                a0 = i + corners[t, va, 0]
+                                a1 = j + corners[t, va, 1]
+                                a2 = k + corners[t, va, 2]
+                                b0 = i + corners[t, vb, 0]
+                                b1 = j + corners[t, vb, 1]
+                                b2 = k + corners[t, vb, 2]
+                                # Key edges by their lower endpoint.
+                                if b0 < a0 or b1 < a1 or b2 < a2:
+                                    a0, b0 = b0, a0
+                                    a1, b1 = b1, a1
+                                    a2, b2 = b2, a2
+                                a_pad = (
+                                    a0 == 0 or a1 == 0 or a2 == 0
+                                )
+                                b_pad = (
+                                    b0 == nx - 1 or b1 == ny - 1 or b2 == nz - 1
+                                )
+                                if b_pad or values[a0, a1, a2] == 0.0:
+                                    keys[count, e] = ((a0 * ny + a1) * nz + a2) * 8 + 7
+                                elif a_pad or values[b0, b1, b2] == 0.0:
+                                    keys[count, e] = ((b0 * ny + b1) * nz + b2) * 8 + 7
+                                else:
+                                    keys[count, e] = ((a0 * ny + a1) * nz + a2) * 8 + dir_index[
+                                        b0 - a0, b1 - a1, b2 - a2
+                                    ]
+                        count += 1
+    return count
+
+
+def _evaluate_points(
+    func: Callable,
+    x: np.ndarray,
+    y: np.ndarray,
+    z: np.ndarray,
+) -> np.ndarray:
+    """
+    Evaluate a vectorizable function on arrays of coordinates.
+
+    Parameters:
+
+    - func (Callable): Function of (x, y, z) that accepts and returns NumPy arrays.
+    - x (np.ndarray): Sample x coordinates.
+    - y (np.ndarray): Sample y coordinates, same shape as x.
+    - z (np.ndarray): Sample z coordinates, same shape as x.
+
+    Returns:
+
+    - np.ndarray: Function values, same shape as x.
+
+    Raises:
+
+    - ValueError: The function cannot be evaluated on arrays.
+    """
+    try:
+        values = np.asarray(func(x, y, z), dtype=float)
+    except Exception as e:
+        raise ValueError(f"Function cannot be evaluated on arrays: {e}") from e
+    if values.shape != x.shape:
+        raise ValueError(
+            f"Function returned shape {values.shape} for inputs of shape {x.shape}"
+        )
+    return values
+
+
+def _evaluate_grid(
+    func: Callable,
+    xs: np.ndarray,
+    ys: np.ndarray,
+    zs: np.ndarray,
+) -> np.ndarray:
+    """
+    Evaluate a vectorizable function on a rectilinear grid.
+
+    The function is called with array arguments, a slab of x values at a time
+    to bound memory use.
+
+    Parameters:
+
+    - func (Callable): Function of (x, y, z) that accepts and returns NumPy arrays.
+    - xs (np.ndarray): Sample x coordinates.
+    - ys (np.ndarray): Sample y coordinates.
+    - zs (np.ndarray): Sample z coordinates.
+
+    Returns:
+
+    - np.ndarray: Function values, shape (len(xs), len(ys), len(zs)).
+
+    Raises:
+
+    - ValueError: The function cannot be evaluated on arrays.
+    """
+    values = np.empty((len(xs), len(ys), len(zs)))
+    step = max(1, _EVALUATION_CHUNK // max(1, len(ys) * len(zs)))
+    for start in range(0, len(xs), step):
+        x, y, z = np.meshgrid(xs[start : start + step], ys, zs, indexing="ij")
+        values[start : start + step] = _evaluate_points(func, x, y, z)
+    return values
+
+
+def _grid_level_set(
+    func: Callable,
+    bounds: list[float],
+    edge_length: float,
+    level: float = 0.0,
+) -> Manifold:
+    """
+    Mesh the region where func > level inside bounds, like Manifold.level_set.
+
+    Parameters:
+
+    - func (Callable): Vectorizable function of (x, y, z).
+    - bounds (list[float]): Domain as [x0, y0, z0, x1, y1, z1].
+    - edge_length (float): Approximate grid spacing.
+    - level (float): Level set value.
+
+    Returns:
+
+    - Manifold: The meshed level set, closed by caps on the domain bounds.
+
+    Raises:
+
+    - ValueError: The function cannot be evaluated on arrays or the mesh is not manifold.
+    """
+    lo = np.array(bounds[:3], dtype=float)
+    hi = np.array(bounds[3:], dtype=float)
+    counts = np.maximum(np.round((hi - lo) / edge_length).astype(np.int64), 1)
+    axes = [np.linspace(lo[a], hi[a], counts[a] + 1) for a in range(3)]
+
+    # Surround the samples with an outside layer; crossings into it collapse
+    # onto the boundary samples so caps land exactly on the bounds.
+    values = np.full(tuple(counts + 3), -1.0)
+    values[1:-1, 1:-1, 1:-1] = _evaluate_grid(func, *axes) - level
+
+    empty = np.empty((0, 3), dtype=np.int64)
+    count = _march_tetrahedra(values, _TET_CORNERS, _TET_TRIANGLES, _EDGE_DIR_INDEX, empty)
+    keys = np.empty((count, 3), dtype=np.int64)
+    _march_tetrahedra(values, _TET_CORNERS, _TET_TRIANGLES, _EDGE_DIR_INDEX, keys)
+
+    # Triangles collapsed onto a grid point are dropped.
+    keys = keys[
+        (keys[:, 0] != keys[:, 1])
+        & (keys[:, 1] != keys[:, 2])
+        & (keys[:, 0] != keys[:, 2])
+    ]
+    unique_keys, tri_verts = np.unique(keys.ravel(), return_inverse=True)
+
+    slot = unique_keys % 8
+    point = unique_keys // 8
+    ny, nz = values.shape[1], values.shape[2]
+    a = np.stack([point // (ny * nz), point // nz % ny, point % nz], axis=1)
+    on_point = slot == _POINT_SLOT
+    b = a + np.where(on_point[:, None], 0, _EDGE_DIRS[np.minimum(slot, _POINT_SLOT - 1)])
+    va = values[a[:, 0], a[:, 1], a[:, 2]]
+    vb = values[b[:, 0], b[:, 1], b[:, 2]]
+    t = np.where(on_point, 0.0, va / np.where(on_point, 1.0, va - vb))
+    spacing = (hi - lo) / counts
+    verts = lo + (a - 1 + t[:, None] * (b - a)) * spacing
+    verts = np.clip(verts, lo, hi)
+
+    manifold = Manifold(
+        Mesh(
+            np.ascontiguousarray(verts, dtype=np.float32),
+            np.ascontiguousarray(tri_verts.reshape(-1, 3), dtype=np.uint32),
+        )
+    )
+    if manifold.status() != Error.NoError:
+        raise ValueError(f"Grid level set is not manifold: {manifold.status()}")
+    return manifold
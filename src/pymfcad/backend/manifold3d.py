@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import os
+import hashlib
 import trimesh
 import freetype
 import numpy as np
 import importlib.util
 from numba import njit
 from pathlib import Path
+from collections import OrderedDict
 
 
 from collections.abc import Callable
-from manifold3d import set_circular_segments, Manifold, Mesh, CrossSection, OpType
+from manifold3d import set_circular_segments, Manifold, Mesh, CrossSection, OpType, Error
+from .level_set import _grid_level_set, _evaluate_points, _EVALUATION_CHUNK
 
 def _resolve_font_path(font: str) -> Path:
     """
@@ -47,6 +50,155 @@ def _resolve_font_path(font: str) -> Path:
     )
 
 
+# Least recently used cache of open font faces, keyed by resolved path. The
+# character size is part of a face's state, so it is set again before every glyph
+# is loaded.
+_FONT_FACE_CACHE_SIZE = 8
+_font_faces = OrderedDict()
+
+# Least recently used cache of glyph cross sections and advances, keyed by font
+# path, character, font size and curve steps.
+_GLYPH_CACHE_SIZE = 1024
+_glyph_cache = OrderedDict()
+
+
+def _font_face(font_path: str) -> freetype.Face:
+    """
+    Return the font face for a font file, opening it on a cache miss.
+
+    Parameters:
+
+    - font_path (str): Path to a TrueType or OpenType font file.
+
+    Returns:
+
+    - freetype.Face: The shared font face.
+    """
+    face = _font_faces.get(font_path)
+    if face is not None:
+        _font_faces.move_to_end(font_path)
+        return face
+    face = freetype.Face(font_path)
+    _font_faces[font_path] = face
+    if len(_font_faces) > _FONT_FACE_CACHE_SIZE:
+        _font_faces.popitem(last=False)
+    return face
+
+
+def _glyph_to_polygons(
+    face: freetype.Face,
+    char: str,
+    scale: float = 1.0,
+    curve_steps: int = 10,
+) -> list[np.ndarray]:
+    """
+    Convert a glyph into one or more polygon outlines.
+
+    Parameters:
+
+    - face (freetype.Face): Font face to read glyphs from.
+    - char (str): Character to load.
+    - scale (float): Scale factor to apply to glyph points.
+    - curve_steps (int): Number of steps for curve interpolation.
+
+    Returns:
+
+    - list[np.ndarray]: List of polygon point arrays.
+    """
+    face.load_char(char, freetype.FT_LOAD_NO_BITMAP)
+    outline = face.glyph.outline
+    points = np.array(outline.points, dtype=np.float32) * scale
+    tags = outline.tags
+    contours = outline.contours
+    # Column of curve parameters, so each quadratic is flattened in one expression.
+    t = np.linspace(0, 1, curve_steps)[:, None]
+
+    polys = []
+    start = 0
+    for end in contours:
+        pts = points[start : end + 1]
+        tgs = tags[start : end + 1]
+        n = len(pts)
+
+        # Wrap-around: emulate circular indexing
+        pts = list(pts)
+        tgs = list(tgs)
+        pts.append(pts[0])
+        tgs.append(tgs[0])
+
+        segments = []
+        last = None
+        i = 0
+        while i < n:
+            pt1 = pts[i]
+            tag1 = tgs[i] & 1
+            if tag1:  # on-curve
+                segments.append(pt1[None])
+                last = pt1
+                i += 1
+            else:
+                # pt1 is control point
+                if tgs[i + 1] & 1:  # next is on-curve
+                    pt2 = pts[i + 1]
+                    p0 = last if last is not None else (pt1 + pt2) / 2
+                    i += 2
+                else:
+                    # next is off-curve → implied on-curve midpoint
+                    pt2 = (pt1 + pts[i + 1]) / 2
+                    p0 = last if last is not None else pt2
+                    i += 1
+                curve = (1 - t) ** 2 * p0 + 2 * (1 - t) * t * pt1 + t**2 * pt2
+                segments.append(curve)
+                last = curve[-1]
+
+        if sum(len(segment) for segment in segments) >= 3:
+            polys.append(np.concatenate(segments))
+        start = end + 1
+
+    return polys
+
+
+def _glyph_cross_section(
+    font_path: str,
+    char: str,
+    font_size: int,
+    curve_steps: int = 10,
+) -> tuple[CrossSection | None, float]:
+    """
+    Return the cross section and advance of a glyph, building them only on a cache miss.
+
+    Parameters:
+
+    - font_path (str): Path to a TrueType or OpenType font file.
+    - char (str): Character to load.
+    - font_size (int): Font size in px.
+    - curve_steps (int): Number of steps for curve interpolation.
+
+    Returns:
+
+    - CrossSection | None: Glyph outline at the origin, or None when the glyph has no outline.
+    - float: Horizontal advance of the glyph in px.
+    """
+    key = (font_path, char, font_size, curve_steps)
+    glyph = _glyph_cache.get(key)
+    if glyph is not None:
+        _glyph_cache.move_to_end(key)
+        return glyph
+
+    face = _font_face(font_path)
+    face.set_char_size(font_size * 64)
+    polys = _glyph_to_polygons(face, char, scale=1.0 / 64.0, curve_steps=curve_steps)
+    xsec = None
+    if polys:
+        # Create cross section with outer + holes
+        xsec = CrossSection([poly[::-1].tolist() for poly in polys])
+    glyph = (xsec, face.glyph.advance.x / 64.0)
+    _glyph_cache[key] = glyph
+    if len(_glyph_cache) > _GLYPH_CACHE_SIZE:
+        _glyph_cache.popitem(last=False)
+    return glyph
+
+
 def _is_integer(val: float) -> bool:
     """
     Check if a float value is close to an integer.
@@ -62,6 +214,9 @@ def _is_integer(val: float) -> bool:
     return abs(val - round(val)) < 1e-6
 
 
+_default_fn = None
+
+
 def set_fn(fn: int) -> None:
     """
     Set the default number of facets for round shapes.
@@ -70,24 +225,581 @@ def set_fn(fn: int) -> None:
 
     - fn (int): Number of facets for circular segments.
     """
+    global _default_fn
+    _default_fn = fn
     set_circular_segments(fn)
 
 
 set_fn(20)  # Set default circular segments to 20.
 
 
+# Maximum chord error in px for round shapes without an explicit fn, or None to
+# use the default number of facets.
+_chord_error = None
+
+
+def set_chord_error(error: float | None) -> None:
+    """
+    Derive the number of facets of round shapes from their radius.
+
+    With a fixed number of facets a 2 px via gets as many triangles as a 200 px
+    reservoir. When a chord error is set, Cylinder, Sphere and RoundedCube shapes
+    (and the polychannel shapes built from them) that do not pass their own fn use
+    the fewest facets for which no edge strays further than the error from the true
+    circle. Counts are rounded up to a multiple of 4 so the shapes keep their
+    bounding boxes.
+
+    Parameters:
+
+    - error (float | None): Maximum distance in px between a facet and the circle, or None to use set_fn.
+
+    Raises:
+
+    - ValueError: The error is not positive.
+    """
+    global _chord_error
+    if error is not None and error <= 0:
+        raise ValueError("Chord error must be positive.")
+    _chord_error = error
+
+
+def _circular_segments(fn: int | None, radius: float) -> int | None:
+    """
+    Resolve the number of facets for a round shape.
+
+    Parameters:
+
+    - fn (int | None): Number of facets requested by the shape, 0, negative or None for the default.
+    - radius (float): Largest radius of the shape in px.
+
+    Returns:
+
+    - int | None: fn itself, or the facet count for the chord error when it applies.
+    """
+    if _chord_error is None or (fn is not None and fn > 0):
+        return fn
+    if radius <= _chord_error:
+        return 4
+    segments = int(np.ceil(np.pi / np.arccos(1 - _chord_error / radius)))
+    return max(4, -(-segments // 4) * 4)
+
+
+# Least recently used cache of primitive manifolds. Manifolds are immutable, so
+# shapes built with the same arguments can share one tessellation and apply
+# their own transforms to it.
+_PRIMITIVE_CACHE_SIZE = 1024
+_primitive_cache = OrderedDict()
+
+
+def _cached_primitive(key: tuple, build: Callable[[], Manifold]) -> Manifold:
+    """
+    Return the manifold for a primitive, building it only on a cache miss.
+
+    Parameters:
+
+    - key (tuple): Primitive type and every argument that affects its geometry.
+    - build (Callable[[], Manifold]): Function building the manifold.
+
+    Returns:
+
+    - Manifold: The cached or newly built manifold.
+    """
+    # Round shapes with fn=0 depend on the default number of facets.
+    key = key + (_default_fn,)
+    manifold = _primitive_cache.get(key)
+    if manifold is not None:
+        _primitive_cache.move_to_end(key)
+        return manifold
+    manifold = build()
+    _primitive_cache[key] = manifold
+    if len(_primitive_cache) > _PRIMITIVE_CACHE_SIZE:
+        _primitive_cache.popitem(last=False)
+    return manifold
+
+
+# Directory of the on-disk mesh cache, or None when disabled.
+_mesh_cache_dir = None
+
+
+def set_mesh_cache_dir(directory: str | Path | None) -> None:
+    """
+    Enable or disable the on-disk cache of level set and imported meshes.
+
+    TPMS lattices are meshed in lattice coordinates before they are resized, so a
+    mesh only depends on the TPMS function and its cells, fill, refinement and
+    meshing options. When a directory is set, each mesh is stored there as vertex
+    and triangle .npy files named by a hash of those inputs (the function is hashed
+    by its bytecode and constants), and later runs memory-map the files instead of
+    meshing again. Globals or closure variables read by the function are not part of
+    the hash; clear the directory after changing them. ImportModel meshes are stored
+    after parsing and repair, named by a hash of the file contents.
+
+    Parameters:
+
+    - directory (str | Path | None): Cache directory, created when needed. None disables the cache.
+    """
+    global _mesh_cache_dir
+    _mesh_cache_dir = None if directory is None else Path(directory)
+
+
+def _hash_code(code, digest) -> None:
+    """
+    Add a code object and the code objects nested in its constants to a hash.
+
+    Parameters:
+
+    - code (CodeType): Code object to hash.
+    - digest (hashlib._Hash): Hash to update.
+    """
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            _hash_code(const, digest)
+        else:
+            digest.update(repr(const).encode())
+
+
+def _function_hash(func: Callable) -> str:
+    """
+    Hash the bytecode of a function, unwrapping numba dispatchers.
+
+    Parameters:
+
+    - func (Callable): Function to hash.
+
+    Returns:
+
+    - str: Hex digest of the function's code.
+    """
+    func = getattr(func, "py_func", func)
+    digest = hashlib.sha256()
+    _hash_code(func.__code__, digest)
+    return digest.hexdigest()
+
+
+def _cached_mesh(key: tuple, build: Callable[[], Manifold]) -> Manifold:
+    """
+    Return a manifold from the on-disk mesh cache, building and storing it on a miss.
+
+    Parameters:
+
+    - key (tuple): Every input that affects the mesh, with functions already hashed.
+    - build (Callable[[], Manifold]): Function building the manifold.
+
+    Returns:
+
+    - Manifold: The cached or newly built manifold.
+    """
+    if _mesh_cache_dir is None:
+        return build()
+
+    name = hashlib.sha256(repr(key).encode()).hexdigest()
+    verts_file = _mesh_cache_dir / f"{name}_verts.npy"
+    tris_file = _mesh_cache_dir / f"{name}_tris.npy"
+    if verts_file.is_file() and tris_file.is_file():
+        try:
+            manifold = Manifold(
+                Mesh(
+                    np.load(verts_file, mmap_mode="c"),
+                    np.load(tris_file, mmap_mode="c"),
+                )
+            )
+            if manifold.status() == Error.NoError:
+                return manifold
+        except (OSError, ValueError):
+            pass  # Unreadable entries are rebuilt and overwritten below.
+
+    manifold = build()
+    mesh = manifold.to_mesh()
+    _mesh_cache_dir.mkdir(parents=True, exist_ok=True)
+    for path, array in ((verts_file, mesh.vert_properties), (tris_file, mesh.tri_verts)):
+        # Write to a temporary file first so concurrent runs never read partial files.
+        temp_file = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(temp_file, "wb") as f:
+            np.save(f, array)
+        os.replace(temp_file, path)
+    return manifold
+
+
+# Least recently used cache of imported models, keyed by resolved path, file size
+# and modification time, so repeated imports of a file share one manifold.
+_IMPORT_CACHE_SIZE = 32
+_import_cache = OrderedDict()
+
+
+def _file_hash(filename: str) -> str:
+    """
+    Hash the contents of a file.
+
+    Parameters:
+
+    - filename (str): Path to the file.
+
+    Returns:
+
+    - str: Hex digest of the file contents.
+    """
+    digest = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+_lazy_csg = False
+
+
+def set_lazy_csg(enabled: bool) -> None:
+    """
+    Enable or disable lazy evaluation of Shape unions and differences.
+
+    Manifold objects already defer booleans until their geometry is needed and
+    flatten chains of the same operation into batch booleans, but a chain that
+    alternates unions and differences (e.g. ``a + b - c + d - e``) is evaluated
+    one boolean at a time. In lazy mode the operations are recorded on the Shape
+    and regrouped when its manifold is first used (slicing, rendering, transforms,
+    intersections and hulls): shapes added after a subtraction are unioned together
+    with the earlier shapes when their bounding boxes cannot overlap the subtracted
+    shapes, so the whole chain becomes as few batch booleans as possible.
+
+    Parameters:
+
+    - enabled (bool): True to record Shape unions and differences lazily.
+    """
+    global _lazy_csg
+    _lazy_csg = enabled
+
+
+def _boxes_overlap(box1: tuple, box2: tuple) -> bool:
+    """
+    Check if two bounding boxes overlap or touch.
+
+    Parameters:
+
+    - box1 (tuple): First box as (x0, y0, z0, x1, y1, z1).
+    - box2 (tuple): Second box as (x0, y0, z0, x1, y1, z1).
+
+    Returns:
+
+    - bool: True when the boxes share any point.
+    """
+    return all(box1[i] <= box2[i + 3] and box2[i] <= box1[i + 3] for i in range(3))
+
+
+def _culled_difference(bulk: Manifold, subtractions: list[Manifold]) -> Manifold:
+    """
+    Subtract manifolds from a bulk manifold, skipping those that cannot reach it.
+
+    Subtractions whose bounding box misses the bulk are dropped. When the bulk is
+    made of several disjoint pieces (e.g. separate chips on one device), each piece
+    only loses the parts of the subtractions that overlap its bounding box, so
+    independent regions run several small booleans instead of one global one.
+    Pieces that nothing overlaps are kept as they are.
+
+    Parameters:
+
+    - bulk (Manifold): Manifold to subtract from.
+    - subtractions (list[Manifold]): Manifolds to subtract.
+
+    Returns:
+
+    - Manifold: The bulk minus the subtractions.
+    """
+    if len(subtractions) == 0 or bulk.is_empty():
+        return bulk
+    pieces = bulk.decompose()
+    if len(pieces) > 1:
+        subtractions = [part for sub in subtractions for part in sub.decompose()]
+    else:
+        pieces = [bulk]
+    if len(subtractions) == 0:
+        return bulk
+    boxes = np.array([sub.bounding_box() for sub in subtractions], dtype=np.float64)
+    results = []
+    for piece in pieces:
+        box = np.asarray(piece.bounding_box(), dtype=np.float64)
+        hits = np.flatnonzero(
+            np.all(boxes[:, :3] <= box[3:], axis=1) & np.all(box[:3] <= boxes[:, 3:], axis=1)
+        )
+        if len(hits) == 0:
+            results.append(piece)
+            continue
+        results.append(
+            Manifold.batch_boolean(
+                [piece] + [subtractions[i] for i in hits], OpType.Subtract
+            )
+        )
+    if len(results) == 1:
+        return results[0]
+    return Manifold.compose(results)
+
+
+# Above this many box pairs, keepout intersections sweep over boxes sorted by x
+# instead of comparing every pair at once.
+_KEEPOUT_BROADCAST_LIMIT = 1 << 18
+
+# Keepout columns holding the (x, y, z) coordinates of each box corner.
+_KEEPOUT_CORNER_COLUMNS = np.array(
+    [[x, y, z] for x in (0, 3) for y in (1, 4) for z in (2, 5)], dtype=np.int64
+)
+
+
+def _keepout_array(boxes=()) -> np.ndarray:
+    """
+    Stack keepout boxes into a float64 array of shape (N, 6).
+
+    Parameters:
+
+    - boxes: Keepout arrays and/or single boxes as [x0, y0, z0, x1, y1, z1].
+
+    Returns:
+
+    - np.ndarray: The boxes, one per row.
+    """
+    if len(boxes) == 0:
+        return np.empty((0, 6), dtype=np.float64)
+    return np.vstack([np.asarray(box, dtype=np.float64).reshape(-1, 6) for box in boxes])
+
+
+@njit
+def _fuse_keepout_runs(
+    boxes: np.ndarray, first: np.ndarray, same: np.ndarray, axis: int, tolerance: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Fuse overlapping or touching boxes along one axis (uses @njit decorator for performance).
+
+    Parameters:
+
+    - boxes (np.ndarray): Boxes sorted by their other four extents, then by start along axis, shape (N, 6).
+    - first (np.ndarray): Lowest original index of each box, shape (N,).
+    - same (np.ndarray): True where a box has the same other extents as the box before it, shape (N,).
+    - axis (int): Axis to fuse along.
+    - tolerance (float): Largest gap between fused boxes.
+
+    Returns:
+
+    - np.ndarray: Fused boxes, shape (K, 6).
+    - np.ndarray: Lowest original index of each fused box, shape (K,).
+    """
+    out = np.empty_like(boxes)
+    out_first = np.empty_like(first)
+    count = 0
+    for i in range(boxes.shape[0]):
+        if count > 0 and same[i] and boxes[i, axis] <= out[count - 1, axis + 3] + tolerance:
+            for a in range(3):
+                out[count - 1, a] = min(out[count - 1, a], boxes[i, a])
+                out[count - 1, a + 3] = max(out[count - 1, a + 3], boxes[i, a + 3])
+            out_first[count - 1] = min(out_first[count - 1], first[i])
+        else:
+            out[count] = boxes[i]
+            out_first[count] = first[i]
+            count += 1
+    return out[:count], out_first[:count]
+
+
+@njit
+def _contained_keepouts(boxes: np.ndarray, order: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Flag boxes that lie inside an earlier kept box (uses @njit decorator for performance).
+
+    Boxes are visited by increasing start along x, and kept boxes that end before
+    the current box starts are dropped from the search.
+
+    Parameters:
+
+    - boxes (np.ndarray): Boxes, shape (N, 6).
+    - order (np.ndarray): Box indices sorted by x start, then largest first, shape (N,).
+    - tolerance (float): Distance a box may stick out of its container.
+
+    Returns:
+
+    - np.ndarray: True for each box that can be dropped, shape (N,).
+    """
+    contained = np.zeros(boxes.shape[0], dtype=np.bool_)
+    active = np.empty(boxes.shape[0], dtype=np.int64)
+    active_count = 0
+    for i in order:
+        count = 0
+        for k in range(active_count):
+            j = active[k]
+            if boxes[j, 3] + tolerance < boxes[i, 0]:
+                continue
+            active[count] = j
+            count += 1
+            if contained[i]:
+                continue
+            inside = True
+            for a in range(3):
+                if (
+                    boxes[i, a] < boxes[j, a] - tolerance
+                    or boxes[i, a + 3] > boxes[j, a + 3] + tolerance
+                ):
+                    inside = False
+                    break
+            contained[i] = inside
+        active_count = count
+        if not contained[i]:
+            active[active_count] = i
+            active_count += 1
+    return contained
+
+
+def _coalesce_keepouts(boxes: np.ndarray, tolerance: float = 0.0) -> np.ndarray:
+    """
+    Merge keepout boxes that overlap, touch or contain each other.
+
+    Boxes inside another box are dropped, and boxes sharing their extents on two axes
+    are fused when they overlap or touch along the third. With no tolerance the
+    union of the boxes is unchanged, so any box intersects the result exactly when
+    it intersected the original boxes (also after adding the same margin to every
+    box). A tolerance also merges boxes that are up to that far apart or out of line,
+    growing the union by at most the tolerance.
+
+    Parameters:
+
+    - boxes (np.ndarray): Keepout boxes, shape (N, 6).
+    - tolerance (float): Largest gap or misalignment that is merged.
+
+    Returns:
+
+    - np.ndarray: Merged boxes ordered by their first original box, shape (K, 6).
+    """
+    boxes = _keepout_array([boxes])
+    first = np.arange(len(boxes))
+    while len(boxes) > 1:
+        count = len(boxes)
+        for axis in range(3):
+            others = boxes[:, [a for a in range(6) if a % 3 != axis]]
+            if tolerance > 0:
+                others = np.round(others / tolerance)
+            order = np.lexsort((boxes[:, axis],) + tuple(others.T[::-1]))
+            others = others[order]
+            same = np.concatenate([[False], np.all(others[1:] == others[:-1], axis=1)])
+            boxes, first = _fuse_keepout_runs(
+                boxes[order], first[order], same, axis, float(tolerance)
+            )
+        volumes = np.prod(boxes[:, 3:] - boxes[:, :3], axis=1)
+        order = np.lexsort((-volumes, -boxes[:, 3], boxes[:, 0]))
+        keep = ~_contained_keepouts(boxes, order, float(tolerance))
+        boxes, first = boxes[keep], first[keep]
+        if len(boxes) == count:
+            break
+    return boxes[np.argsort(first, kind="stable")]
+
+
+def _copies_disjoint(bbox: tuple, offsets: np.ndarray) -> bool:
+    """
+    Check that copies of a bounding box placed at the given offsets never overlap or touch.
+
+    Offsets are bucketed into cells the size of the box, so only copies in the same
+    or neighbouring cells have to be compared.
+
+    Parameters:
+
+    - bbox (tuple): Box as (x0, y0, z0, x1, y1, z1).
+    - offsets (np.ndarray): Translation of each copy, shape (N, 3).
+
+    Returns:
+
+    - bool: True when no two copies share any point. Also False when the cells are too sparse to index.
+    """
+    extent = np.maximum(np.asarray(bbox[3:]) - np.asarray(bbox[:3]), 1e-9)
+    cells = np.floor(offsets / extent).astype(np.int64)
+    cells -= cells.min(axis=0) - 1
+    dims = cells.max(axis=0) + 2
+    if np.prod(dims.astype(np.float64)) >= 2**62:
+        return False
+    keys = np.ravel_multi_index(tuple(cells.T), tuple(dims))
+    order = np.argsort(keys)
+    sorted_keys = keys[order]
+    if np.any(sorted_keys[1:] == sorted_keys[:-1]):
+        return False
+    for delta in np.ndindex(3, 3, 3):
+        if delta == (1, 1, 1):
+            continue
+        neighbours = np.ravel_multi_index(tuple((cells + np.array(delta) - 1).T), tuple(dims))
+        pos = np.minimum(np.searchsorted(sorted_keys, neighbours), len(keys) - 1)
+        found = sorted_keys[pos] == neighbours
+        others = order[pos[found]]
+        if np.any(np.all(np.abs(offsets[others] - offsets[found]) <= extent, axis=1)):
+            return False
+    return True
+
+
 class Shape:
     """
     Manifold3D generic shape class.
     """
 
     def __init__(self) -> None:
+        # Hook registered by the owning component to apply transforms it has not
+        # applied to its shapes yet; called before the manifold or keepouts are read.
+        self._sync = None
         self._name = None
         self._parent = None
         self._color = None
         self._label = None
         self._object = None
-        self._keepouts = []
+        self._keepouts = _keepout_array()
+
+    @property
+    def _object(self) -> Manifold:
+        """Manifold of the shape, applying any booleans recorded in lazy mode."""
+        if self._sync is not None:
+            self._sync()
+        if self._pending_csg:
+            self._flush_csg()
+        return self._manifold
+
+    @_object.setter
+    def _object(self, value: Manifold) -> None:
+        self._pending_csg = []
+        self._manifold = value
+
+    @property
+    def _keepouts(self) -> np.ndarray:
+        """Keepout boxes of the shape, shape (N, 6)."""
+        if self._sync is not None:
+            self._sync()
+        return self._keepout_boxes
+
+    @_keepouts.setter
+    def _keepouts(self, value: np.ndarray) -> None:
+        self._keepout_boxes = value
+
+    def _flush_csg(self) -> None:
+        """
+        Apply the unions and differences recorded in lazy mode as batch booleans.
+
+        A recorded union can be moved before the pending differences when its bounding
+        box does not overlap any of them, since (A - C) + D == (A + D) - C when D and C
+        are disjoint. Otherwise the pending group is closed and a new one is started.
+        """
+        pending = self._pending_csg
+        self._pending_csg = []
+        additions = [self._manifold]
+        subtractions = []
+        subtraction_boxes = []
+        for op, other in pending:
+            box = other.bounding_box()
+            if op == OpType.Subtract:
+                subtractions.append(other)
+                subtraction_boxes.append(box)
+                continue
+            if any(_boxes_overlap(box, sub_box) for sub_box in subtraction_boxes):
+                group = Manifold.batch_boolean(additions, OpType.Add)
+                additions = [Manifold.batch_boolean([group] + subtractions, OpType.Subtract)]
+                subtractions = []
+                subtraction_boxes = []
+            additions.append(other)
+
+        result = additions[0]
+        if len(additions) > 1:
+            result = Manifold.batch_boolean(additions, OpType.Add)
+        if len(subtractions) > 0:
+            result = Manifold.batch_boolean([result] + subtractions, OpType.Subtract)
+        self._manifold = result
 
     @classmethod
     def _batch_boolean_add(cls, others: list["Shape"]) -> "Shape":
@@ -160,6 +872,9 @@ class Shape:
         """
         Add a list of shapes together, then subtract another list of shapes from the result.
 
+        Shapes to subtract only take part where their bounding boxes overlap the
+        result of the union (see _culled_difference).
+
         Parameters:
 
         - additions (list[Shape]): The list of shapes to add.
@@ -177,14 +892,12 @@ class Shape:
 
         c = cls()
 
-        c._object = Manifold.batch_boolean(
-            [other._object for other in additions],
-            OpType.Add,
-        )
-
-        c._object = Manifold.batch_boolean(
-            [c._object] + [other._object for other in subtractions],
-            OpType.Subtract,
+        c._object = _culled_difference(
+            Manifold.batch_boolean(
+                [other._object for other in additions],
+                OpType.Add,
+            ),
+            [other._object for other in subtractions],
         )
 
         c._name = additions[0]._name
@@ -202,11 +915,7 @@ class Shape:
 
         - translation (tuple[float, float, float]): The translation.
         """
-        dx, dy, dz = translation
-        self._keepouts = [
-            [x0 + dx, y0 + dy, z0 + dz, x1 + dx, y1 + dy, z1 + dz]
-            for x0, y0, z0, x1, y1, z1 in self._keepouts
-        ]
+        self._keepouts = self._keepouts + np.tile(np.asarray(translation, dtype=np.float64), 2)
 
     def _rotate_point(
         self, point: tuple[float, float, float], rotation: tuple[float, float, float]
@@ -214,6 +923,8 @@ class Shape:
         """
         Rotate a point around origin (0,0,0) with Euler angles (in degrees) in XYZ order.
 
+        Coordinates may also be NumPy arrays to rotate many points at once.
+
         Parameters:
 
         - point (tuple[float, float, float]): The point to rotate.
@@ -249,16 +960,22 @@ class Shape:
 
         - rotation (tuple[float, float, float]): The rotation.
         """
-        rotated_keepouts = []
-        for x0, y0, z0, x1, y1, z1 in self._keepouts:
-            # Get all 8 corners.
-            corners = [[x, y, z] for x in (x0, x1) for y in (y0, y1) for z in (z0, z1)]
-            rotated_corners = [self._rotate_point(pt, rotation) for pt in corners]
-            xs, ys, zs = zip(*rotated_corners)
-            rotated_keepouts.append(
-                [min(xs), min(ys), min(zs), max(xs), max(ys), max(zs)]
-            )
-        self._keepouts = rotated_keepouts
+        # Rotate all 8 corners of every box at once, shape (N, 8) per axis.
+        corners = self._keepouts[:, _KEEPOUT_CORNER_COLUMNS]
+        xs, ys, zs = self._rotate_point(
+            (corners[:, :, 0], corners[:, :, 1], corners[:, :, 2]), rotation
+        )
+        self._keepouts = np.stack(
+            [
+                xs.min(axis=1),
+                ys.min(axis=1),
+                zs.min(axis=1),
+                xs.max(axis=1),
+                ys.max(axis=1),
+                zs.max(axis=1),
+            ],
+            axis=1,
+        )
 
     def _scale_keepouts(self, scale: tuple[float, float, float]) -> None:
         """
@@ -268,18 +985,7 @@ class Shape:
 
         - scale (tuple[float, float, float]): The scale.
         """
-        sx, sy, sz = scale
-        self._keepouts = [
-            [
-                x0 * sx,
-                y0 * sy,
-                z0 * sz,
-                x1 * sx,
-                y1 * sy,
-                z1 * sz,
-            ]
-            for x0, y0, z0, x1, y1, z1 in self._keepouts
-        ]
+        self._keepouts = self._keepouts * np.tile(np.asarray(scale, dtype=np.float64), 2)
 
     def _mirror_keepouts(self, axis: tuple[bool, bool, bool]) -> None:
         """
@@ -289,14 +995,29 @@ class Shape:
 
         - axis (tuple[bool, bool, bool]): The axis to mirror.
         """
-        flip_x, flip_y, flip_z = axis
-        new_keepouts = []
-        for x0, y0, z0, x1, y1, z1 in self._keepouts:
-            nx0, nx1 = sorted([-x0, -x1]) if flip_x else (x0, x1)
-            ny0, ny1 = sorted([-y0, -y1]) if flip_y else (y0, y1)
-            nz0, nz1 = sorted([-z0, -z1]) if flip_z else (z0, z1)
-            new_keepouts.append([nx0, ny0, nz0, nx1, ny1, nz1])
-        self._keepouts = new_keepouts
+        flip = np.asarray(axis, dtype=bool)
+        lo = self._keepouts[:, :3]
+        hi = self._keepouts[:, 3:]
+        self._keepouts = np.concatenate(
+            [
+                np.where(flip, np.minimum(-lo, -hi), lo),
+                np.where(flip, np.maximum(-lo, -hi), hi),
+            ],
+            axis=1,
+        )
+
+    def _transform_keepouts(self, matrix: np.ndarray) -> None:
+        """
+        Transform the keepouts by an affine matrix.
+
+        Parameters:
+
+        - matrix (np.ndarray): 4x4 transform.
+        """
+        corners = self._keepouts[:, _KEEPOUT_CORNER_COLUMNS] @ matrix[:3, :3].T + matrix[:3, 3]
+        self._keepouts = np.concatenate(
+            [corners.min(axis=1), corners.max(axis=1)], axis=1
+        )
 
     def translate(self, translation: tuple[int, int, int]) -> "Shape":
         """
@@ -390,89 +1111,175 @@ class Shape:
         self._object = self._object.mirror(axis)
         return self
 
-    def __add__(self, other: "Shape") -> "Shape":
+    def _transform(self, matrix: np.ndarray) -> "Shape":
         """
-        Combine two shapes using union operation.
+        Apply an affine transform to the shape in a single step.
+
+        Used to place shapes with the transform accumulated by their component, so
+        the matrix should only map axes onto axes (translations, 90 degree rotations
+        and mirrors) for the keepouts to stay tight.
 
         Parameters:
 
-        - other (Shape): The other shape to combine with.
+        - matrix (np.ndarray): 4x4 transform.
 
         Returns:
 
-        - self (Shape): The combined shape.
+        - self (Shape): The transformed shape.
         """
-        self._keepouts.extend(other._keepouts)
-        self._object = self._object + other._object
+        self._transform_keepouts(matrix)
+        self._object = self._object.transform(matrix[:3])
         return self
 
-    def __sub__(self, other: "Shape") -> "Shape":
+    def _array(self, offsets) -> "Shape":
         """
-        Subtract another shape from this shape.
+        Replace the shape with copies of itself placed at the given offsets.
+
+        Copies that never overlap or touch are composed into a single manifold
+        directly, otherwise they are combined with one batch union.
 
         Parameters:
 
-        - other (Shape): The shape to subtract.
+        - offsets: Translation of each copy, shape (N, 3).
 
         Returns:
 
-        - self (Shape): The resulting shape after subtraction.
-        """
-        self._object = self._object - other._object
+        - self (Shape): The shape with all copies.
+
+        Raises:
+
+        - ValueError: No offsets were given.
+        """
+        offsets = np.asarray(offsets, dtype=np.float64).reshape(-1, 3)
+        if len(offsets) == 0:
+            raise ValueError("Shape arrays need at least one copy.")
+        self._keepouts = (
+            self._keepouts[None, :, :] + np.tile(offsets, 2)[:, None, :]
+        ).reshape(-1, 6)
+        manifold = self._object
+        copies = [manifold.translate(tuple(offset)) for offset in offsets]
+        if _copies_disjoint(manifold.bounding_box(), offsets):
+            self._object = Manifold.compose(copies)
+        else:
+            self._object = Manifold.batch_boolean(copies, OpType.Add)
         return self
 
-    def _intersect_boxes(
-        self, box1: list[float], box2: list[float]
-    ) -> list[float] | None:
+    def linear_array(self, count: int, step: tuple[float, float, float]) -> "Shape":
         """
-        Compute the intersection of two axis-aligned bounding boxes.
+        Repeat the shape along a line.
 
         Parameters:
 
-        - box1 (list[float]): First box as [x0, y0, z0, x1, y1, z1].
-        - box2 (list[float]): Second box as [x0, y0, z0, x1, y1, z1].
+        - count (int): Number of copies, including the shape itself.
+        - step (tuple[float, float, float]): Translation between neighbouring copies.
 
         Returns:
 
-        - list[float] | None: The intersecting box, or None if no overlap.
+        - self (Shape): The shape with all copies.
         """
-        x_min = max(box1[0], box2[0])
-        y_min = max(box1[1], box2[1])
-        z_min = max(box1[2], box2[2])
-        x_max = min(box1[3], box2[3])
-        y_max = min(box1[4], box2[4])
-        z_max = min(box1[5], box2[5])
-
-        # Check for non-empty intersection.
-        if x_min < x_max and y_min < y_max and z_min < z_max:
-            return [x_min, y_min, z_min, x_max, y_max, z_max]
-        else:
-            return None
+        return self._array(np.arange(count)[:, None] * np.asarray(step, dtype=np.float64))
 
-    def _intersect_keepouts(
-        self, list1: list[list[float]], list2: list[list[float]]
-    ) -> list[list[float]]:
+    def grid_array(
+        self, count: tuple[int, int, int], step: tuple[float, float, float]
+    ) -> "Shape":
         """
-        Intersect two keepout lists of axis-aligned bounding boxes.
+        Repeat the shape on a regular grid.
 
         Parameters:
 
-        - list1 (list[list[float]]): First list of boxes.
-        - list2 (list[list[float]]): Second list of boxes.
+        - count (tuple[int, int, int]): Number of copies along x, y and z, including the shape itself.
+        - step (tuple[float, float, float]): Spacing of the copies along x, y and z.
 
         Returns:
 
-        - list[list[float]]: List of intersecting boxes.
+        - self (Shape): The shape with all copies.
         """
-        intersections = []
-        for box1 in list1:
-            for box2 in list2:
-                inter = self._intersect_boxes(box1, box2)
-                if inter:
-                    intersections.append(inter)
-        return intersections
+        indices = np.stack(
+            [a.ravel() for a in np.meshgrid(*[np.arange(n) for n in count], indexing="ij")],
+            axis=1,
+        )
+        return self._array(indices * np.asarray(step, dtype=np.float64))
 
-    def __and__(self, other: "Shape") -> "Shape":
+    def __add__(self, other: "Shape") -> "Shape":
+        """
+        Combine two shapes using union operation.
+
+        Parameters:
+
+        - other (Shape): The other shape to combine with.
+
+        Returns:
+
+        - self (Shape): The combined shape.
+        """
+        self._keepouts = _keepout_array([self._keepouts, other._keepouts])
+        if _lazy_csg:
+            self._pending_csg.append((OpType.Add, other._object))
+            return self
+        self._object = self._object + other._object
+        return self
+
+    def __sub__(self, other: "Shape") -> "Shape":
+        """
+        Subtract another shape from this shape.
+
+        Parameters:
+
+        - other (Shape): The shape to subtract.
+
+        Returns:
+
+        - self (Shape): The resulting shape after subtraction.
+        """
+        if _lazy_csg:
+            self._pending_csg.append((OpType.Subtract, other._object))
+            return self
+        self._object = self._object - other._object
+        return self
+
+    def _intersect_keepouts(
+        self, boxes1: np.ndarray, boxes2: np.ndarray
+    ) -> np.ndarray:
+        """
+        Intersect two keepout arrays of axis-aligned bounding boxes.
+
+        Boxes that only touch are dropped. Intersections are ordered by their box in
+        boxes1, then by their box in boxes2.
+
+        Parameters:
+
+        - boxes1 (np.ndarray): First boxes, shape (N, 6).
+        - boxes2 (np.ndarray): Second boxes, shape (M, 6).
+
+        Returns:
+
+        - np.ndarray: Intersecting boxes, shape (K, 6).
+        """
+        if len(boxes1) * len(boxes2) <= _KEEPOUT_BROADCAST_LIMIT:
+            lo = np.maximum(boxes1[:, None, :3], boxes2[None, :, :3])
+            hi = np.minimum(boxes1[:, None, 3:], boxes2[None, :, 3:])
+            i, j = np.nonzero(np.all(lo < hi, axis=2))
+            return np.concatenate([lo[i, j], hi[i, j]], axis=1)
+
+        # Only boxes starting within the widest box of boxes2 before box1 can overlap it.
+        order = np.argsort(boxes2[:, 0], kind="stable")
+        sorted_boxes = boxes2[order]
+        starts = sorted_boxes[:, 0]
+        max_width = np.max(sorted_boxes[:, 3] - sorted_boxes[:, 0])
+        parts = []
+        for box in boxes1:
+            # Widen the window slightly so rounding never drops a candidate.
+            reach = max_width + 1e-9 * (abs(box[0]) + max_width)
+            first = np.searchsorted(starts, box[0] - reach, side="left")
+            last = np.searchsorted(starts, box[3], side="left")
+            candidates = np.sort(order[first:last])
+            lo = np.maximum(box[:3], boxes2[candidates, :3])
+            hi = np.minimum(box[3:], boxes2[candidates, 3:])
+            keep = np.all(lo < hi, axis=1)
+            parts.append(np.concatenate([lo[keep], hi[keep]], axis=1))
+        return _keepout_array(parts)
+
+    def __and__(self, other: "Shape") -> "Shape":
         """
         Intersect this shape with another shape.
 
@@ -491,24 +1298,20 @@ class Shape:
         )
         return self
 
-    def hull(self, other: "Shape") -> "Shape":
+    @staticmethod
+    def _hull_bridge_keepout(b1: tuple, b2: tuple) -> list[float]:
         """
-        Create a convex hull of this shape and another shape.
-        This method combines the keepouts of both shapes and creates a bridge between their bounding boxes.
+        Create the keepout bridging the bounding boxes of two hulled shapes.
 
         Parameters:
 
-        - other (Shape): The other shape to combine with.
+        - b1 (tuple): Bounding box of the first shape as (x0, y0, z0, x1, y1, z1).
+        - b2 (tuple): Bounding box of the second shape as (x0, y0, z0, x1, y1, z1).
 
         Returns:
 
-        - self (Shape): The resulting shape after creating the hull.
+        - list[float]: Bridge box as [x0, y0, z0, x1, y1, z1].
         """
-        # Combine keepouts.
-        self._keepouts.extend(other._keepouts)
-
-        # Get both bounding boxes.
-        b1 = self._object.bounding_box()
         b1 = (
             b1[0],
             b1[1],
@@ -517,7 +1320,6 @@ class Shape:
             b1[4],
             b1[5],
         )
-        b2 = other._object.bounding_box()
         b2 = (
             b2[0],
             b2[1],
@@ -546,14 +1348,36 @@ class Shape:
                 bridge_min[i] = min(b1[i], b2[i])
                 bridge_max[i] = max(b1[i + 3], b2[i + 3])
 
-        self._keepouts.append(
+        return [
+            bridge_min[0],
+            bridge_min[1],
+            bridge_min[2],
+            bridge_max[0],
+            bridge_max[1],
+            bridge_max[2],
+        ]
+
+    def hull(self, other: "Shape") -> "Shape":
+        """
+        Create a convex hull of this shape and another shape.
+        This method combines the keepouts of both shapes and creates a bridge between their bounding boxes.
+
+        Parameters:
+
+        - other (Shape): The other shape to combine with.
+
+        Returns:
+
+        - self (Shape): The resulting shape after creating the hull.
+        """
+        # Combine keepouts.
+        self._keepouts = _keepout_array(
             [
-                bridge_min[0],
-                bridge_min[1],
-                bridge_min[2],
-                bridge_max[0],
-                bridge_max[1],
-                bridge_max[2],
+                self._keepouts,
+                other._keepouts,
+                self._hull_bridge_keepout(
+                    self._object.bounding_box(), other._object.bounding_box()
+                ),
             ]
         )
 
@@ -564,6 +1388,9 @@ class Shape:
         """
         Create a copy of the shape.
 
+        Manifold objects are immutable (every operation returns a new one), so the
+        copy shares the underlying manifold and only the keepouts are copied.
+
         Parameters:
 
         - _internal (bool): If True, copy internal properties like name, parent, and color. (internal use only)
@@ -578,8 +1405,7 @@ class Shape:
             new_shape._parent = self._parent
             new_shape._color = self._color
             new_shape._label = self._label
-        mesh = self._object.to_mesh()
-        new_shape._object = Manifold(mesh)
+        new_shape._object = self._object
         new_shape._keepouts = self._keepouts.copy()
         return new_shape
 
@@ -599,7 +1425,7 @@ class Shape:
             bbox[4],
             bbox[5],
         )
-        self._keepouts.append(bbox)
+        self._keepouts = _keepout_array([self._keepouts, bbox])
 
 
 class Cube(Shape):
@@ -657,10 +1483,13 @@ class Cube(Shape):
         if size[2] == 0:
             size = (size[0], size[1], 0.0001)
 
-        self._object = Manifold.cube(
-            (size[0], size[1], size[2]),
-            center=center,
-        ).translate((x, y, z))
+        self._object = _cached_primitive(
+            ("cube", tuple(size), center, x, y, z),
+            lambda: Manifold.cube(
+                (size[0], size[1], size[2]),
+                center=center,
+            ).translate((x, y, z)),
+        )
         self._add_bbox_to_keepout(self._object.bounding_box())
 
 
@@ -742,22 +1571,19 @@ class Cylinder(Shape):
                         f"\t⚠️ Centered cylinder radius is odd. Shifting 0.5 px to align with px grid"
                     )
                 xy = 0.5
-            self._object = Manifold.cylinder(
-                height=height,
-                radius_low=bottom,
-                radius_high=top,
-                circular_segments=fn,
-                center=center_z,
-            ).translate((xy, xy, z))
         else:
-            radius = max(bottom, top)
-            self._object = Manifold.cylinder(
+            xy = max(bottom, top)
+        fn = _circular_segments(fn, max(bottom, top))
+        self._object = _cached_primitive(
+            ("cylinder", height, bottom, top, fn, center_z, xy, z),
+            lambda: Manifold.cylinder(
                 height=height,
                 radius_low=bottom,
                 radius_high=top,
                 circular_segments=fn,
                 center=center_z,
-            ).translate((radius, radius, z))
+            ).translate((xy, xy, z)),
+        )
         self._add_bbox_to_keepout(self._object.bounding_box())
 
 
@@ -817,22 +1643,33 @@ class Sphere(Shape):
         if size[2] == 0:
             size = (size[0], size[1], 0.0001)
 
-        if fn is None or fn < 0:
-            self._object = Manifold.sphere(radius=1)
-        else:
-            self._object = Manifold.sphere(radius=1, circular_segments=fn)
-        self.resize(size)
+        if not center:
+            x = size[0] / 2
+            y = size[1] / 2
+            z = size[2] / 2
 
-        if center:
-            self._object = self._object.translate((x, y, z))
-        else:
-            self._object = self._object.translate(
+        fn = _circular_segments(fn, max(size) / 2)
+
+        def build() -> Manifold:
+            if fn is None or fn < 0:
+                sphere = Manifold.sphere(radius=1)
+            else:
+                sphere = Manifold.sphere(radius=1, circular_segments=fn)
+            # Scale the facets' extent (not the radius) to the size, like resize.
+            bounds = sphere.bounding_box()
+            sphere = sphere.scale(
                 (
-                    size[0] / 2,
-                    size[1] / 2,
-                    size[2] / 2,
+                    size[0] / (bounds[3] - bounds[0]),
+                    size[1] / (bounds[4] - bounds[1]),
+                    size[2] / (bounds[5] - bounds[2]),
                 )
             )
+            return sphere.translate((x, y, z))
+
+        self._object = _cached_primitive(
+            ("sphere", tuple(size), fn if fn is not None and fn >= 0 else -1, x, y, z),
+            build,
+        )
         self._add_bbox_to_keepout(self._object.bounding_box())
 
 
@@ -902,43 +1739,58 @@ class RoundedCube(Shape):
             radius[1] = 0.00001
         if radius[2] <= 0:
             radius[2] = 0.00001
-
-        spheres = []
-        for i in range(2):
-            for j in range(2):
-                for k in range(2):
-                    if fn is None or fn < 0:
-                        s = Manifold.sphere(radius=1)
-                    else:
-                        s = Manifold.sphere(radius=1, circular_segments=fn)
-                    s = s.scale(
-                        (
-                            radius[0],
-                            radius[1],
-                            radius[2],
-                        )
-                    )
-                    _x = (size[0] / 2 - radius[0]) if i else -(size[0] / 2 - radius[0])
-                    _y = (size[1] / 2 - radius[1]) if j else -(size[1] / 2 - radius[1])
-                    _z = (size[2] / 2 - radius[2]) if k else -(size[2] / 2 - radius[2])
-                    s = s.translate(
-                        (
-                            (x + _x),
-                            (y + _y),
-                            (z + _z),
+        fn = _circular_segments(fn, max(radius))
+
+        def build() -> Manifold:
+            spheres = []
+            for i in range(2):
+                for j in range(2):
+                    for k in range(2):
+                        if fn is None or fn < 0:
+                            s = Manifold.sphere(radius=1)
+                        else:
+                            s = Manifold.sphere(radius=1, circular_segments=fn)
+                        s = s.scale(
+                            (
+                                radius[0],
+                                radius[1],
+                                radius[2],
+                            )
                         )
-                    )
-                    if not center:
+                        _x = (size[0] / 2 - radius[0]) if i else -(size[0] / 2 - radius[0])
+                        _y = (size[1] / 2 - radius[1]) if j else -(size[1] / 2 - radius[1])
+                        _z = (size[2] / 2 - radius[2]) if k else -(size[2] / 2 - radius[2])
                         s = s.translate(
                             (
-                                size[0] / 2,
-                                size[1] / 2,
-                                size[2] / 2,
+                                (x + _x),
+                                (y + _y),
+                                (z + _z),
                             )
                         )
-                    spheres.append(s)
+                        if not center:
+                            s = s.translate(
+                                (
+                                    size[0] / 2,
+                                    size[1] / 2,
+                                    size[2] / 2,
+                                )
+                            )
+                        spheres.append(s)
+            return Manifold.batch_hull(spheres)
 
-        self._object = Manifold.batch_hull(spheres)
+        self._object = _cached_primitive(
+            (
+                "rounded_cube",
+                tuple(size),
+                tuple(radius),
+                center,
+                fn if fn is not None and fn >= 0 else -1,
+                x,
+                y,
+                z,
+            ),
+            build,
+        )
         self._add_bbox_to_keepout(self._object.bounding_box())
 
 
@@ -969,77 +1821,6 @@ class TextExtrusion(Shape):
         """
         super().__init__()
 
-        def glyph_to_polygons(
-            face: freetype.Face,
-            char: str,
-            scale: float = 1.0,
-            curve_steps: int = 10,
-        ) -> list[np.ndarray]:
-            """
-            Convert a glyph into one or more polygon outlines.
-
-            Parameters:
-
-            - face (freetype.Face): Font face to read glyphs from.
-            - char (str): Character to load.
-            - scale (float): Scale factor to apply to glyph points.
-            - curve_steps (int): Number of steps for curve interpolation.
-
-            Returns:
-
-            - list[np.ndarray]: List of polygon point arrays.
-            """
-            face.load_char(char, freetype.FT_LOAD_NO_BITMAP)
-            outline = face.glyph.outline
-            points = np.array(outline.points, dtype=np.float32) * scale
-            tags = outline.tags
-            contours = outline.contours
-
-            polys = []
-            start = 0
-            for end in contours:
-                pts = points[start : end + 1]
-                tgs = tags[start : end + 1]
-                n = len(pts)
-
-                # Wrap-around: emulate circular indexing
-                pts = list(pts)
-                tgs = list(tgs)
-                pts.append(pts[0])
-                tgs.append(tgs[0])
-
-                path = []
-                i = 0
-                while i < n:
-                    pt1 = pts[i]
-                    tag1 = tgs[i] & 1
-                    if tag1:  # on-curve
-                        path.append(pt1)
-                        i += 1
-                    else:
-                        # pt1 is control point
-                        if tgs[i + 1] & 1:  # next is on-curve
-                            pt2 = pts[i + 1]
-                            p0 = path[-1] if path else (pt1 + pt2) / 2
-                            for t in np.linspace(0, 1, curve_steps):
-                                p = (1 - t) ** 2 * p0 + 2 * (1 - t) * t * pt1 + t**2 * pt2
-                                path.append(p)
-                            i += 2
-                        else:
-                            # next is off-curve → implied on-curve midpoint
-                            mid = (pt1 + pts[i + 1]) / 2
-                            p0 = path[-1] if path else mid
-                            for t in np.linspace(0, 1, curve_steps):
-                                p = (1 - t) ** 2 * p0 + 2 * (1 - t) * t * pt1 + t**2 * mid
-                                path.append(p)
-                            i += 1
-
-                if len(path) >= 3:
-                    polys.append(np.array(path))
-                start = end + 1
-
-            return polys
-
         def text_to_manifold(
             text: str,
             font_path: str = "",
@@ -1062,52 +1843,35 @@ class TextExtrusion(Shape):
 
             - self (Manifold): Combined manifold of all glyphs.
             """
-            face = freetype.Face(font_path)
-            face.set_char_size(font_size * 64)
-
             offset_x = 0
-            result = Manifold()
+            sections = []
 
             for char in text:
                 if char == " ":
                     offset_x += font_size * spacing / 4
                     continue
 
-                polys = glyph_to_polygons(face, char, scale=1.0 / 64.0)
-                if not polys:
+                xsec, advance = _glyph_cross_section(font_path, char, font_size)
+                if xsec is None:
                     continue
 
-                all_loops = []
-                for poly in polys:
-                    loop = list(
-                        reversed(
-                            [
-                                [
-                                    float(p[0] + offset_x),
-                                    float(p[1]),
-                                ]
-                                for p in poly
-                            ]
-                        )
-                    )
-                    all_loops.append(loop)
-
-                # Create cross section with outer + holes
-                xsec = CrossSection(all_loops)
                 if xsec.is_empty():
                     if not quiet:
                         print(f"\t⚠️ Invalid CrossSection for character '{char}'")
                     continue
-
-                extruded = xsec.extrude(height)
-                if extruded.num_vert() == 0:
+                # A glyph without area (or a non-positive height) extrudes to nothing.
+                if height <= 0 or xsec.area() <= 0:
                     if not quiet:
                         print(f"\t⚠️ Extrusion failed for character '{char}'")
                     continue
-                result += extruded
-                offset_x += (face.glyph.advance.x / 64.0) * spacing
 
-            return result
+                sections.append(xsec.translate((offset_x, 0.0)))
+                offset_x += advance * spacing
+
+            if not sections:
+                return Manifold()
+            # Union the glyphs in 2D and extrude the whole string once.
+            return CrossSection.batch_boolean(sections, OpType.Add).extrude(height)
 
         if height == 0:
             height = 0.0001
@@ -1178,6 +1942,46 @@ class ImportModel(Shape):
         if not quiet:
             print(f"\t📦 Loading: {filename} (.{ext[1:]})")
 
+        if not os.path.isfile(filename):
+            # Let trimesh report paths that are not files.
+            return self._convert_file(filename, quiet)
+
+        stat = os.stat(filename)
+        key = (str(Path(filename).resolve()), stat.st_size, stat.st_mtime_ns)
+        manifold = _import_cache.get(key)
+        if manifold is not None:
+            _import_cache.move_to_end(key)
+            return manifold
+
+        def build() -> Manifold:
+            return self._convert_file(filename, quiet)
+
+        if _mesh_cache_dir is None:
+            manifold = build()
+        else:
+            manifold = _cached_mesh(("ImportModel", _file_hash(filename)), build)
+        _import_cache[key] = manifold
+        if len(_import_cache) > _IMPORT_CACHE_SIZE:
+            _import_cache.popitem(last=False)
+        return manifold
+
+    def _convert_file(self, filename: str, quiet: bool = False) -> Manifold:
+        """
+        Parse a 3D file with trimesh, repair it if needed and convert it to a Manifold3D object.
+
+        Parameters:
+
+        - filename (str): Path to the 3D model file.
+        - quiet (bool): If True, suppresses informational output.
+
+        Returns:
+
+        - Manifold: The converted manifold.
+
+        Raises:
+
+        - ValueError: Mesh cannot be repaired or remains non-watertight.
+        """
         mesh = trimesh.load_mesh(filename)
 
         if isinstance(mesh, trimesh.Scene):
@@ -1216,7 +2020,7 @@ class ImportModel(Shape):
                 raise ValueError(
                     "❌ Mesh is still not watertight after repair. Cannot proceed."
                 )
-            self._mesh_to_manifold(mesh, _internal=True)  # Retry conversion after repair
+            return self._mesh_to_manifold(mesh, _internal=True)  # Retry conversion after repair
         return manifold
 
 class TPMS(Shape):
@@ -1374,6 +2178,10 @@ class TPMS(Shape):
         func: Callable[[int, int, int], int] = diamond,
         fill: float = 0.0,
         refinement: int = 10,
+        replicate_cells: bool = False,
+        vectorized: bool = False,
+        implicit: bool = False,
+        workers: int = 1,
         quiet: bool = False,
     ) -> None:
         """
@@ -1386,25 +2194,666 @@ class TPMS(Shape):
         - func (Callable[[float, float, float], float]): Function defining the TPMS shape. Can use gyroid, diamond, schwarz_p, fischer_koch_s, double_diamond, double_gyroid, or a custom function.
         - fill (float): Level set value for the TPMS shape ranges from -1 to 1 (isosurface at 0).
         - refinement (int): Number of subdivisions for the level set grid.
+        - replicate_cells (bool): If True, level set a single unit cell and tile it across cells instead of meshing the whole domain. Requires func to be periodic with period 1 on every axis (true for all built-in functions).
+        - vectorized (bool): If True, evaluate func once over the whole sample grid with array arguments and mesh the samples directly. Falls back to Manifold.level_set if func cannot take arrays.
+        - implicit (bool): If True, slice the shape by evaluating func at pixel centers and only mesh it when the mesh is needed (rendering, booleans). Requires func to take arrays; falls back to meshing immediately otherwise.
+        - workers (int): Number of processes to mesh the level set with. The domain is split into overlapping slabs along its longest axis, which are meshed in parallel, trimmed to exact planes and unioned. Ignored with replicate_cells.
         - quiet (bool): If True, suppresses informational output.
         """
         super().__init__()
 
-        bounds = [
-            0.0,
-            0.0,
-            0.0,
-            1.0 * cells[0],
-            1.0 * cells[1],
-            1.0 * cells[2],
-        ]  # bounding box
-        # bounds = [0.0, 0.0, 0.0, 10.0, 10.0, 10.0]  # bounding box
-        edge_length = 1 / refinement
-        self._object = Manifold.level_set(func, bounds, edge_length, level=fill)
         size = (
             size[0] * cells[0],
             size[1] * cells[1],
             size[2] * cells[2],
         )
+        # Map from lattice coordinates to px/layer space, kept while only affine
+        # transforms are applied so the shape can be sliced from func directly.
+        self._implicit = None
+        self._deferred_mesh = None
+
+        edge_length = 1 / refinement
+        mesh_args = (
+            func, cells, edge_length, fill, replicate_cells, vectorized, quiet, workers
+        )
+        if implicit and self._supports_arrays(func, quiet):
+            self._implicit = (func, fill, tuple(cells), np.identity(4))
+            self._deferred_mesh = mesh_args
+            self._transform_implicit(
+                np.diag([size[0] / cells[0], size[1] / cells[1], size[2] / cells[2], 1.0])
+            )
+            self._add_bbox_to_keepout(self._implicit_bounds())
+            return
+
+        self._object = self._build_mesh(*mesh_args)
         self.resize(size)
         self._add_bbox_to_keepout(self._object.bounding_box())
+
+    @property
+    def _object(self) -> Manifold:
+        """Manifold of the shape, meshing a deferred implicit TPMS first."""
+        self._build_deferred_mesh()
+        return Shape._object.fget(self)
+
+    @_object.setter
+    def _object(self, value: Manifold) -> None:
+        self._deferred_mesh = None
+        Shape._object.fset(self, value)
+
+    def _build_deferred_mesh(self) -> None:
+        """
+        Mesh an implicit TPMS and apply the transforms recorded so far.
+        """
+        if self._deferred_mesh is not None:
+            mesh_args = self._deferred_mesh
+            self._deferred_mesh = None
+            self._manifold = self._build_mesh(*mesh_args).transform(
+                self._implicit[3][:3]
+            )
+
+    def copy(self, _internal: bool = False) -> "TPMS":
+        """
+        Create a copy of the TPMS shape.
+
+        The copy keeps the implicit lattice map and a pending deferred mesh, so an
+        implicit TPMS is not meshed by copying it.
+
+        Parameters:
+
+        - _internal (bool): If True, copy internal properties like name, parent, and color. (internal use only)
+
+        Returns:
+
+        - TPMS: A new TPMS instance with the same properties.
+        """
+        new_shape = type(self).__new__(type(self))
+        Shape.__init__(new_shape)
+        if _internal:
+            new_shape._name = self._name
+            new_shape._parent = self._parent
+            new_shape._color = self._color
+            new_shape._label = self._label
+        new_shape._keepouts = self._keepouts.copy()
+        if self._deferred_mesh is None:
+            new_shape._object = self._object
+        else:
+            new_shape._manifold = self._manifold
+        new_shape._implicit = self._implicit
+        new_shape._deferred_mesh = self._deferred_mesh
+        return new_shape
+
+    @staticmethod
+    def _supports_arrays(func: Callable, quiet: bool = False) -> bool:
+        """
+        Check that a TPMS function can be evaluated on arrays.
+
+        Parameters:
+
+        - func (Callable): TPMS function.
+        - quiet (bool): If True, suppresses informational output.
+
+        Returns:
+
+        - bool: True when func maps arrays to arrays of the same shape.
+        """
+        try:
+            _evaluate_points(func, np.zeros((2, 2)), np.zeros((2, 2)), np.zeros((2, 2)))
+            return True
+        except ValueError as e:
+            if not quiet:
+                print(f"\t⚠️ Implicit TPMS evaluation failed ({e}). Meshing the level set instead")
+            return False
+
+    @staticmethod
+    def _build_mesh(
+        func: Callable[[float, float, float], float],
+        cells: tuple[int, int, int],
+        edge_length: float,
+        fill: float,
+        replicate_cells: bool = False,
+        vectorized: bool = False,
+        quiet: bool = False,
+        workers: int = 1,
+    ) -> Manifold:
+        """
+        Mesh the TPMS lattice in lattice coordinates, spanning (0, 0, 0) to cells.
+
+        Parameters:
+
+        - func (Callable[[float, float, float], float]): TPMS function.
+        - cells (tuple[int, int, int]): Number of unit cells in each dimension.
+        - edge_length (float): Level set grid spacing.
+        - fill (float): Level set value for the TPMS shape.
+        - replicate_cells (bool): If True, tile a single level set unit cell.
+        - vectorized (bool): If True, evaluate func on the whole grid at once.
+        - quiet (bool): If True, suppresses informational output.
+        - workers (int): Number of processes to mesh the level set with.
+
+        Returns:
+
+        - Manifold: The meshed lattice.
+        """
+
+        def build() -> Manifold:
+            if replicate_cells:
+                return TPMS._replicate_cell(
+                    func, cells, edge_length, fill, vectorized, quiet
+                )
+            bounds = [
+                0.0,
+                0.0,
+                0.0,
+                1.0 * cells[0],
+                1.0 * cells[1],
+                1.0 * cells[2],
+            ]  # bounding box
+            if workers > 1:
+                return TPMS._parallel_level_set(
+                    func, bounds, edge_length, fill, workers, vectorized, quiet
+                )
+            return TPMS._level_set(func, bounds, edge_length, fill, vectorized, quiet)
+
+        return _cached_mesh(
+            (
+                "TPMS",
+                _function_hash(func),
+                tuple(cells),
+                fill,
+                edge_length,
+                replicate_cells,
+                vectorized,
+                1 if replicate_cells else workers,
+            ),
+            build,
+        )
+
+    def _transform_implicit(self, matrix: np.ndarray) -> None:
+        """
+        Apply an affine transform to the implicit lattice map.
+
+        Parameters:
+
+        - matrix (np.ndarray): 4x4 transform in px/layer space.
+        """
+        if self._implicit is not None:
+            func, fill, cells, transform = self._implicit
+            self._implicit = (func, fill, cells, matrix @ transform)
+
+    def _implicit_bounds(self) -> tuple[float, float, float, float, float, float]:
+        """
+        Bounding box of the transformed lattice domain.
+
+        Returns:
+
+        - tuple[float, float, float, float, float, float]: Bounding box as (x0, y0, z0, x1, y1, z1).
+        """
+        _, _, cells, transform = self._implicit
+        corners = np.array(
+            [[x, y, z, 1.0] for x in (0, cells[0]) for y in (0, cells[1]) for z in (0, cells[2])]
+        )
+        corners = corners @ transform[:3].T
+        return tuple(corners.min(axis=0).tolist() + corners.max(axis=0).tolist())
+
+    def _slice_mask(
+        self,
+        height: float,
+        origin: tuple[float, float],
+        resolution: tuple[int, int],
+    ) -> np.ndarray:
+        """
+        Sample the shape at the pixel centers of a layer.
+
+        Pixel (row, column) covers x in [origin_x + column, origin_x + column + 1) and
+        y in [origin_y + rows - row - 1, origin_y + rows - row), matching image rows
+        that run from the top of the layer down.
+
+        Parameters:
+
+        - height (float): Height of the layer in px/layer space.
+        - origin (tuple[float, float]): XY position of the image corner in px space.
+        - resolution (tuple[int, int]): Image resolution in pixels.
+
+        Returns:
+
+        - np.ndarray: Boolean mask of the pixels inside the shape, shape (rows, columns).
+        """
+        func, fill, cells, transform = self._implicit
+        columns, rows = resolution
+        mask = np.zeros((rows, columns), dtype=bool)
+        x0, y0, z0, x1, y1, z1 = self._implicit_bounds()
+        if not z0 <= height <= z1:
+            return mask
+
+        # Only evaluate pixels whose centers fall in the bounding box.
+        c0 = max(0, int(np.ceil(x0 - origin[0] - 0.5)))
+        c1 = min(columns, int(np.floor(x1 - origin[0] - 0.5)) + 1)
+        r0 = max(0, int(np.ceil(y0 - origin[1] - 0.5)))
+        r1 = min(rows, int(np.floor(y1 - origin[1] - 0.5)) + 1)
+        if c0 >= c1 or r0 >= r1:
+            return mask
+
+        inverse = np.linalg.inv(transform)
+        xs = origin[0] + np.arange(c0, c1) + 0.5
+        step = max(1, _EVALUATION_CHUNK // (c1 - c0))
+        for start in range(r0, r1, step):
+            stop = min(start + step, r1)
+            ys = origin[1] + np.arange(start, stop) + 0.5
+            x, y = np.meshgrid(xs, ys)
+            u = [
+                inverse[a, 0] * x + inverse[a, 1] * y + (inverse[a, 2] * height + inverse[a, 3])
+                for a in range(3)
+            ]
+            inside = np.ones(x.shape, dtype=bool)
+            for a in range(3):
+                inside &= (u[a] >= 0) & (u[a] <= cells[a])
+            inside &= _evaluate_points(func, *u) > fill
+            # Rows count y upwards here; images count rows down from the top.
+            mask[rows - stop : rows - start, c0:c1] = inside[::-1]
+        return mask
+
+    def translate(self, translation: tuple[int, int, int]) -> "Shape":
+        """
+        Translate the shape by a given translation vector.
+
+        Parameters:
+
+        - translation (tuple[int, int, int]): The translation vector.
+
+        Returns:
+
+        - self (Shape): The translated shape.
+        """
+        matrix = np.identity(4)
+        matrix[:3, 3] = translation
+        self._transform_implicit(matrix)
+        if self._deferred_mesh is not None:
+            self._translate_keepouts(translation)
+            return self
+        return super().translate(translation)
+
+    def rotate(self, rotation: tuple[float, float, float]) -> "Shape":
+        """
+        Rotate the shape by a given rotation vector (in degrees).
+
+        Parameters:
+
+        - rotation (tuple[float, float, float]): The rotation vector in degrees.
+
+        Returns:
+
+        - self (Shape): The rotated shape.
+        """
+        matrix = np.identity(4)
+        matrix[:3, :3] = np.array(
+            [self._rotate_point(axis, rotation) for axis in np.identity(3)]
+        ).T
+        self._transform_implicit(matrix)
+        if self._deferred_mesh is not None:
+            self._rotate_keepouts(rotation)
+            return self
+        return super().rotate(rotation)
+
+    def resize(self, size: tuple[int, int, int]) -> "Shape":
+        """
+        Resize the shape to a given size in px/layer space.
+
+        A shape that has not been meshed yet is resized by its lattice bounds.
+
+        Parameters:
+
+        - size (tuple[int, int, int]): The new size in px/layer space.
+
+        Returns:
+
+        - self (Shape): The resized shape.
+        """
+        if self._deferred_mesh is None:
+            bounds = self._object.bounding_box()
+        else:
+            bounds = self._implicit_bounds()
+        # Clamp zero sizes to a tiny value to avoid division by zero.
+        size = [s if s != 0 else 0.0001 for s in size]
+        scale = [size[a] / (bounds[a + 3] - bounds[a]) for a in range(3)]
+        self._transform_implicit(np.diag(scale + [1.0]))
+        if self._deferred_mesh is not None:
+            self._scale_keepouts(scale)
+            return self
+        return super().resize(size)
+
+    def mirror(self, axis: tuple[bool, bool, bool]) -> "Shape":
+        """
+        Mirror the shape along the specified axes.
+
+        Parameters:
+
+        - axis (tuple[bool, bool, bool]): A tuple indicating which axes to mirror (x, y, z).
+
+        Returns:
+
+        - self (Shape): The mirrored shape.
+        """
+        # Manifold reflects across the plane through the origin normal to axis.
+        normal = np.array(axis, dtype=float)
+        if not normal.any():
+            self._drop_implicit()
+            return super().mirror(axis)
+        normal /= np.linalg.norm(normal)
+        matrix = np.identity(4)
+        matrix[:3, :3] -= 2 * np.outer(normal, normal)
+        self._transform_implicit(matrix)
+        if self._deferred_mesh is not None:
+            self._mirror_keepouts(axis)
+            return self
+        return super().mirror(axis)
+
+    def _transform(self, matrix: np.ndarray) -> "Shape":
+        """
+        Apply an affine transform to the shape in a single step.
+
+        Parameters:
+
+        - matrix (np.ndarray): 4x4 transform.
+
+        Returns:
+
+        - self (Shape): The transformed shape.
+        """
+        self._transform_implicit(matrix)
+        if self._deferred_mesh is not None:
+            self._transform_keepouts(matrix)
+            return self
+        return super()._transform(matrix)
+
+    def _array(self, offsets) -> "Shape":
+        """
+        Replace the shape with copies of itself placed at the given offsets.
+
+        Parameters:
+
+        - offsets: Translation of each copy, shape (N, 3).
+
+        Returns:
+
+        - self (Shape): The shape with all copies.
+        """
+        self._drop_implicit()
+        return super()._array(offsets)
+
+    def __add__(self, other: "Shape") -> "Shape":
+        """
+        Combine two shapes using union operation.
+
+        Parameters:
+
+        - other (Shape): The other shape to combine with.
+
+        Returns:
+
+        - self (Shape): The combined shape.
+        """
+        self._drop_implicit()
+        return super().__add__(other)
+
+    def __sub__(self, other: "Shape") -> "Shape":
+        """
+        Subtract another shape from this shape.
+
+        Parameters:
+
+        - other (Shape): The shape to subtract.
+
+        Returns:
+
+        - self (Shape): The resulting shape after subtraction.
+        """
+        self._drop_implicit()
+        return super().__sub__(other)
+
+    def __and__(self, other: "Shape") -> "Shape":
+        """
+        Intersect this shape with another shape.
+
+        Parameters:
+
+        - other (Shape): The shape to intersect with.
+
+        Returns:
+
+        - self (Shape): The resulting shape after intersection.
+        """
+        self._drop_implicit()
+        return super().__and__(other)
+
+    def hull(self, other: "Shape") -> "Shape":
+        """
+        Create a convex hull of this shape and another shape.
+
+        Parameters:
+
+        - other (Shape): The other shape to combine with.
+
+        Returns:
+
+        - self (Shape): The resulting shape after creating the hull.
+        """
+        self._drop_implicit()
+        return super().hull(other)
+
+    def _drop_implicit(self) -> None:
+        """
+        Mesh the shape and stop slicing it from func, before a boolean changes it.
+        """
+        self._build_deferred_mesh()
+        self._implicit = None
+
+    @staticmethod
+    def _level_set(
+        func: Callable[[float, float, float], float],
+        bounds: list[float],
+        edge_length: float,
+        fill: float,
+        vectorized: bool = False,
+        quiet: bool = False,
+    ) -> Manifold:
+        """
+        Mesh a TPMS level set over the given bounds.
+
+        Parameters:
+
+        - func (Callable[[float, float, float], float]): TPMS function.
+        - bounds (list[float]): Domain as [x0, y0, z0, x1, y1, z1].
+        - edge_length (float): Level set grid spacing.
+        - fill (float): Level set value for the TPMS shape.
+        - vectorized (bool): If True, evaluate func on the whole grid at once.
+        - quiet (bool): If True, suppresses informational output.
+
+        Returns:
+
+        - Manifold: The meshed level set.
+        """
+        if vectorized:
+            try:
+                return _grid_level_set(func, bounds, edge_length, level=fill)
+            except ValueError as e:
+                if not quiet:
+                    print(
+                        f"\t⚠️ Vectorized TPMS evaluation failed ({e}). Falling back to Manifold.level_set"
+                    )
+        return Manifold.level_set(func, bounds, edge_length, level=fill)
+
+    @staticmethod
+    def _level_set_slab(
+        func: Callable[[float, float, float], float],
+        bounds: list[float],
+        trim: list[float],
+        edge_length: float,
+        fill: float,
+        vectorized: bool = False,
+        quiet: bool = False,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Mesh one slab of a level set and trim it to its part of the domain (runs in a worker process).
+
+        Parameters:
+
+        - func (Callable[[float, float, float], float]): TPMS function.
+        - bounds (list[float]): Slab domain including its overlap, as [x0, y0, z0, x1, y1, z1].
+        - trim (list[float]): Box the slab is trimmed to, as [x0, y0, z0, x1, y1, z1].
+        - edge_length (float): Level set grid spacing.
+        - fill (float): Level set value for the TPMS shape.
+        - vectorized (bool): If True, evaluate func on the whole grid at once.
+        - quiet (bool): If True, suppresses informational output.
+
+        Returns:
+
+        - np.ndarray: Vertex positions of the trimmed slab.
+        - np.ndarray: Triangle vertex indices of the trimmed slab.
+        """
+        piece = TPMS._level_set(func, bounds, edge_length, fill, vectorized, quiet)
+        box = Manifold.cube(
+            (trim[3] - trim[0], trim[4] - trim[1], trim[5] - trim[2])
+        ).translate((trim[0], trim[1], trim[2]))
+        piece = Manifold.batch_boolean([piece, box], OpType.Intersect)
+        # Manifolds cannot be pickled, so the mesh is sent back as arrays.
+        mesh = piece.to_mesh()
+        return np.array(mesh.vert_properties), np.array(mesh.tri_verts)
+
+    @staticmethod
+    def _parallel_level_set(
+        func: Callable[[float, float, float], float],
+        bounds: list[float],
+        edge_length: float,
+        fill: float,
+        workers: int,
+        vectorized: bool = False,
+        quiet: bool = False,
+    ) -> Manifold:
+        """
+        Mesh a level set in slabs across a process pool.
+
+        The domain is cut along its longest axis on grid lines. Each slab is meshed
+        two grid cells past its interior cuts, so every slab samples the same points
+        around a cut, then trimmed at the cut so neighbouring slabs meet on exact
+        planes and union into one solid. Outer bounds are not padded, keeping the
+        caps of the unsplit level set.
+
+        Parameters:
+
+        - func (Callable[[float, float, float], float]): TPMS function. Must be picklable.
+        - bounds (list[float]): Domain as [x0, y0, z0, x1, y1, z1].
+        - edge_length (float): Level set grid spacing.
+        - fill (float): Level set value for the TPMS shape.
+        - workers (int): Number of processes.
+        - vectorized (bool): If True, evaluate func on the whole grid at once.
+        - quiet (bool): If True, suppresses informational output.
+
+        Returns:
+
+        - Manifold: The meshed level set.
+        """
+        lo = list(bounds[:3])
+        hi = list(bounds[3:])
+        axis = max(range(3), key=lambda a: hi[a] - lo[a])
+        count = max(1, round((hi[axis] - lo[axis]) / edge_length))
+        slabs = min(workers, count)
+        if slabs < 2:
+            return TPMS._level_set(func, bounds, edge_length, fill, vectorized, quiet)
+
+        # Cut on grid lines, with the spacing adjusted to divide the axis evenly.
+        spacing = (hi[axis] - lo[axis]) / count
+        cuts = [lo[axis] + spacing * (count * i // slabs) for i in range(slabs)] + [hi[axis]]
+        pad = 2 * spacing
+        jobs = []
+        for i in range(slabs):
+            slab = lo + hi
+            trim = [lo[a] - 1.0 for a in range(3)] + [hi[a] + 1.0 for a in range(3)]
+            if i > 0:
+                slab[axis] = cuts[i] - pad
+                trim[axis] = cuts[i]
+            if i < slabs - 1:
+                slab[axis + 3] = cuts[i + 1] + pad
+                trim[axis + 3] = cuts[i + 1]
+            jobs.append((func, slab, trim, spacing, fill, vectorized, quiet))
+
+        # Imported here: importing multiprocessing registers the running script as
+        # __mp_main__, which the slicer would otherwise copy as a dependency.
+        from concurrent.futures import ProcessPoolExecutor
+
+        try:
+            with ProcessPoolExecutor(max_workers=slabs) as pool:
+                pieces = list(pool.map(TPMS._level_set_slab, *zip(*jobs)))
+        except Exception as e:
+            if not quiet:
+                print(
+                    f"\t⚠️ Parallel level set failed ({e}). Meshing in a single process"
+                )
+            return TPMS._level_set(func, bounds, edge_length, fill, vectorized, quiet)
+
+        return Manifold.batch_boolean(
+            [Manifold(Mesh(verts, tris)) for verts, tris in pieces], OpType.Add
+        )
+
+    @staticmethod
+    def _replicate_cell(
+        func: Callable[[float, float, float], float],
+        cells: tuple[int, int, int],
+        edge_length: float,
+        fill: float,
+        vectorized: bool = False,
+        quiet: bool = False,
+    ) -> Manifold:
+        """
+        Build a TPMS lattice by tiling one level-set unit cell.
+
+        The cell is level set slightly past its bounds and trimmed to the unit
+        cube, so opposite faces are cut by exact planes and neighbouring copies
+        meet cleanly. Copies are joined by repeated doubling along each axis,
+        which keeps the number of booleans logarithmic in the cell count.
+
+        Parameters:
+
+        - func (Callable[[float, float, float], float]): Periodic TPMS function.
+        - cells (tuple[int, int, int]): Number of unit cells in each dimension.
+        - edge_length (float): Level set grid spacing.
+        - fill (float): Level set value for the TPMS shape.
+        - vectorized (bool): If True, evaluate func on the whole grid at once.
+        - quiet (bool): If True, suppresses informational output.
+
+        Returns:
+
+        - Manifold: The tiled lattice spanning (0, 0, 0) to cells.
+        """
+        pad = 2 * edge_length
+        cell = TPMS._level_set(
+            func,
+            [-pad, -pad, -pad, 1.0 + pad, 1.0 + pad, 1.0 + pad],
+            edge_length,
+            fill,
+            vectorized,
+            quiet,
+        )
+        cell = Manifold.batch_boolean(
+            [cell, Manifold.cube((1.0, 1.0, 1.0))], OpType.Intersect
+        )
+
+        lattice = cell
+        for axis in range(3):
+            step = [0.0, 0.0, 0.0]
+            count = cells[axis]
+            block = lattice
+            block_cells = 1
+            row = None
+            offset = 0
+            while count:
+                if count & 1:
+                    step[axis] = offset
+                    part = block.translate(step)
+                    row = part if row is None else row + part
+                    offset += block_cells
+                count >>= 1
+                if count:
+                    step[axis] = block_cells
+                    block = block + block.translate(step)
+                    block_cells *= 2
+            lattice = row
+        return lattice
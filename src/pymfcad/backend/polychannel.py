@@ -1,7 +1,10 @@
+import math
 import numpy as np
 from typing import Union
 from scipy.special import comb
+from manifold3d import Manifold, OpType
 from . import Shape, Cube, Sphere, RoundedCube
+from .manifold3d import _keepout_array
 
 
 def _lerp(
@@ -127,7 +130,7 @@ class BezierCurveShape:
     def __init__(
         self,
         control_points: list[tuple[int, int, int]],
-        bezier_segments: int,
+        bezier_segments: int | str,
         shape_type: str | None = None,
         size: tuple[int, int, int] | None = None,
         position: tuple[int, int, int] | None = None,
@@ -137,6 +140,7 @@ class BezierCurveShape:
         corner_radius: float | None = None,
         corner_segments: int | None = None,
         fn: int | None = None,
+        bezier_tolerance: float = 0.25,
         _no_validation: bool = False,
     ) -> None:
         """
@@ -145,7 +149,7 @@ class BezierCurveShape:
         Parameters:
 
         - control_points (list[tuple[int, int, int]]): List of control points defining the Bezier curve.
-        - bezier_segments (int): Number of segments to divide the curve into.
+        - bezier_segments (int | str): Number of segments to divide the curve into, or "auto" to choose it from the curve's shape and bezier_tolerance.
         - shape_type (str | None): Type of shape (e.g., "cube", "sphere", "rounded_cube").
         - size (tuple[int, int, int] | None): Size of shape.
         - position (tuple[int, int, int] | None): Position of the shape in 3D space.
@@ -155,6 +159,7 @@ class BezierCurveShape:
         - corner_radius (float | None): Radius for non-manhattan corners.
         - corner_segments (int | None): Number of segments for non-manhattan corners.
         - fn (int | None): Number of facets for rounded shapes.
+        - bezier_tolerance (float): Maximum distance in pixels between the curve and its segments when bezier_segments is "auto".
         - _no_validation (bool): If True, skip validation (for internal use).
 
         Default behaviors are as follows:
@@ -176,6 +181,7 @@ class BezierCurveShape:
         self._shape_type = shape_type
         self._control_points = control_points
         self._bezier_segments = bezier_segments
+        self._bezier_tolerance = bezier_tolerance
         self._size = size
         self._position = position
         self._rounded_cube_radius = rounded_cube_radius
@@ -215,6 +221,7 @@ class BezierCurveShape:
             and self._corner_segments == other._corner_segments
             and _eq_field(self._control_points, other._control_points)
             and self._bezier_segments == other._bezier_segments
+            and self._bezier_tolerance == other._bezier_tolerance
             and self._fn == other._fn
             and self._no_validation == other._no_validation
         )
@@ -222,67 +229,87 @@ class BezierCurveShape:
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
 
-    def _generate(self, last_shape: PolychannelShape) -> list[PolychannelShape]:
+    def _auto_segments(self, points: np.ndarray) -> int:
         """
-        Generate a list of PolychannelShape objects representing the Bezier curve.
+        Pick a sample count so the polyline stays within the chord tolerance.
+
+        Uses Wang's formula, which bounds the distance between a Bezier curve
+        and its uniformly sampled polyline by the largest second difference of
+        the control points.
 
         Parameters:
 
-        - last_shape (PolychannelShape): The previous shape to interpolate from.
+        - points (np.ndarray): Control points of the full curve, shape (n + 1, 3).
 
         Returns:
 
-        - list[PolychannelShape]: Shapes along the curve.
+        - int: Number of samples along the curve (at least 2).
         """
+        n = len(points) - 1
+        second_diff = points[2:] - 2 * points[1:-1] + points[:-2]
+        max_diff = np.linalg.norm(second_diff, axis=1).max(initial=0.0)
+        segments = math.ceil(
+            math.sqrt(n * (n - 1) * max_diff / (8 * self._bezier_tolerance))
+        )
+        return max(segments, 1) + 1
 
-        def _bezier(
-            t: float, points: list[tuple[int, int, int]]
-        ) -> tuple[float, float, float]:
-            """
-            Calculate a point on the Bezier curve using the Bernstein polynomial.
+    def _generate(self, last_shape: PolychannelShape) -> list[PolychannelShape]:
+        """
+        Generate a list of PolychannelShape objects representing the Bezier curve.
 
-            Parameters:
+        All samples are evaluated at once from the Bernstein basis of the curve.
 
-            - t (float): Parameter value from 0 to 1.
-            - points (list[tuple[int, int, int]]): Control points defining the curve.
+        Parameters:
 
-            Returns:
+        - last_shape (PolychannelShape): The previous shape to interpolate from.
 
-            - tuple[float, float, float]: Point on the curve.
-            """
-            n = len(points) - 1
-            return sum(
-                comb(n, i) * (1 - t) ** (n - i) * t**i * np.array(p)
-                for i, p in enumerate(points)
-            )
+        Returns:
 
+        - list[PolychannelShape]: Shapes along the curve.
+        """
         shape_type = self._shape_type
         if shape_type != last_shape._shape_type:
             shape_type = "rounded_cube"
 
         self._control_points.insert(0, last_shape._position)
         self._control_points.append(self._position)
+        points = np.array(self._control_points, dtype=float)
 
-        ts = np.linspace(0, 1, self._bezier_segments)
-        shapes = []
-        for t in ts:
-            position = tuple(_bezier(t, self._control_points))
-            blended_size = _lerp(last_shape._size, self._size, t)
-            blended_radius = _lerp(
-                last_shape._rounded_cube_radius, self._rounded_cube_radius, t
-            )
-            blended_rotation = _lerp(last_shape._rotation, self._rotation, t)
-
-            _no_validation = True
-            if t == 0 or t == 1:
-                _no_validation = False
+        if self._bezier_segments == "auto":
+            num_samples = self._auto_segments(points)
+        else:
+            num_samples = self._bezier_segments
+        ts = np.linspace(0, 1, num_samples)
+
+        # Bernstein polynomial sum, vectorized over all t.
+        n = len(points) - 1
+        positions = 0
+        for i, p in enumerate(points):
+            positions = positions + (
+                comb(n, i) * (1 - ts) ** (n - i) * ts**i
+            )[:, None] * p
+
+        def _lerp_all(a: tuple[float, float, float], b: tuple[float, float, float]):
+            a = np.array(a, dtype=float)
+            b = np.array(b, dtype=float)
+            return (a * (1 - ts)[:, None] + b * ts[:, None]).tolist()
+
+        blended_sizes = _lerp_all(last_shape._size, self._size)
+        blended_radii = _lerp_all(
+            last_shape._rounded_cube_radius, self._rounded_cube_radius
+        )
+        blended_rotations = _lerp_all(last_shape._rotation, self._rotation)
 
+        shapes = []
+        for k in range(num_samples):
+            # Only the curve endpoints are validated.
+            _no_validation = 0 < k < num_samples - 1
             shape = PolychannelShape(
                 shape_type=shape_type,
-                size=blended_size,
-                rounded_cube_radius=blended_radius,
-                position=position,
-                rotation=blended_rotation,
+                size=tuple(blended_sizes[k]),
+                rounded_cube_radius=tuple(blended_radii[k]),
+                position=tuple(positions[k]),
+                rotation=tuple(blended_rotations[k]),
                 absolute_position=True,
                 fn=self._fn,
                 _no_validation=_no_validation,
@@ -356,26 +383,40 @@ class Polychannel(Shape):
             s.translate(shape._position)
             shape_list.append(s)
 
-        # Hull shapes pairwise to form a continuous channel.
+        # Hull shapes pairwise to form a continuous channel, then union all
+        # segments with a single batch boolean.
         if len(shape_list) > 1:
+            segments = []
+            keepouts = []
             if show_only_shapes:
-                path = shape_list[0]
-                for shape in shape_list[1:]:
-                    path += shape
+                for shape in shape_list:
+                    segments.append(shape._object)
+                    keepouts.append(shape._keepouts)
             else:
-                if tuple(shapes[1]._position) == tuple(shapes[0]._position):
-                    path = shape_list[0] + shape_list[1]
-                else:
-                    path = shape_list[0].hull(shape_list[1])
-                last_shape = shape_list[1]
-                for i, shape in enumerate(shape_list[2:]):
-                    if tuple(shapes[i + 2]._position) == tuple(shapes[i + 1]._position):
-                        path += shape
+                for i in range(1, len(shape_list)):
+                    last_shape = shape_list[i - 1]
+                    shape = shape_list[i]
+                    if tuple(shapes[i]._position) == tuple(shapes[i - 1]._position):
+                        # Coincident shapes are unioned without a hull.
+                        if i == 1:
+                            segments.append(last_shape._object)
+                            keepouts.append(last_shape._keepouts)
+                        segments.append(shape._object)
+                        keepouts.append(shape._keepouts)
                     else:
-                        path += last_shape.hull(shape)
-                    last_shape = shape
-            self._object = path._object
-            self._keepouts = path._keepouts
+                        segments.append(
+                            Manifold.batch_hull([last_shape._object, shape._object])
+                        )
+                        keepouts.append(last_shape._keepouts)
+                        keepouts.append(shape._keepouts)
+                        keepouts.append(
+                            Shape._hull_bridge_keepout(
+                                last_shape._object.bounding_box(),
+                                shape._object.bounding_box(),
+                            )
+                        )
+            self._object = Manifold.batch_boolean(segments, OpType.Add)
+            self._keepouts = _keepout_array(keepouts)
         else:
             raise ValueError("Polychannel requires at least 2 shapes")
 
@@ -478,7 +519,10 @@ class Polychannel(Shape):
                         tuple(np.array(p) + np.array(shapes[i - 1]._position))
                         for p in shape._control_points
                     ]
-                if shape._bezier_segments is None or shape._bezier_segments < 2:
+                if shape._bezier_segments == "auto":
+                    if shape._bezier_tolerance <= 0:
+                        raise ValueError("Bezier curve tolerance must be positive")
+                elif shape._bezier_segments is None or shape._bezier_segments < 2:
                     raise ValueError("Bezier curve requires at least 2 segments")
 
             shape._absolute_position = True
@@ -1,10 +1,61 @@
 import time
 import numpy as np
 from pathlib import Path
+from contextlib import nullcontext
 from PIL import Image, ImageDraw
 from shapely.geometry import Polygon
 
-from . import Cube, Shape
+from . import Cube, Shape, TPMS
+
+# Maximum distance in px (x, y) and layers (z) that slice_component may move a
+# surface by when simplifying composite shapes, or None to slice them as built.
+_slice_tolerance = None
+
+
+def set_slice_tolerance(tolerance: float | None) -> None:
+    """
+    Simplify composite shapes before slicing them.
+
+    Fine Bézier hulls, imported models and high fn primitives carry far more
+    triangles than the printer can resolve, and slicing time grows with the
+    triangle count. When a tolerance is set, slice_component collapses edges and
+    merges nearly coplanar faces of each composite shape and regional mask before
+    slicing it, moving no surface further than the tolerance. Shapes are modelled
+    in px and layers, so the tolerance applies in px laterally and in layers
+    vertically. Values below 0.5 only change pixels along the edges of a slice.
+
+    Parameters:
+
+    - tolerance (float | None): Maximum surface deviation in px and layers, or None to slice shapes as built.
+
+    Raises:
+
+    - ValueError: The tolerance is not positive.
+    """
+    global _slice_tolerance
+    if tolerance is not None and tolerance <= 0:
+        raise ValueError("Slice tolerance must be positive.")
+    _slice_tolerance = tolerance
+
+
+def _simplify(shape: "Shape | None") -> "Shape | None":
+    """
+    Simplify a shape within the tolerance set by set_slice_tolerance.
+
+    Parameters:
+
+    - shape (Shape | None): Shape to simplify.
+
+    Returns:
+
+    - The simplified copy of the shape, or the shape itself when no tolerance is set.
+    """
+    if _slice_tolerance is None or shape is None:
+        return shape
+    simplified = shape.copy(_internal=True)
+    simplified._object = shape._object.simplify(_slice_tolerance)
+    return simplified
+
 
 def rle_encode_packed(img: np.ndarray):
     h, w = img.shape
@@ -51,12 +102,166 @@ def _is_clockwise(polygon: np.ndarray) -> bool:
     return np.sum((x[1:] - x[:-1]) * (y[1:] + y[:-1])) > 0
 
 
+def iter_layers(device: "Device"):
+    """
+    Iterate over the layers of a device in slicing order.
+
+    Parameters:
+
+    - device (Device): Device to be sliced.
+
+    Returns:
+
+    - Generator of (slice_num, actual_slice_position, slice_position, next_slice_position) tuples.
+      actual_slice_position is the sampling height in device layers, slice_position and
+      next_slice_position are the bottom and top of the layer in mm.
+    """
+    from .. import VariableLayerThicknessComponent
+
+    if isinstance(device, VariableLayerThicknessComponent):
+        expanded_layer_sizes = device._expand_layer_sizes()
+
+    slice_num = 0
+    slice_position = 0
+    actual_slice_position = 0.5
+    device_height = device.get_size()[2]
+    while actual_slice_position < device_height:
+        if isinstance(device, VariableLayerThicknessComponent):
+            # If the device has variable layer thickness, use the per-layer values.
+            next_slice_position = slice_position + expanded_layer_sizes[slice_num]
+            if slice_num < len(expanded_layer_sizes) - 1:
+                next_actual_slice_position = actual_slice_position + (
+                    expanded_layer_sizes[slice_num] / device._layer_size / 2
+                    + expanded_layer_sizes[slice_num + 1] / device._layer_size / 2
+                )
+            else:
+                # If this is the last slice, just use the layer size.
+                next_actual_slice_position = actual_slice_position + (
+                    expanded_layer_sizes[slice_num] / device._layer_size
+                )
+        else:
+            next_slice_position = slice_position + device._layer_size
+            next_actual_slice_position = actual_slice_position + 1.0
+
+        yield slice_num, actual_slice_position, slice_position, next_slice_position
+
+        slice_position = next_slice_position
+        actual_slice_position = next_actual_slice_position
+        slice_num += 1
+
+
+def rasterize_layer(
+    device: "Device",
+    composite_shape: "Shape | None",
+    slice_height: float,
+    resolution: tuple[int, int],
+    implicit: dict | None = None,
+) -> tuple[Image.Image, int]:
+    """
+    Rasterize the cross-section of a shape at a given height into a device image.
+
+    Parameters:
+
+    - device (Device): Device that defines the image origin.
+    - composite_shape (Shape | None): Shape to be sliced. None when every bulk shape is implicit.
+    - slice_height (float): Height of the cross-section in device layers.
+    - resolution (tuple[int, int]): Image resolution in pixels.
+    - implicit (dict | None): Implicit TPMS shapes collected by build_composite_shape, sampled at pixel centers and combined with the image.
+
+    Returns:
+
+    - Tuple of the grayscale image and the number of polygons in the cross-section.
+    """
+    img, polygon_count = _rasterize_mesh(device, composite_shape, slice_height, resolution)
+    if implicit is None or not (implicit["bulk"] or implicit["voids"]):
+        return img, polygon_count
+
+    origin = device.get_position()[:2]
+    raster = np.array(img) > 0
+    if implicit["bulk"]:
+        # Implicit bulk shapes still lose the meshed voids.
+        covered = np.zeros_like(raster)
+        for shape in implicit["bulk"]:
+            covered |= shape._slice_mask(slice_height, origin, resolution)
+        if implicit["void_shape"] is not None:
+            voids, _ = _rasterize_mesh(
+                device, implicit["void_shape"], slice_height, resolution
+            )
+            covered &= np.array(voids) == 0
+        raster |= covered
+    for shape in implicit["voids"]:
+        raster &= ~shape._slice_mask(slice_height, origin, resolution)
+    return Image.fromarray(raster.astype(np.uint8) * 255), polygon_count
+
+
+def _rasterize_mesh(
+    device: "Device",
+    composite_shape: "Shape | None",
+    slice_height: float,
+    resolution: tuple[int, int],
+) -> tuple[Image.Image, int]:
+    """
+    Rasterize the cross-section of a meshed shape at a given height into a device image.
+
+    Parameters:
+
+    - device (Device): Device that defines the image origin.
+    - composite_shape (Shape | None): Shape to be sliced. None gives an empty image.
+    - slice_height (float): Height of the cross-section in device layers.
+    - resolution (tuple[int, int]): Image resolution in pixels.
+
+    Returns:
+
+    - Tuple of the grayscale image and the number of polygons in the cross-section.
+    """
+    polygons = []
+    if composite_shape is not None:
+        polygons = composite_shape._object.slice(slice_height).to_polygons()
+    polygon_count = len(polygons)
+
+    # Translate polygons into device-local pixel space (XY only).
+    polygons = [poly - np.array(device.get_position()[:2]) for poly in polygons]
+
+    # Create a blank grayscale image.
+    img = Image.new("L", resolution, 0)
+    draw = ImageDraw.Draw(img)
+
+    for poly in polygons:
+        # Snap to the pixel grid.
+        transformed = np.round(poly).astype(int)
+        transformed[:, 1] = img.height - transformed[:, 1]
+        points = [tuple(p) for p in transformed]
+
+        # Determine fill color based on orientation.
+        if _is_clockwise(transformed):
+            fill_color = 255  # solid
+        else:
+            fill_color = 0  # hole
+
+        # Convert polygon and offset inward slightly to avoid edge artifacts.
+        p = Polygon(points)
+        px_offset = 0.1
+        shrunk = p.buffer(-px_offset)
+        # Only process if still valid.
+        if not shrunk.is_empty and shrunk.geom_type == "Polygon":
+            coords = np.array(shrunk.exterior.coords)
+            # Floor to fix polygon inclusivity issues.
+            transformed = np.floor(coords).astype(int)
+            points = [tuple(p) for p in transformed]
+
+        draw.polygon(points, fill=fill_color)
+
+    return img, polygon_count
+
+
 def _slice(
     _type: str,
     device: "Device",
     composite_shape: "Shape",
     directory: Path,
     slice_list: list[dict],
+    layer_window: tuple[float, float] | None = None,
+    implicit: dict | None = None,
 ) -> None:
     """
     Slice the device and save slices in the directory.
@@ -68,107 +273,184 @@ def _slice(
     - composite_shape (Shape): Composite shape of the device to be sliced.
     - directory (Path): Directory to save the slices.
     - slice_list (list[dict]): List of dictionaries to store slice info.
+    - layer_window (tuple[float, float] | None): Optional (bottom, top) range in mm relative to the device. Only layers overlapping this range are sliced.
+    - implicit (dict | None): Implicit TPMS shapes collected by build_composite_shape.
     """
 
     # Slice manifold at layer height and resolution.
-    from .. import VariableLayerThicknessComponent
-
     resolution = (int(device.get_size()[0]), int(device.get_size()[1]))
 
-    if isinstance(device, VariableLayerThicknessComponent):
-        expanded_layer_sizes = device._expand_layer_sizes()
-
     # Slice at layer size.
-    slice_num = 0
-    slice_position = 0
-    actual_slice_position = 0.5
-    device_height = device.get_size()[2]
     if _type != "":
         _type = " " + _type
     print(f"\tSlicing {type(device).__name__}{_type}...")
-    while actual_slice_position < device_height:
+    for slice_num, actual_slice_position, slice_position, next_slice_position in iter_layers(device):
+        if layer_window is not None and (
+            next_slice_position <= layer_window[0] or slice_position >= layer_window[1]
+        ):
+            continue
         slice_height = device.get_position()[2] + actual_slice_position
-        polygons = composite_shape._object.slice(slice_height).to_polygons()
+        img, polygon_count = rasterize_layer(
+            device, composite_shape, slice_height, resolution, implicit
+        )
         print(
-            f"\r\t\tLayer {slice_num} at z={actual_slice_position:.4f}/{slice_position:.4f}/{slice_height:.4f} ({len(polygons)} polygons)",
+            f"\r\t\tLayer {slice_num} at z={actual_slice_position:.4f}/{slice_position:.4f}/{slice_height:.4f} ({polygon_count} polygons)",
             end="",
             flush=True,
         )
 
-        # Translate polygons into device-local pixel space (XY only).
-        polygons = [poly - np.array(device.get_position()[:2]) for poly in polygons]
-
-        # Create a blank grayscale image.
-        img = Image.new("L", resolution, 0)
-        draw = ImageDraw.Draw(img)
-
-        for poly in polygons:
-            # Snap to the pixel grid.
-            transformed = np.round(poly).astype(int)
-            transformed[:, 1] = img.height - transformed[:, 1]
-            points = [tuple(p) for p in transformed]
-
-            # Determine fill color based on orientation.
-            if _is_clockwise(transformed):
-                fill_color = 255  # solid
-            else:
-                fill_color = 0  # hole
-
-            # Convert polygon and offset inward slightly to avoid edge artifacts.
-            p = Polygon(points)
-            px_offset = 0.1
-            shrunk = p.buffer(-px_offset)
-            # Only process if still valid.
-            if not shrunk.is_empty and shrunk.geom_type == "Polygon":
-                coords = np.array(shrunk.exterior.coords)
-                # Floor to fix polygon inclusivity issues.
-                transformed = np.floor(coords).astype(int)
-                points = [tuple(p) for p in transformed]
-
-            draw.polygon(points, fill=fill_color)
-
         # Save the slice image.
         if directory is not None:
             img.save(
                 f"{directory}/{device.get_fully_qualified_name()}-slice{slice_num:04}.png"
             )
 
-        if isinstance(device, VariableLayerThicknessComponent):
-            # If the device has variable layer thickness, use the per-layer values.
-            slice_position += expanded_layer_sizes[slice_num]
-            if slice_num < len(expanded_layer_sizes) - 1:
-                actual_slice_position += (
-                    expanded_layer_sizes[slice_num] / device._layer_size / 2
-                    + expanded_layer_sizes[slice_num + 1] / device._layer_size / 2
-                )
-            else:
-                # If this is the last slice, just use the layer size.
-                actual_slice_position += (
-                    expanded_layer_sizes[slice_num] / device._layer_size
-                )
-        else:
-            slice_position += device._layer_size
-            actual_slice_position += 1.0
-
-
         slice_list.append(
             {
                 "image_name": f"{device.get_fully_qualified_name()}-slice{slice_num:04}.png",
                 "image_data": rle_encode_packed(np.array(img)),
-                "layer_position": round(slice_position * 1000, 1),
+                "layer_position": round(next_slice_position * 1000, 1),
+                "layer_index": slice_num,
             }
         )
 
-        slice_num += 1
-
     print()
 
 
+def _is_implicit(shape: "Shape") -> bool:
+    """
+    Check if a shape can be sliced from its implicit function instead of its mesh.
+
+    Parameters:
+
+    - shape (Shape): Shape to check.
+
+    Returns:
+
+    - bool: True for TPMS shapes created with implicit=True that have only been transformed.
+    """
+    return isinstance(shape, TPMS) and shape._implicit is not None
+
+
+def build_composite_shape(device: "Device", implicit: dict | None = None) -> "Shape | None":
+    """
+    Build the shape to be sliced for a device: its bulk shapes minus its voids
+    and the bounding boxes of subcomponents that request it.
+
+    When an implicit dictionary is given, implicit TPMS shapes are left out of the
+    mesh booleans and collected in it instead, so they are never meshed for slicing:
+    "bulk" and "voids" list the TPMS shapes and "void_shape" is the union of the
+    meshed voids, which still has to be cut out of the implicit bulk shapes.
+
+    Parameters:
+
+    - device (Device): Device to build the composite shape for.
+    - implicit (dict | None): Optional dictionary to collect implicit TPMS shapes in.
+
+    Returns:
+
+    - Composite shape of the device, or None when every bulk shape is implicit.
+
+    Raises:
+
+    - RuntimeError: Tried to slice component without bulk shape.
+    """
+    # Collect this component's bulk shapes.
+    if len(list(device.bulk_shapes.values())) == 0:
+        raise RuntimeError("Tried to slice component without bulk shape")
+    bulk_shapes = list(device.bulk_shapes.values())
+    shapes = list(device.shapes.values())
+    if implicit is not None:
+        implicit["bulk"] = [s for s in bulk_shapes if _is_implicit(s)]
+        implicit["voids"] = [s for s in shapes if _is_implicit(s)]
+        implicit["void_shape"] = None
+        bulk_shapes = [s for s in bulk_shapes if not _is_implicit(s)]
+        shapes = [s for s in shapes if not _is_implicit(s)]
+
+    # Accumulate subcomponent bounding boxes.
+    bbox_cubes = []
+    for sub in device.subcomponents.values():
+        if sub._subtract_bounding_box:
+            bbox = sub.get_bounding_box(device._px_size, device._layer_size)
+            bbox_cube = Cube(
+                size=(
+                    (bbox[3] - bbox[0]) - device._px_size * 0.1,
+                    (bbox[4] - bbox[1]) - device._px_size * 0.1,
+                    (bbox[5] - bbox[2]) - device._layer_size * 0.1,
+                ),
+                center=False,
+            ).translate(
+                (
+                    bbox[0] + device._px_size * 0.05,
+                    bbox[1] + device._px_size * 0.05,
+                    bbox[2] + device._layer_size * 0.05,
+                )
+            )
+            bbox_cubes.append(bbox_cube)
+
+    # Accumulate this component's shapes (e.g., voids or cutouts) and bbox cubes.
+    local_shapes = shapes + bbox_cubes
+    if len(local_shapes) > 0 and implicit is not None and implicit["bulk"]:
+        implicit["void_shape"] = Shape._batch_boolean_add(local_shapes)
+        local_shapes = [implicit["void_shape"]]
+
+    if len(bulk_shapes) == 0:
+        if len(local_shapes) > 0 and (implicit is None or not implicit["bulk"]):
+            raise RuntimeError("Tried to subtract without bulk")
+        return None
+
+    # Subtract this component's shapes (e.g., voids or cutouts), skipping those
+    # that do not overlap the bulk.
+    return Shape._batch_boolean_add_then_subtract(bulk_shapes, local_shapes)
+
+
+def compute_layer_windows(
+    device: "Device", bottom_mm: float, top_mm: float
+) -> dict[int, tuple[float, float]]:
+    """
+    Convert a z range of the root device into the local layer window of every
+    component that slice_component will slice.
+
+    Equal components are only sliced once, so their window covers the range
+    for every instance.
+
+    Parameters:
+
+    - device (Device): Root device.
+    - bottom_mm (float): Bottom of the range in mm above the root device.
+    - top_mm (float): Top of the range in mm above the root device.
+
+    Returns:
+
+    - Dictionary mapping the id of each sliced component to its (bottom, top) window in mm.
+    """
+    root_z_mm = device.get_position()[2] * device._layer_size
+    devices = []
+    windows = {}
+
+    def _walk(component):
+        z_mm = component.get_position()[2] * component._layer_size - root_z_mm
+        if component in devices:
+            first = devices[devices.index(component)]
+            lo, hi = windows[id(first)]
+            windows[id(first)] = (min(lo, bottom_mm - z_mm), max(hi, top_mm - z_mm))
+            return
+        devices.append(component)
+        windows[id(component)] = (bottom_mm - z_mm, top_mm - z_mm)
+        for sub in component.subcomponents.values():
+            _walk(sub)
+
+    _walk(device)
+    return windows
+
+
 def slice_component(
     device: "Device",
     temp_directory: Path | None,
     sliced_devices: list["Device"],
     sliced_devices_data: list[dict],
+    profile: "SlicerProfile | None" = None,
+    layer_windows: dict[int, tuple[float, float]] | None = None,
 ) -> None:
     """
     Slice the device's components and save them in the temporary directory.
@@ -179,6 +461,8 @@ def slice_component(
     - temp_directory (Path): Path to the temporary directory where slices will be saved. If none, slices are not saved to disk.
     - sliced_devices (list[Device]): List to store sliced devices.
     - sliced_devices_data (list[dict]): List of dictionaries to store slice info.
+    - profile (SlicerProfile | None): Optional profile to record the time spent slicing each device.
+    - layer_windows (dict[int, tuple[float, float]] | None): Optional local layer windows from compute_layer_windows. If given, only the layers inside each component's window are sliced.
 
     Raises:
 
@@ -227,59 +511,45 @@ def slice_component(
         device_subdirectory = temp_directory / device.get_fully_qualified_name()
         device_subdirectory.mkdir(parents=True)
 
-    # Start by unioning this component's bulk shapes.
+    def _stage(name):
+        if profile is None:
+            return nullcontext({"count": 0})
+        return profile.stage(name, device.get_fully_qualified_name(), accumulate=True)
+
     if len(list(device.bulk_shapes.values())) == 0:
         raise RuntimeError("Tried to slice component without bulk shape")
-    composite_shape = Shape._batch_boolean_add(list(device.bulk_shapes.values()))
-    
 
-    # Accumulate subcomponent bounding boxes and recursively process subcomponents.
-    bbox_cubes = []
-    for sub in device.subcomponents.values():
-        if sub._subtract_bounding_box:
-            bbox = sub.get_bounding_box(device._px_size, device._layer_size)
-            bbox_cube = Cube(
-                size=(
-                    (bbox[3] - bbox[0]) - device._px_size * 0.1,
-                    (bbox[4] - bbox[1]) - device._px_size * 0.1,
-                    (bbox[5] - bbox[2]) - device._layer_size * 0.1,
-                ),
-                center=False,
-            ).translate(
-                (
-                    bbox[0] + device._px_size * 0.05,
-                    bbox[1] + device._px_size * 0.05,
-                    bbox[2] + device._layer_size * 0.05,
-                )
-            )
-            bbox_cubes.append(bbox_cube)
+    layer_window = None
+    if layer_windows is not None:
+        layer_window = layer_windows.get(id(device))
 
+    # Recursively process subcomponents.
+    for sub in device.subcomponents.values():
         slice_component(
             sub,
             temp_directory,
             sliced_devices,
             sliced_devices_data,
+            profile,
+            layer_windows,
         )
 
-    # Accumulate this component's shapes (e.g., voids or cutouts) and bbox cubes.
-    if len(list(device.shapes.values()) + bbox_cubes) > 0:
-        local_shapes = Shape._batch_boolean_add(list(device.shapes.values()) + bbox_cubes)
-    
+    with _stage("slice_component") as stage:
+        implicit = {}
+        composite_shape = _simplify(build_composite_shape(device, implicit))
+        implicit["void_shape"] = _simplify(implicit["void_shape"])
 
-        # Subtract this component's shapes (e.g., voids or cutouts).
-        if local_shapes is not None and composite_shape is None:
-            raise RuntimeError("Tried to subtract without bulk")
-        elif local_shapes is not None:
-            composite_shape = composite_shape - local_shapes
-
-    # Slice the device.
-    _slice(
-        "",
-        device,
-        composite_shape,
-        device_subdirectory,
-        sliced_devices_data[device_index]["slices"],
-    )
+        # Slice the device.
+        _slice(
+            "",
+            device,
+            composite_shape,
+            device_subdirectory,
+            sliced_devices_data[device_index]["slices"],
+            layer_window,
+            implicit,
+        )
+        stage["count"] = len(sliced_devices_data[device_index]["slices"])
 
     # Slice the device's masks.
     for key, (mask, settings) in device.regional_settings.items():
@@ -294,10 +564,13 @@ def slice_component(
 
         sliced_devices_data[device_index]["masks"][key] = []
 
-        _slice(
-            f"{key} masks",
-            device,
-            mask,
-            masks_subdirectory,
-            sliced_devices_data[device_index]["masks"][key],
-        )
+        with _stage("slice_masks") as stage:
+            _slice(
+                f"{key} masks",
+                device,
+                _simplify(mask),
+                masks_subdirectory,
+                sliced_devices_data[device_index]["masks"][key],
+                layer_window,
+            )
+            stage["count"] += len(sliced_devices_data[device_index]["masks"][key])
@@ -10,6 +10,8 @@ from typing import Union
 from functools import reduce
 from fractions import Fraction
 
+import numpy as np
+
 from .backend import (
     Shape,
     Color,
@@ -319,6 +321,82 @@ class Port(_InstantiationTrackerMixin):
             return Color.from_name("w", 255)  # White
 
 
+def _translation_matrix(translation: tuple[float, float, float]) -> np.ndarray:
+    """Return the 4x4 matrix translating by (dx, dy, dz)."""
+    matrix = np.identity(4)
+    matrix[:3, 3] = translation
+    return matrix
+
+
+def _rotation_matrix(rotation: int) -> np.ndarray:
+    """
+    Return the 4x4 matrix rotating around the Z axis by a multiple of 90 degrees.
+
+    The entries are exactly 0 and +-1, so composed transforms stay exact.
+    """
+    cos, sin = {0: (1, 0), 90: (0, 1), 180: (-1, 0), 270: (0, -1)}[rotation % 360]
+    matrix = np.identity(4)
+    matrix[:2, :2] = [[cos, -sin], [sin, cos]]
+    return matrix
+
+
+def _mirror_matrix(mirror_x: bool, mirror_y: bool) -> np.ndarray:
+    """Return the 4x4 matrix negating X and/or Y."""
+    return np.diag([-1.0 if mirror_x else 1.0, -1.0 if mirror_y else 1.0, 1.0, 1.0])
+
+
+# Component attributes that Component.copy rebuilds itself instead of copying
+# with _copy_value.
+_COPY_REBUILT_ATTRIBUTES = {
+    "_parent",
+    "_shape_transform",
+    "_shapes",
+    "_bulk_shapes",
+    "_regional_settings",
+    "ports",
+    "connected_ports",
+    "subcomponents",
+    "default_exposure_settings",
+    "default_position_settings",
+    "labels",
+}
+
+
+def _copy_value(value, copies: dict):
+    """
+    Copy an attribute value for Component.copy.
+
+    Objects that were already copied (the component, its shapes, ports and
+    subcomponents) are replaced by their copies. Containers are copied item by
+    item, and shapes, settings and numpy arrays are copied. Everything else
+    (numbers, strings, paths, manifolds, functions, ports and other components)
+    is shared with the original.
+
+    Parameters:
+
+    - value: Value to copy.
+    - copies (dict): Copies by id of the original object.
+
+    Returns:
+
+    - The copied value.
+    """
+    if id(value) in copies:
+        return copies[id(value)]
+    if type(value) is dict:
+        return {key: _copy_value(item, copies) for key, item in value.items()}
+    if type(value) in (list, tuple, set):
+        return type(value)(_copy_value(item, copies) for item in value)
+    if isinstance(value, Shape):
+        return value.copy(_internal=True)
+    if isinstance(
+        value,
+        (ExposureSettings, PositionSettings, MembraneSettings, SecondaryDoseSettings, np.ndarray),
+    ):
+        return value.copy()
+    return value
+
+
 class Component(_InstantiationTrackerMixin):
     """
     Base class for components in a microfluidic device.
@@ -362,6 +440,9 @@ class Component(_InstantiationTrackerMixin):
         self._translations = [0, 0, 0]
         self._rotation = 0
         self._mirroring = [False, False]
+        # Transform (4x4, in this component's px/layer space) not yet applied to its
+        # shapes; applied once when the shapes are accessed.
+        self._shape_transform = None
         self.shapes = {}
         self.bulk_shapes = {}
         self.ports = {}
@@ -386,6 +467,64 @@ class Component(_InstantiationTrackerMixin):
         for subcomponent in self.subcomponents.values():
             subcomponent._lock_recursive()
 
+    @property
+    def shapes(self) -> dict[str, Shape]:
+        """Void shapes of the component, placed by any pending transform."""
+        self._flush_shape_transform()
+        return self._shapes
+
+    @shapes.setter
+    def shapes(self, value: dict[str, Shape]):
+        self._shapes = value
+
+    @property
+    def bulk_shapes(self) -> dict[str, Shape]:
+        """Bulk shapes of the component, placed by any pending transform."""
+        self._flush_shape_transform()
+        return self._bulk_shapes
+
+    @bulk_shapes.setter
+    def bulk_shapes(self, value: dict[str, Shape]):
+        self._bulk_shapes = value
+
+    @property
+    def regional_settings(self) -> dict[str, tuple]:
+        """Regional settings shapes of the component, placed by any pending transform."""
+        self._flush_shape_transform()
+        return self._regional_settings
+
+    @regional_settings.setter
+    def regional_settings(self, value: dict[str, tuple]):
+        self._regional_settings = value
+
+    def _compose_shape_transform(self, matrix: np.ndarray):
+        # """
+        # Record a transform for the component's own shapes without touching them.
+        #
+        # Parameters:
+        #
+        # - matrix (np.ndarray): 4x4 transform applied after any pending one.
+        # """
+        if self._shape_transform is None:
+            self._shape_transform = matrix
+        else:
+            self._shape_transform = matrix @ self._shape_transform
+
+    def _flush_shape_transform(self):
+        # """
+        # Apply the pending transform to the component's own shapes in one step.
+        # """
+        matrix = self._shape_transform
+        if matrix is None:
+            return
+        self._shape_transform = None
+        for shape in self._shapes.values():
+            shape._transform(matrix)
+        for shape in self._bulk_shapes.values():
+            shape._transform(matrix)
+        for shape, _ in self._regional_settings.values():
+            shape._transform(matrix)
+
     def __eq__(self, other):
         # """
         # Check if two components are equivilant based on their attribute.
@@ -435,80 +574,105 @@ class Component(_InstantiationTrackerMixin):
         """
         Create a copy of the component.
 
+        The copy is made without running __init__ again, so no shapes are rebuilt.
+        Shapes share their manifolds with the original; shapes, ports, settings and
+        containers are duplicated so either component can be changed afterwards.
+        The instantiation path (and so the cache directory) is taken from where the
+        copy is made, as for a new component.
+
         Returns:
         - Component: A new instance of the component with the same attributes.
         """
         if self._parent is not None:
             raise ValueError("Cannot copy component that has already been added to a parent component.")
         self._ensure_unlocked("copy component")
-        
-        # create new instance of the same class
-        kwargs = self.init_kwargs if hasattr(self, 'init_kwargs') else {}
-
-        # if is Component class, it won't have init_kwargs, so we can just pass the attributes directly
-        kwargs.update({
-            "size": self._size,
-            "position": self._position,
-            "px_size": self._px_size,
-            "layer_size": self._layer_size,
-            "hide_in_render": self.hide_in_render,
-            "quiet": self.quiet,
-        })
-
-        try:
-            init_sig = inspect.signature(type(self).__init__)
-            allowed_params = {
-                name
-                for name, param in init_sig.parameters.items()
-                if name != "self"
-                and param.kind
-                in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
-            }
-            filtered_kwargs = {k: v for k, v in kwargs.items() if k in allowed_params}
-        except (ValueError, TypeError):
-            filtered_kwargs = kwargs
-        comp_copy = type(self)(
-            **filtered_kwargs,
-        )
+        comp_copy = self._copy_structure(None)
+        _InstantiationTrackerMixin.__init__(comp_copy)
+        return comp_copy
 
-        comp_copy._parent = None
-        comp_copy._name = None
-        comp_copy._subtract_bounding_box = None
-        
-        comp_copy._translations = self._translations.copy()
-        comp_copy._rotation = self._rotation
-        comp_copy._mirroring = self._mirroring.copy()
-        comp_copy.burnin_settings = self.burnin_settings.copy()
-
-        # deep copies of dict attributes
-        for key, color in self.labels.items():
-            comp_copy.labels[key] = Color(*color._to_rgba())
-        comp_copy.shapes = {}
-        for key, shape in self.shapes.items():
-            comp_copy.shapes[key] = shape.copy()
-            comp_copy.shapes[key]._color = comp_copy.labels.get(key, shape._color)
-        comp_copy.bulk_shapes = {}
-        for key, shape in self.bulk_shapes.items():
-            comp_copy.bulk_shapes[key] = shape.copy()
-            comp_copy.bulk_shapes[key]._color = comp_copy.labels.get(key, shape._color)
+    def _copy_structure(self, parent: Component | None) -> Component:
+        # """
+        # Copy the component without calling __init__.
+        #
+        # A copy without parent is unplaced like a new component: it has no name and
+        # no labels, and its shapes are unnamed. Subcomponents are copied as they are
+        # placed in the parent copy.
+        #
+        # Parameters:
+        #
+        # - parent (Component | None): Parent of the copy.
+        #
+        # Returns:
+        #
+        # - Component: The copy.
+        # """
+        self._flush_shape_transform()
+
+        comp_copy = type(self).__new__(type(self))
+        comp_copy.__dict__.update(self.__dict__)
+        comp_copy._parent = parent
+        comp_copy._shape_transform = None
+        labels = {key: Color(*color._to_rgba()) for key, color in self.labels.items()}
+
+        def copy_shape(key: str, shape: Shape) -> Shape:
+            if parent is None:
+                new_shape = shape.copy()
+                new_shape._color = labels.get(key, shape._color)
+            else:
+                new_shape = shape.copy(_internal=True)
+                new_shape._parent = comp_copy
+                new_shape._color = labels.get(shape._label, shape._color)
+            new_shape._sync = comp_copy._flush_shape_transform
+            return new_shape
+
+        comp_copy.shapes = {key: copy_shape(key, shape) for key, shape in self._shapes.items()}
+        comp_copy.bulk_shapes = {
+            key: copy_shape(key, shape) for key, shape in self._bulk_shapes.items()
+        }
         comp_copy.ports = {}
         for key, port in self.ports.items():
             comp_copy.ports[key] = port.copy()
+            if parent is not None:
+                comp_copy.ports[key]._parent = comp_copy
         comp_copy.connected_ports = []
         for port in self.connected_ports:
             comp_copy.connected_ports.append(comp_copy.ports[port._name])
         comp_copy.subcomponents = {}
         for key, subcomp in self.subcomponents.items():
-            comp_copy.subcomponents[key] = subcomp.copy()
+            comp_copy.subcomponents[key] = subcomp._copy_structure(comp_copy)
         comp_copy.default_exposure_settings = None if self.default_exposure_settings is None else self.default_exposure_settings.copy()
         comp_copy.default_position_settings = None if self.default_position_settings is None else self.default_position_settings.copy()
         comp_copy.regional_settings = {}
-        for key, (shape, settings) in self.regional_settings.items():
-            new_shape = shape.copy()
-            new_shape._color = comp_copy.labels.get(key, shape._color) 
-            comp_copy.regional_settings[key] = (new_shape, settings.copy())
-        comp_copy.labels = {}
-        
+        for key, (shape, settings) in self._regional_settings.items():
+            comp_copy.regional_settings[key] = (
+                copy_shape(key, shape),
+                None if settings is None else settings.copy(),
+            )
+
+        # Copy the remaining attributes (including those set by subclasses), pointing
+        # them at the copied shapes, ports and subcomponents.
+        copies = {id(self): comp_copy}
+        for originals, copied in (
+            (self._shapes, comp_copy._shapes),
+            (self._bulk_shapes, comp_copy._bulk_shapes),
+            (self.ports, comp_copy.ports),
+            (self.subcomponents, comp_copy.subcomponents),
+        ):
+            for key, value in originals.items():
+                copies[id(value)] = copied[key]
+        for key, (shape, _) in self._regional_settings.items():
+            copies[id(shape)] = comp_copy._regional_settings[key][0]
+        for key, value in self.__dict__.items():
+            if key not in _COPY_REBUILT_ATTRIBUTES:
+                comp_copy.__dict__[key] = _copy_value(value, copies)
+
+        if parent is None:
+            comp_copy._name = None
+            comp_copy._subtract_bounding_box = None
+            comp_copy._locked = False
+            comp_copy.labels = {}
+        else:
+            comp_copy.labels = labels
 
         return comp_copy
 
@@ -740,8 +904,27 @@ class Component(_InstantiationTrackerMixin):
         shape._parent = self
         shape._color = self.labels[label]
         shape._label = label
+        shape._sync = self._flush_shape_transform
         self.shapes[name] = shape
 
+    def add_void_array(self, name: str, shape: Shape, offsets, label: str):
+        """
+        Add copies of a shape to the component as a single void.
+
+        Pillar arrays, filter posts and similar repeated features are added as one
+        shape with one block of keepouts instead of one void per copy. See
+        Shape.linear_array and Shape.grid_array for regular patterns.
+
+        Parameters:
+
+        - name (str): The name of the void (must be a unique python identifier).
+        - shape (Shape): The shape to be copied.
+        - offsets: Translation of each copy as a list of (x, y, z) tuples.
+        - label (str): The label for the void, which should be a key in the component's labels dictionary.
+        """
+        self._ensure_unlocked("add void array")
+        self.add_void(name, shape._array(offsets), label)
+
     def add_bulk(self, name: str, shape: Shape, label: str):
         """
         Add a bulk shape to the component.
@@ -763,6 +946,7 @@ class Component(_InstantiationTrackerMixin):
         shape._parent = self
         shape._color = self.labels[label]
         shape._label = label
+        shape._sync = self._flush_shape_transform
         self.bulk_shapes[name] = shape
 
     def add_port(self, name: str, port: Port):
@@ -835,11 +1019,12 @@ class Component(_InstantiationTrackerMixin):
             for label in list(comp.labels.keys()):
                 new_label = f"{prefix}.{label}"
                 comp.labels[new_label] = comp.labels.pop(label)
-            for shape in comp.shapes.values():
+            # Use the raw dicts so pending transforms are not applied yet.
+            for shape in comp._shapes.values():
                 shape._label = f"{prefix}.{shape._label}"
-            for shape in comp.bulk_shapes.values():
+            for shape in comp._bulk_shapes.values():
                 shape._label = f"{prefix}.{shape._label}"
-            for shape, _ in comp.regional_settings.values():
+            for shape, _ in comp._regional_settings.values():
                 shape._label = f"{prefix}.{shape._label}"
             for subcomp in comp.subcomponents.values():
                 update_labels(subcomp, prefix, comp.labels)
@@ -944,6 +1129,7 @@ class Component(_InstantiationTrackerMixin):
         shape._parent = self
         shape._color = self.labels[label]
         shape._label = label
+        shape._sync = self._flush_shape_transform
 
         # check for collisions with other settings
         if settings is not None:
@@ -1146,12 +1332,7 @@ class Component(_InstantiationTrackerMixin):
                 )
             for component in self.subcomponents.values():
                 component.translate(translation, _internal=True, _bypass_lock=True)
-            for shape in self.shapes.values():
-                shape.translate(translation)
-            for bulk_shape in self.bulk_shapes.values():
-                bulk_shape.translate(translation)
-            for shape, _ in self.regional_settings.values():
-                shape.translate(translation)
+            self._compose_shape_transform(_translation_matrix(translation))
             for port in self.ports.values():
                 port._position = (
                     port._position[0] + translation[0],
@@ -1176,12 +1357,7 @@ class Component(_InstantiationTrackerMixin):
 
         for component in self.subcomponents.values():
             component.translate(translation, _bypass_lock=True)
-        for shape in self.shapes.values():
-            shape.translate(translation)
-        for bulk_shape in self.bulk_shapes.values():
-            bulk_shape.translate(translation)
-        for shape, _ in self.regional_settings.values():
-            shape.translate(translation)
+        self._compose_shape_transform(_translation_matrix(translation))
         for port in self.ports.values():
             port._position = (
                 port._position[0] + translation[0],
@@ -1233,14 +1409,7 @@ class Component(_InstantiationTrackerMixin):
         for component in self.subcomponents.values():
             component.rotate(rotation, _bypass_lock=True)
 
-        for shape in self.shapes.values():
-            shape.rotate((0, 0, rotation))
-
-        for bulk_shape in self.bulk_shapes.values():
-            bulk_shape.rotate((0, 0, rotation))
-
-        for shape, _ in self.regional_settings.values():
-            shape.rotate((0, 0, rotation))
+        self._compose_shape_transform(_rotation_matrix(rotation))
 
         rot = rotation % 360
 
@@ -1412,14 +1581,7 @@ class Component(_InstantiationTrackerMixin):
         for component in self.subcomponents.values():
             component.mirror(mirror_x, mirror_y, _bypass_lock=True)
 
-        for shape in self.shapes.values():
-            shape.mirror((mirror_x, mirror_y, False))
-
-        for bulk_shape in self.bulk_shapes.values():
-            bulk_shape.mirror((mirror_x, mirror_y, False))
-
-        for shape, _ in self.regional_settings.values():
-            shape.mirror((mirror_x, mirror_y, False))
+        self._compose_shape_transform(_mirror_matrix(mirror_x, mirror_y))
 
         # Surface normal flips
         mirror_vector_map = {
@@ -10,7 +10,7 @@ from typing import Union
 from copy import deepcopy
 
 from .. import Polychannel, PolychannelShape, BezierCurveShape
-from ..backend.manifold3d import _is_integer
+from ..backend.manifold3d import _is_integer, _coalesce_keepouts
 
 
 class _AutorouterNode:
@@ -148,9 +148,9 @@ class Router:
                     self.routed_keepouts[key] = (cnt, ko)
                     cnt += 1
 
-        # add shape keepout
+        # add shape keepout, merging overlapping boxes to keep the index small
         for i, (shape_name, shape) in enumerate(self._component.shapes.items()):
-            for j, keepout in enumerate(shape._keepouts):
+            for j, keepout in enumerate(_coalesce_keepouts(shape._keepouts)):
                 key = f"{i}_{j}"
                 if shape_name is not None:
                     key = f"{shape_name}_{j}"
@@ -718,7 +718,7 @@ class Router:
 
         # check autoroute keepouts
         violation = False
-        if polychannel._keepouts:
+        if len(polychannel._keepouts) > 0:
             margin = (-1, -1, -1)
             boxes = [
                 self._add_margin(tuple(float(x) for x in keepout), margin)
@@ -808,7 +808,8 @@ class Router:
         - None
         """
 
-        for j, keepout in enumerate(polychannel._keepouts):
+        # hull chains overlap heavily, merging them leaves the covered region unchanged
+        for j, keepout in enumerate(_coalesce_keepouts(polychannel._keepouts)):
             ko_key = f"{name}_{j}"
             ko = self._add_margin(tuple(float(x) for x in keepout), self._channel_margin)
             ko = tuple(round(x) for x in ko)
@@ -13,6 +13,7 @@ from .settings import (
     PrintOnFilm,
 )
 from .slicer import Slicer
+from .profiling import SlicerProfile
 from .image_generation import (
     generate_membrane_images_from_folders,
     generate_secondary_images_from_folders,
@@ -1,3 +1,5 @@
+import json
+
 json_order = [
     "Header",
     "Design",
@@ -68,6 +70,9 @@ json_order = [
     "Special image techniques",
 ]
 
+# Position of each key in json_order, used to sort keys without list lookups.
+_json_rank = {key: rank for rank, key in enumerate(json_order)}
+
 
 def pretty_json(input):
     """Prettify JSON dictionary or list by ordering keys according to json_order."""
@@ -87,3 +92,120 @@ def pretty_json(input):
         return new_list
     else:
         return input
+
+
+def _key_string(key) -> str:
+    """Convert a dictionary key to a JSON object key the same way json.dump does."""
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, (int, float)):
+        return json.dumps(key)
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {type(key).__name__}"
+    )
+
+
+_encode_string = json.encoder.encode_basestring_ascii
+
+
+def _scalar_json(value) -> str:
+    """Encode a JSON scalar the same way json.dump does."""
+    if isinstance(value, str):
+        return _encode_string(value)
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float) and value == value and value not in (
+        float("inf"),
+        float("-inf"),
+    ):
+        return float.__repr__(value)
+    return json.dumps(value)
+
+
+def _write_pretty_json(input, chunks, indent, newlines, level, ordered, flush):
+    """
+    Append the JSON text of input to chunks, ordering dictionary keys according to json_order.
+
+    Only plain dicts and lists are reordered (like pretty_json), other containers
+    are written in their own order. newlines caches the newline and indentation
+    of each level. flush is called after every list item so finished text can
+    be written out.
+    """
+    if isinstance(input, dict):
+        if not input:
+            chunks.append("{}")
+            return
+        keys = list(input.keys())
+        ordered = ordered and type(input) is dict
+        if ordered:
+            keys.sort(key=lambda key: _json_rank.get(key, len(json_order)))
+        if len(newlines) <= level + 1:
+            newlines.append(newlines[-1] + indent)
+        separator = "{" + newlines[level + 1]
+        for key in keys:
+            chunks.append(separator + _encode_string(_key_string(key)) + ": ")
+            value = input[key]
+            if isinstance(value, (dict, list, tuple)):
+                _write_pretty_json(value, chunks, indent, newlines, level + 1, ordered, flush)
+            else:
+                chunks.append(_scalar_json(value))
+            separator = "," + newlines[level + 1]
+        chunks.append(newlines[level] + "}")
+    elif isinstance(input, (list, tuple)):
+        if not input:
+            chunks.append("[]")
+            return
+        ordered = ordered and type(input) is list
+        if len(newlines) <= level + 1:
+            newlines.append(newlines[-1] + indent)
+        separator = "[" + newlines[level + 1]
+        for item in input:
+            chunks.append(separator)
+            if isinstance(item, (dict, list, tuple)):
+                _write_pretty_json(item, chunks, indent, newlines, level + 1, ordered, flush)
+            else:
+                chunks.append(_scalar_json(item))
+            separator = "," + newlines[level + 1]
+            flush()
+        chunks.append(newlines[level] + "]")
+    else:
+        chunks.append(_scalar_json(input))
+
+
+def write_pretty_json(input, fileOut, indent: int = 2):
+    """
+    Write a JSON dictionary or list to a file, ordering keys according to json_order.
+
+    The output is identical to ``json.dump(pretty_json(input), fileOut, indent=indent)``
+    but is streamed to the file as it is generated, so no reordered copy of the
+    input is built and the input is left unchanged.
+
+    Parameters:
+
+    - input (dict | list): JSON data to write.
+    - fileOut (TextIO): Text stream to write to (e.g. an open file).
+    - indent (int): Number of spaces per indentation level.
+    """
+    chunks = []
+    # Newline plus indentation for each nesting level, extended as needed.
+    newlines = ["\n"]
+
+    def flush():
+        if len(chunks) >= 4096:
+            fileOut.write("".join(chunks))
+            chunks.clear()
+
+    _write_pretty_json(input, chunks, " " * indent, newlines, 0, True, flush)
+    fileOut.write("".join(chunks))
@@ -0,0 +1,188 @@
+import os
+import sys
+import json
+import time
+from pathlib import Path
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+
+def _peak_rss_mb() -> float | None:
+    """
+    Return the peak resident set size of this process in MB.
+
+    Returns:
+
+    - Peak RSS in MB, or None if it cannot be measured on this platform.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere.
+    if sys.platform == "darwin":
+        peak /= 1024
+    return round(peak / 1024, 3)
+
+
+def _current_rss_mb() -> float | None:
+    """
+    Return the current resident set size of this process in MB.
+
+    Returns:
+
+    - Current RSS in MB, or None if it cannot be measured on this platform.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return round(resident_pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024, 3)
+
+
+class SlicerProfile:
+    """
+    Record wall time, CPU time, peak memory and item counts for each stage of a slicing run.
+
+    Each stage is recorded as a dictionary with the keys ``stage``, ``device``,
+    ``wall_time_s``, ``cpu_time_s``, ``peak_rss_mb``, ``rss_growth_mb``, ``count`` and ``calls``.
+    ``peak_rss_mb`` is the process high-water mark when the stage finished and
+    ``rss_growth_mb`` is how much that high-water mark grew while the stage ran.
+    """
+
+    def __init__(self):
+        self.stages = []
+        self._accumulated = {}
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.process_time()
+        self._end_wall = None
+        self._end_cpu = None
+
+    @contextmanager
+    def stage(self, name: str, device: str | None = None, accumulate: bool = False):
+        """
+        Time a stage of the slicing run.
+
+        The yielded dictionary is the stage record; set its ``count`` entry to
+        the number of items (layers, images, files...) processed by the stage.
+
+        Parameters:
+
+        - name (str): Name of the stage (e.g. "slice_component").
+        - device (str | None): Fully qualified name of the device the stage ran for.
+        - accumulate (bool): If True, repeated calls with the same name and device are summed into one record.
+
+        Returns:
+
+        - Context manager yielding the stage record.
+        """
+        key = (name, device)
+        if accumulate and key in self._accumulated:
+            record = self._accumulated[key]
+        else:
+            record = {
+                "stage": name,
+                "device": device,
+                "wall_time_s": 0.0,
+                "cpu_time_s": 0.0,
+                "peak_rss_mb": None,
+                "rss_growth_mb": 0.0,
+                "count": 0,
+                "calls": 0,
+            }
+            self.stages.append(record)
+            if accumulate:
+                self._accumulated[key] = record
+
+        count = record["count"]
+        record["count"] = 0
+        rss_before = _peak_rss_mb()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield record
+        finally:
+            record["wall_time_s"] += time.perf_counter() - wall
+            record["cpu_time_s"] += time.process_time() - cpu
+            record["count"] += count
+            record["calls"] += 1
+            rss_after = _peak_rss_mb()
+            if rss_after is not None:
+                record["peak_rss_mb"] = rss_after
+                record["rss_growth_mb"] += rss_after - rss_before
+
+    def finish(self):
+        """Mark the end of the slicing run."""
+        self._end_wall = time.perf_counter()
+        self._end_cpu = time.process_time()
+
+    def totals_by_stage(self) -> dict:
+        """
+        Sum the stage records by stage name.
+
+        Returns:
+
+        - Dictionary mapping stage names to summed wall time, CPU time, counts and the largest peak RSS.
+        """
+        totals = {}
+        for record in self.stages:
+            total = totals.setdefault(
+                record["stage"],
+                {"wall_time_s": 0.0, "cpu_time_s": 0.0, "peak_rss_mb": None, "count": 0},
+            )
+            total["wall_time_s"] += record["wall_time_s"]
+            total["cpu_time_s"] += record["cpu_time_s"]
+            total["count"] += record["count"]
+            if record["peak_rss_mb"] is not None:
+                total["peak_rss_mb"] = max(total["peak_rss_mb"] or 0.0, record["peak_rss_mb"])
+        return totals
+
+    def totals_by_device(self) -> dict:
+        """
+        Sum the wall time of the stage records by device.
+
+        Returns:
+
+        - Dictionary mapping device names to a dictionary of stage names and wall times.
+        """
+        totals = {}
+        for record in self.stages:
+            if record["device"] is None:
+                continue
+            device = totals.setdefault(record["device"], {})
+            device[record["stage"]] = device.get(record["stage"], 0.0) + record["wall_time_s"]
+        return totals
+
+    def to_dict(self) -> dict:
+        """
+        Convert the profile to a JSON serializable dictionary.
+
+        Returns:
+
+        - Dictionary with the run totals, the per stage and per device totals, and the individual stage records.
+        """
+        end_wall = self._end_wall if self._end_wall is not None else time.perf_counter()
+        end_cpu = self._end_cpu if self._end_cpu is not None else time.process_time()
+        return {
+            "wall_time_s": end_wall - self._start_wall,
+            "cpu_time_s": end_cpu - self._start_cpu,
+            "peak_rss_mb": _peak_rss_mb(),
+            "totals_by_stage": self.totals_by_stage(),
+            "totals_by_device": self.totals_by_device(),
+            "stages": self.stages,
+        }
+
+    def save(self, filename: str | Path):
+        """
+        Save the profile as a JSON file.
+
+        Parameters:
+
+        - filename (str | Path): Path of the JSON file to write.
+        """
+        with open(filename, "w") as fileOut:
+            json.dump(self.to_dict(), fileOut, indent=2)
@@ -1,10 +1,13 @@
+import io
 import re
 import os
 import cv2
 import sys
-import json
 import copy
+import math
+import time
 import shutil
+import tempfile
 import numpy as np
 from PIL import Image
 import importlib.util
@@ -13,9 +16,18 @@ from typing import Union
 from types import ModuleType
 from datetime import datetime
 
-from ..backend import slice_component, rle_encode_packed, rle_decode_packed
+from ..backend import (
+    slice_component,
+    iter_layers,
+    rasterize_layer,
+    build_composite_shape,
+    compute_layer_windows,
+    rle_encode_packed,
+    rle_decode_packed,
+)
 from .uniqueimagestore import get_unique_path, load_image_from_file, UniqueImageStore
-from .json_prettier import pretty_json
+from .json_prettier import write_pretty_json
+from .profiling import SlicerProfile, _current_rss_mb
 
 from .settings import (
             MembraneSettings,
@@ -56,6 +68,8 @@ class Slicer:
         self.filename = filename
         self.minimize_file = minimize_file
         self.zip_output = zip_output
+        # Profile of the most recent make_print_file run.
+        self.last_profile = None
 
     def _check_output_exists(self, output_path: str) -> bool:
         """
@@ -380,8 +394,9 @@ class Slicer:
             )
 
             # Generate burn-in exposure settings
-            if i < len(device.burnin_settings):
-                burnin_ms = device.burnin_settings[i]
+            layer_index = slice.get("layer_index", i)
+            if layer_index < len(device.burnin_settings):
+                burnin_ms = device.burnin_settings[layer_index]
                 resin = self.settings.resin
                 denom = resin.bulk_exposure - resin.exposure_offset
                 if denom == 0:
@@ -944,66 +959,48 @@ class Slicer:
 
         return output_images, output_exposures
 
-    def make_print_file(self, save_temp_files=False) -> bool:
+    def _generate_device_images(
+        self, sliced_devices, sliced_devices_data, temp_directory, save_temp_files, profile
+    ):
         """
-        Generate a print file based on the provided device and settings.
-        This function will create a temporary directory, slice the device's components,
-        generate secondary and membrane images, create a JSON file with the print data,
-        and create a print job zip or directory.
+        Fill the default settings of the sliced devices and generate their
+        membrane, secondary dose, exposure and position images.
 
         Parameters:
 
-        - save_temp_files (bool): If True, the temporary files will be saved for debugging purposes.
+        - sliced_devices (list[Device]): Devices returned by slice_component.
+        - sliced_devices_data (list[dict]): Slice data returned by slice_component.
+        - temp_directory (Path): Temporary directory of the slicing run.
+        - save_temp_files (bool): If True, intermediate images are written to the temporary directory.
+        - profile (SlicerProfile): Profile recording the time spent in each stage.
         """
-        error = None
-        try:
+        for device, info in zip(sliced_devices, sliced_devices_data):
+            device_name = device.get_fully_qualified_name()
+            print(f"\t{device_name}")
 
-            # # Check if output already exists
-            # if self._check_output_exists(self.filename):
-            #     print(
-            #         f"Output already exists at {self.filename}. Please select a different path."
-            #     )
-            #     return False
-
-            # Create a temporary directory for processing
-            temp_directory = self._generate_temp_directory()
-
-            # Copy code to the temporary directory
-            print("Copying script and dependencies...")
-            main_file_path = self._copy_script_and_dependencies(temp_directory)
-
-            # Slice the device components
-            sliced_devices = []
-            sliced_devices_data = []
-            print("Slicing...")
-            slice_dir = temp_directory if save_temp_files else None
-            slice_component(
-                self.device, slice_dir, sliced_devices, sliced_devices_data
-            )
-
-            print("Make secondary images...")
-            for device, info in zip(sliced_devices, sliced_devices_data):
-                print(f"\t{device.get_fully_qualified_name()}")
-
-                # Fill default settings for sliced devices
+            # Fill default settings for sliced devices
+            with profile.stage("fill_default_settings", device_name) as stage:
                 self._fill_device_default_settings(device, info)
+                stage["count"] = len(info["slices"])
 
-                # Generate secondary, membrane, and regional images
-                device_subdirectory = temp_directory / device.get_fully_qualified_name()
+            # Generate secondary, membrane, and regional images
+            device_subdirectory = temp_directory / device.get_fully_qualified_name()
 
-                device_index = sliced_devices.index(device)
-                for name, (_, settings) in device.regional_settings.items():
-                    if settings is None:
-                        continue
-                    masks_subdirectory = (
-                        temp_directory / "masks" / device.get_fully_qualified_name() / name
-                    )
+            device_index = sliced_devices.index(device)
+            for name, (_, settings) in device.regional_settings.items():
+                if settings is None:
+                    continue
+                masks_subdirectory = (
+                    temp_directory / "masks" / device.get_fully_qualified_name() / name
+                )
 
-                    if isinstance(settings, MembraneSettings):
-                        settings.exposure_settings.fill_with_defaults(
-                            device.default_exposure_settings,
-                            exceptions=["bulk_exposure_multiplier"],
-                        )
+                if isinstance(settings, MembraneSettings):
+                    settings.exposure_settings.fill_with_defaults(
+                        device.default_exposure_settings,
+                        exceptions=["bulk_exposure_multiplier"],
+                    )
+                    with profile.stage("membrane_images", device_name, accumulate=True) as stage:
+                        image_count = len(info.get("membrane_slices", []))
                         generate_membrane_images_from_folders(
                             data=sliced_devices_data[device_index],
                             image_dir=device_subdirectory,
@@ -1011,16 +1008,19 @@ class Slicer:
                             membrane_settings=settings,
                             save_temp_files=save_temp_files,
                         )
+                        stage["count"] += len(info.get("membrane_slices", [])) - image_count
 
-                    if isinstance(settings, SecondaryDoseSettings):
-                        settings.edge_exposure_settings.fill_with_defaults(
-                            device.default_exposure_settings,
-                            exceptions=["bulk_exposure_multiplier"],
-                        )
-                        settings.roof_exposure_settings.fill_with_defaults(
-                            device.default_exposure_settings,
-                            exceptions=["bulk_exposure_multiplier"],
-                        )
+                if isinstance(settings, SecondaryDoseSettings):
+                    settings.edge_exposure_settings.fill_with_defaults(
+                        device.default_exposure_settings,
+                        exceptions=["bulk_exposure_multiplier"],
+                    )
+                    settings.roof_exposure_settings.fill_with_defaults(
+                        device.default_exposure_settings,
+                        exceptions=["bulk_exposure_multiplier"],
+                    )
+                    with profile.stage("secondary_images", device_name, accumulate=True) as stage:
+                        image_count = len(info.get("secondary_slices", []))
                         generate_secondary_images_from_folders(
                             data=sliced_devices_data[device_index],
                             image_dir=device_subdirectory,
@@ -1029,11 +1029,14 @@ class Slicer:
                             resin=self.settings.resin,
                             save_temp_files=save_temp_files,
                         )
+                        stage["count"] += len(info.get("secondary_slices", [])) - image_count
 
-                    if isinstance(settings, ExposureSettings):
-                        settings.fill_with_defaults(
-                            device.default_exposure_settings,
-                        )
+                if isinstance(settings, ExposureSettings):
+                    settings.fill_with_defaults(
+                        device.default_exposure_settings,
+                    )
+                    with profile.stage("exposure_images", device_name, accumulate=True) as stage:
+                        image_count = len(info.get("exposure_slices", []))
                         generate_exposure_images_from_folders(
                             data=sliced_devices_data[device_index],
                             image_dir=device_subdirectory,
@@ -1041,16 +1044,478 @@ class Slicer:
                             settings=settings,
                             save_temp_files=save_temp_files,
                         )
+                        stage["count"] += len(info.get("exposure_slices", [])) - image_count
 
-                    if isinstance(settings, PositionSettings):
-                        settings.fill_with_defaults(
-                            device.default_position_settings,
-                        )
+                if isinstance(settings, PositionSettings):
+                    settings.fill_with_defaults(
+                        device.default_position_settings,
+                    )
+                    with profile.stage("position_images", device_name, accumulate=True) as stage:
                         generate_position_images_from_folders(
                             data=sliced_devices_data[device_index],
                             mask_key=name,
                             settings=settings,
                         )
+                        stage["count"] += len(info["slices"])
+
+    def _combine_slices_by_layer(self, embedded_devices, temp_directory, profile):
+        """
+        Group the slices of every layer by settings and combine their exposures.
+
+        Parameters:
+
+        - embedded_devices (list[tuple[Device, dict]]): Devices returned by _embed_component_slices.
+        - temp_directory (Path): Temporary directory of the slicing run.
+        - profile (SlicerProfile): Profile recording the time spent combining exposures.
+
+        Returns:
+
+        - List of (layer_position, [(group, images, exposure_times), ...]) tuples.
+        """
+        with profile.stage("combine_exposures") as stage:
+            combined_slices = []
+            for layer, slices in self._iterate_slices_by_layer(embedded_devices):
+                print(
+                    f"\r\tProcessing layer at {layer:.1f} um... ",
+                    end="",
+                    flush=True,
+                )
+                grouped_slices = self._group_images_by_settings(slices)
+                combined_slices_groups = []
+                for group in grouped_slices:
+                    group_exposures = [
+                        slice_info["exposure_settings"].get_exposure_time(
+                            self.settings.resin
+                        )
+                        for slice_info in group
+                    ]
+                    group_images = []
+                    for slice_info in group:
+                        if slice_info.get("parent") is not None:
+                            group_images.append(
+                                {
+                                    "device": slice_info["device"],
+                                    "parent": slice_info["parent"],
+                                    "image_data": slice_info["image_data"],
+                                    "image_name": slice_info["image_name"],
+                                    "position": slice_info["position"],
+                                }
+                            )
+                        else:
+                            image = rle_decode_packed(*slice_info["image_data"])
+                            group_images.append(image)
+
+                    # combine exposures
+                    output_imgs, output_times = self._combine_exposures(
+                        group_images, group_exposures, temp_directory
+                    )
+                    combined_slices_groups.append((group, output_imgs, output_times))
+                combined_slices.append((layer, combined_slices_groups))
+            stage["count"] = len(combined_slices)
+        print()
+        return combined_slices
+
+    def estimate(self, sample_layers: int = 5) -> dict:
+        """
+        Estimate the size and cost of a print file without slicing every layer.
+
+        The component tree is walked the same way as make_print_file to count the
+        layers of every device (including variable layer thickness expansion, stitched
+        tiles and repeated component instances). A few layers of each device are then
+        sliced to estimate image content, output size, memory and slicing time.
+
+        Parameters:
+
+        - sample_layers (int): Number of layers to slice per device for the estimate.
+
+        Returns:
+
+        - Dictionary with the keys:
+            - layers: number of print layers.
+            - images: number of slice images generated before exposures are combined.
+            - unique_images: estimated number of distinct images written to the print file.
+            - output_size_bytes: estimated size of the print file.
+            - peak_memory_bytes: estimated peak memory of the slicing run. This is the memory
+              the process uses when estimate is called (the design and its meshes) plus the
+              run-length encoded slices and combined frames held during the run. The first
+              part is left out on platforms without /proc/self/statm.
+            - slicing_time_s: estimated time of a full make_print_file run.
+            - estimate_time_s: time spent producing this estimate.
+            - devices: per device dictionaries with the name, layers, tiles, instances and images.
+        """
+        from .. import Device, StitchedDevice
+
+        start = time.perf_counter()
+        baseline_mb = _current_rss_mb() or 0.0
+
+        # Walk the component tree like slice_component, merging equal components.
+        devices = []
+        instances = []
+
+        def _walk(device):
+            if device in devices:
+                instances[devices.index(device)].append(device)
+                return
+            devices.append(device)
+            instances.append([device])
+            for sub in device.subcomponents.values():
+                _walk(sub)
+
+        _walk(self.device)
+        root_z_mm = self.device.get_position()[2] * self.device._layer_size
+
+        layer_positions = set()
+        device_estimates = []
+        total_images = 0
+        total_unique_images = 0
+        total_rle_bytes = 0
+        png_bytes = []
+        png_times = []
+        decode_times = []
+        slicing_time = 0.0
+        frame_bytes = 0
+        for device, device_instances in zip(devices, instances):
+            layers = list(iter_layers(device))
+            resolution = (int(device.get_size()[0]), int(device.get_size()[1]))
+            tiles = 1
+            tile_resolution = resolution
+            if isinstance(device, StitchedDevice):
+                tiles = device.tiles_x * device.tiles_y
+                tile_resolution = tuple(device.base_px_count)
+
+            for instance in device_instances:
+                z_offset_mm = instance.get_position()[2] * instance._layer_size - root_z_mm
+                for _, _, _, next_slice_position in layers:
+                    layer_positions.add(round((z_offset_mm + next_slice_position) * 1000, 1))
+
+            t = time.perf_counter()
+            implicit = {}
+            composite_shape = build_composite_shape(device, implicit)
+            slicing_time += time.perf_counter() - t
+
+            regional_masks = [
+                mask
+                for mask, settings in device.regional_settings.values()
+                if isinstance(settings, (MembraneSettings, SecondaryDoseSettings, ExposureSettings))
+            ]
+            mask_count = sum(
+                1 for _, settings in device.regional_settings.values() if settings is not None
+            )
+
+            # Sample layers, each paired with the next layer to detect repeated images.
+            sample_indices = sorted(
+                set(np.linspace(0, len(layers) - 1, min(sample_layers, len(layers))).round().astype(int))
+            ) if len(layers) > 0 else []
+            raster_times = []
+            rle_bytes = []
+            changes = 0
+            pairs = 0
+            regional_hits = 0
+            for index in sample_indices:
+                images = []
+                for layer in layers[index:index + 2]:
+                    slice_height = device.get_position()[2] + layer[1]
+                    t = time.perf_counter()
+                    img, _ = rasterize_layer(
+                        device, composite_shape, slice_height, resolution, implicit
+                    )
+                    raster_times.append(time.perf_counter() - t)
+                    images.append(np.array(img))
+                if len(images) == 2:
+                    pairs += 1
+                    changes += not np.array_equal(images[0], images[1])
+
+                image = images[0]
+                encoded = rle_encode_packed(image)
+                rle_bytes.append(encoded[0].nbytes + encoded[1].nbytes)
+                t = time.perf_counter()
+                rle_decode_packed(*encoded)
+                decode_times.append(time.perf_counter() - t)
+                buffer = io.BytesIO()
+                t = time.perf_counter()
+                Image.fromarray(
+                    image[: tile_resolution[1], : tile_resolution[0]]
+                ).save(buffer, format="PNG")
+                png_times.append(time.perf_counter() - t)
+                png_bytes.append(buffer.tell())
+
+                slice_height = device.get_position()[2] + layers[index][1]
+                for mask in regional_masks:
+                    mask_img, _ = rasterize_layer(device, mask, slice_height, resolution)
+                    if np.any(np.bitwise_and(np.array(mask_img), image)):
+                        regional_hits += 1
+
+            samples = max(len(sample_indices), 1)
+            regional_images = round(regional_hits / samples * len(layers))
+            device_images = (len(layers) + regional_images) * tiles * len(device_instances)
+            change_rate = changes / pairs if pairs > 0 else 1.0
+            unique_layers = 1 + change_rate * max(len(layers) - 1, 0)
+            # Embedded components are combined into their parent's images.
+            device_unique_images = 0
+            if isinstance(device, Device):
+                device_unique_images = min(
+                    device_images,
+                    round((unique_layers + regional_images) * tiles),
+                )
+                if not self.minimize_file:
+                    device_unique_images = device_images
+                frame_bytes = max(
+                    frame_bytes,
+                    resolution[0] * resolution[1] * (1 + regional_images / max(len(layers), 1)),
+                )
+
+            mean_raster_time = float(np.mean(raster_times)) if raster_times else 0.0
+            slicing_time += mean_raster_time * len(layers) * (1 + mask_count)
+            total_rle_bytes += (
+                (float(np.mean(rle_bytes)) if rle_bytes else 0.0)
+                * len(layers)
+                * (1 + mask_count + (tiles if tiles > 1 else 0))
+            )
+            total_images += device_images
+            total_unique_images += device_unique_images
+            device_estimates.append(
+                {
+                    "name": device.get_fully_qualified_name(),
+                    "layers": len(layers),
+                    "tiles": tiles,
+                    "instances": len(device_instances),
+                    "images": device_images,
+                }
+            )
+
+        mean_png_bytes = float(np.mean(png_bytes)) if png_bytes else 0.0
+        mean_png_time = float(np.mean(png_times)) if png_times else 0.0
+        mean_decode_time = float(np.mean(decode_times)) if decode_times else 0.0
+        layer_count = len(layer_positions)
+        total_unique_images = max(min(total_unique_images, total_images), min(layer_count, 1))
+
+        # Exposure combination decodes every image into a full frame and the
+        # output stage encodes each written image as a PNG.
+        slicing_time += mean_decode_time * total_images + mean_png_time * total_unique_images
+
+        # On top of the memory in use before estimating, the run keeps every slice
+        # run-length encoded in memory and holds the combined full frame images of
+        # every layer until they are written.
+        peak_memory = (
+            baseline_mb * 1024 * 1024
+            + total_rle_bytes
+            + frame_bytes * layer_count
+        )
+
+        return {
+            "layers": layer_count,
+            "images": total_images,
+            "unique_images": total_unique_images,
+            "output_size_bytes": round(
+                total_unique_images * mean_png_bytes + layer_count * 300
+            ),
+            "peak_memory_bytes": round(peak_memory),
+            "slicing_time_s": slicing_time,
+            "estimate_time_s": time.perf_counter() - start,
+            "devices": device_estimates,
+        }
+
+    def _context_mm(self) -> float:
+        """
+        Return how far (in mm) regional settings look above and below a layer.
+
+        Membrane detection compares layers up to the membrane thickness apart and
+        secondary dose roofs look a number of layers above, so slicing a range of
+        layers must include this much context for the result to match a full run.
+        """
+        context_mm = 0.0
+        components = [self.device]
+        while components:
+            component = components.pop()
+            components.extend(component.subcomponents.values())
+            for _, settings in component.regional_settings.values():
+                if isinstance(settings, MembraneSettings):
+                    context_mm = max(
+                        context_mm,
+                        2 * settings.max_membrane_thickness_um / 1000
+                        + 2 * component._layer_size,
+                    )
+                elif isinstance(settings, SecondaryDoseSettings):
+                    context_mm = max(
+                        context_mm,
+                        (settings.roof_layers_above + 1) * component._layer_size,
+                    )
+        return context_mm
+
+    def slice_layers(
+        self, start: int, stop: int | None = None, context_layers: int | None = None
+    ) -> list[dict]:
+        """
+        Slice only a range of layers of the device and return the final print images.
+
+        The full pipeline (embedded components, regional masks, membrane and secondary
+        images, exposure combination) runs on the requested layers plus enough context
+        layers for the regional settings, without writing a print file.
+
+        Parameters:
+
+        - start (int): First layer of the root device to slice.
+        - stop (int | None): Layer after the last layer to slice. Defaults to start + 1.
+        - context_layers (int | None): Number of extra layers sliced above and below the range. Defaults to the context needed by the regional settings.
+
+        Returns:
+
+        - List of dictionaries, one per print layer in the range, with the keys:
+            - layer_position: top of the layer in um above the root device.
+            - images: combined exposure images (uint8 arrays).
+            - exposure_times: exposure time of each image in ms.
+            - exposure_settings: exposure settings of each image.
+            - position_settings: position settings of each image.
+
+        Raises:
+
+        - ValueError: stop is not greater than start.
+        """
+        if stop is None:
+            stop = start + 1
+        if stop <= start:
+            raise ValueError(f"stop ({stop}) must be greater than start ({start}).")
+
+        layer_size = self.device._layer_size
+        if context_layers is None:
+            context_layers = math.ceil(self._context_mm() / layer_size)
+        layer_windows = compute_layer_windows(
+            self.device,
+            (start - context_layers) * layer_size,
+            (stop + context_layers) * layer_size,
+        )
+
+        profile = SlicerProfile()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_directory = Path(temp_dir)
+            sliced_devices = []
+            sliced_devices_data = []
+            print("Slicing...")
+            slice_component(
+                self.device,
+                None,
+                sliced_devices,
+                sliced_devices_data,
+                profile,
+                layer_windows,
+            )
+            print("Make secondary images...")
+            self._generate_device_images(
+                sliced_devices, sliced_devices_data, temp_directory, False, profile
+            )
+            print("Embedding component images...")
+            embedded_devices = self._embed_component_slices(
+                sliced_devices, sliced_devices_data, temp_directory, temp_directory / "slices"
+            )
+
+            # Only combine the layers whose top lies inside the requested range.
+            bottom_um = start * layer_size * 1000
+            top_um = stop * layer_size * 1000
+            for _, info in embedded_devices:
+                info["slices"] = [
+                    slice_info
+                    for slice_info in info["slices"]
+                    if bottom_um + 0.05 < slice_info["layer_position"] <= top_um + 0.05
+                ]
+            print("Combining exposures...")
+            combined_slices = self._combine_slices_by_layer(
+                embedded_devices, temp_directory, profile
+            )
+
+        layers = []
+        for layer, groups in combined_slices:
+            result = {
+                "layer_position": layer,
+                "images": [],
+                "exposure_times": [],
+                "exposure_settings": [],
+                "position_settings": [],
+            }
+            for group, output_imgs, output_times in groups:
+                for image, exposure_time in zip(output_imgs, output_times):
+                    result["images"].append(image)
+                    result["exposure_times"].append(exposure_time)
+                    result["exposure_settings"].append(group[0]["exposure_settings"])
+                    result["position_settings"].append(group[0]["position_settings"])
+            layers.append(result)
+        return layers
+
+    def slice_layer(self, z: int, context_layers: int | None = None) -> dict:
+        """
+        Slice a single layer of the device and return its final print images.
+
+        Parameters:
+
+        - z (int): Layer of the root device to slice.
+        - context_layers (int | None): Number of extra layers sliced above and below. Defaults to the context needed by the regional settings.
+
+        Returns:
+
+        - Dictionary for the print layer at the top of layer z, see slice_layers.
+
+        Raises:
+
+        - ValueError: The device has no print layer at z.
+        """
+        layers = self.slice_layers(z, z + 1, context_layers=context_layers)
+        if len(layers) == 0:
+            raise ValueError(f"Device has no print layer at z={z}.")
+        return layers[-1]
+
+    def make_print_file(self, save_temp_files=False, save_profile=False) -> bool:
+        """
+        Generate a print file based on the provided device and settings.
+        This function will create a temporary directory, slice the device's components,
+        generate secondary and membrane images, create a JSON file with the print data,
+        and create a print job zip or directory.
+
+        Each stage of the run (slicing, image generation, embedding, exposure combination,
+        image writing, json writing and zipping) is timed per device. The profile is kept in
+        ``last_profile`` as a SlicerProfile with the wall time, CPU time, peak memory and
+        item counts of each stage.
+
+        Parameters:
+
+        - save_temp_files (bool): If True, the temporary files will be saved for debugging purposes.
+        - save_profile (bool): If True, the profile is also written to ``<filename>_profile.json`` next to the print file.
+
+        Returns:
+
+        - bool: True if the print file was created, False if slicing failed.
+        """
+        error = None
+        profile = SlicerProfile()
+        self.last_profile = profile
+        try:
+
+            # # Check if output already exists
+            # if self._check_output_exists(self.filename):
+            #     print(
+            #         f"Output already exists at {self.filename}. Please select a different path."
+            #     )
+            #     return False
+
+            # Create a temporary directory for processing
+            temp_directory = self._generate_temp_directory()
+
+            # Copy code to the temporary directory
+            print("Copying script and dependencies...")
+            with profile.stage("copy_script"):
+                main_file_path = self._copy_script_and_dependencies(temp_directory)
+
+            # Slice the device components
+            sliced_devices = []
+            sliced_devices_data = []
+            print("Slicing...")
+            slice_dir = temp_directory if save_temp_files else None
+            slice_component(
+                self.device, slice_dir, sliced_devices, sliced_devices_data, profile
+            )
+
+            print("Make secondary images...")
+            self._generate_device_images(
+                sliced_devices, sliced_devices_data, temp_directory, save_temp_files, profile
+            )
 
             # Make slices directory
             if self.minimize_file:
@@ -1063,9 +1528,11 @@ class Slicer:
 
             print("Embedding component images...")
             # Embed component slices into devices
-            embedded_devices = self._embed_component_slices(
-                sliced_devices, sliced_devices_data, temp_directory, slices_folder
-            )
+            with profile.stage("embed_component_slices") as stage:
+                embedded_devices = self._embed_component_slices(
+                    sliced_devices, sliced_devices_data, temp_directory, slices_folder
+                )
+                stage["count"] = sum(len(info["slices"]) for _, info in embedded_devices)
 
             # print le
             # for device, info in embedded_devices:
@@ -1149,45 +1616,9 @@ class Slicer:
 
 
             print("Combining exposures...")
-            combined_slices = []
-            for layer, slices in self._iterate_slices_by_layer(embedded_devices):
-                print(
-                    f"\r\tProcessing layer at {layer:.1f} um... ",
-                    end="",
-                    flush=True,
-                )
-                grouped_slices = self._group_images_by_settings(slices)
-                combined_slices_groups = []
-                for group in grouped_slices:
-                    group_exposures = [
-                        slice_info["exposure_settings"].get_exposure_time(
-                            self.settings.resin
-                        )
-                        for slice_info in group
-                    ]
-                    group_images = []
-                    for slice_info in group:
-                        if slice_info.get("parent") is not None:
-                            group_images.append(
-                                {
-                                    "device": slice_info["device"],
-                                    "parent": slice_info["parent"],
-                                    "image_data": slice_info["image_data"],
-                                    "image_name": slice_info["image_name"],
-                                    "position": slice_info["position"],
-                                }
-                            )
-                        else:
-                            image = rle_decode_packed(*slice_info["image_data"])
-                            group_images.append(image)
-
-                    # combine exposures
-                    output_imgs, output_times = self._combine_exposures(
-                        group_images, group_exposures, temp_directory
-                    )
-                    combined_slices_groups.append((group, output_imgs, output_times))
-                combined_slices.append((layer, combined_slices_groups))
-            print()
+            combined_slices = self._combine_slices_by_layer(
+                embedded_devices, temp_directory, profile
+            )
 
             # Loop z positions
             print("Compile print settings...")
@@ -1211,20 +1642,22 @@ class Slicer:
                     group_exposure_settings = None
 
                     output_img_files = []
-                    for i, arr in enumerate(output_imgs):
-                        slice_image_path = slices_folder / f"{layer}.png"
-                        if slice_image_path.exists():
-                            # get_unique_path should generate a unique name (preserves suffix)
-                            slice_image_path = get_unique_path(
-                                slices_folder, layer, suffix=".png"
-                            )
-                        if self.minimize_file:
-                            slice_image_path = self.unique_image_store.add_image(
-                                arr, slice_image_path
-                            )
-                        else:
-                            Image.fromarray(arr).save(slice_image_path)
-                        output_img_files.append(slice_image_path.name)
+                    with profile.stage("write_images", accumulate=True) as stage:
+                        for i, arr in enumerate(output_imgs):
+                            slice_image_path = slices_folder / f"{layer}.png"
+                            if slice_image_path.exists():
+                                # get_unique_path should generate a unique name (preserves suffix)
+                                slice_image_path = get_unique_path(
+                                    slices_folder, layer, suffix=".png"
+                                )
+                            if self.minimize_file:
+                                slice_image_path = self.unique_image_store.add_image(
+                                    arr, slice_image_path
+                                )
+                            else:
+                                Image.fromarray(arr).save(slice_image_path)
+                            output_img_files.append(slice_image_path.name)
+                        stage["count"] += len(output_imgs)
 
                     # Update image settings from slice (just the max of wait times)
                     for g, slice_info in enumerate(group):
@@ -1514,33 +1947,45 @@ class Slicer:
                     _strip_grayscale(image_settings)
 
             # Save json
-            with open(print_settings_filename, "w", newline="\r\n") as fileOut:
-                json.dump(pretty_json(print_settings), fileOut, indent=2)
+            with profile.stage("write_json") as stage:
+                with open(print_settings_filename, "w", newline="\r\n") as fileOut:
+                    write_pretty_json(print_settings, fileOut, indent=2)
+                stage["count"] = len(layers)
 
             # Delete device and mask folders
             if not save_temp_files:
                 print("Cleaning up temporary directories...")
-                for device in sliced_devices:
-                    device_subdirectory = temp_directory / device.get_fully_qualified_name()
-                    if device_subdirectory.exists():
-                        shutil.rmtree(device_subdirectory)
-                masks_directory = temp_directory / "masks"
-                if masks_directory.exists():
-                    shutil.rmtree(masks_directory)
+                with profile.stage("cleanup"):
+                    for device in sliced_devices:
+                        device_subdirectory = temp_directory / device.get_fully_qualified_name()
+                        if device_subdirectory.exists():
+                            shutil.rmtree(device_subdirectory)
+                    masks_directory = temp_directory / "masks"
+                    if masks_directory.exists():
+                        shutil.rmtree(masks_directory)
 
             # Zip if requested
             if self.zip_output:
                 print("Zipping output...")
-                shutil.make_archive(self.filename, "zip", temp_directory)
+                with profile.stage("zip_output") as stage:
+                    stage["count"] = sum(1 for f in temp_directory.rglob("*") if f.is_file())
+                    shutil.make_archive(self.filename, "zip", temp_directory)
                 print(f"Output at {self.filename}...")
                 # Remove the temporary directory
                 shutil.rmtree(temp_directory)
             else:
                 print(f"Moving output directory to {self.filename}...")
                 # Move the temporary directory to the output path
-                if os.path.exists(self.filename):
-                    shutil.rmtree(self.filename)
-                shutil.move(temp_directory, self.filename)
+                with profile.stage("move_output"):
+                    if os.path.exists(self.filename):
+                        shutil.rmtree(self.filename)
+                    shutil.move(temp_directory, self.filename)
+
+            profile.finish()
+            if save_profile:
+                profile_filename = f"{self.filename}_profile.json"
+                profile.save(profile_filename)
+                print(f"Profile at {profile_filename}...")
 
         except Exception as e:
             error = e
@@ -1558,3 +2003,5 @@ class Slicer:
                 except Exception:
                     pass
             pass
+
+        return error is None
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from tests.utils.benchmark import compare_to_baseline, machine_info, run_benchmark
+
+
+# Benchmarks are slow and machine dependent, so they only run when requested:
+#   PYMFCAD_BENCHMARK=1 pytest -m benchmark
+# Set PYMFCAD_BENCHMARK_UPDATE=1 to record new baselines on this machine.
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.slow,
+    pytest.mark.skipif(
+        not os.environ.get("PYMFCAD_BENCHMARK"),
+        reason="Set PYMFCAD_BENCHMARK=1 to run the benchmark suite",
+    ),
+]
+
+_BASELINE_FILE = Path(__file__).resolve().parent / "golden_benchmarks" / "baseline.json"
+
+_BENCHMARK_CASES = [
+    "examples/full_test.py",
+    "examples/embedded_device_test.py",
+    "examples/special_techniques_test.py",
+    "examples/stitched_device_test.py",
+    "examples/tpms_timing.py",
+]
+
+
+def _load_baseline() -> dict:
+    if not _BASELINE_FILE.exists():
+        return {"machine": machine_info(), "cases": {}}
+    with _BASELINE_FILE.open("r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _save_baseline(baseline: dict) -> None:
+    _BASELINE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with _BASELINE_FILE.open("w", encoding="utf-8") as handle:
+        json.dump(baseline, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+
+
+@pytest.mark.parametrize("script", _BENCHMARK_CASES, ids=[Path(c).stem for c in _BENCHMARK_CASES])
+def test_benchmark_against_baseline(script, tmp_path):
+    repo_root = Path(__file__).resolve().parents[1]
+    script_path = repo_root / script
+    if not script_path.exists():
+        pytest.skip(f"{script} not available")
+
+    name = script_path.stem
+    measured = run_benchmark(script_path, tmp_path)
+    print(f"\n{name}: {json.dumps(measured, indent=2)}")
+
+    baseline = _load_baseline()
+    if os.environ.get("PYMFCAD_BENCHMARK_UPDATE"):
+        baseline["machine"] = machine_info()
+        baseline["cases"][name] = measured
+        _save_baseline(baseline)
+        return
+
+    expected = baseline["cases"].get(name)
+    if expected is None:
+        pytest.skip(f"No baseline recorded for {name}; run with PYMFCAD_BENCHMARK_UPDATE=1")
+
+    if expected.get("layers") is not None:
+        assert measured["layers"] == expected["layers"]
+
+    tolerance = float(os.environ.get("PYMFCAD_BENCHMARK_TOLERANCE", 1.5))
+    regressions = compare_to_baseline(measured, expected, time_tolerance=tolerance)
+    assert not regressions, f"Performance regression in {name}:\n" + "\n".join(regressions)
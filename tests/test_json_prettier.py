@@ -0,0 +1,57 @@
+import copy
+import io
+import json
+
+from pymfcad.slicer.json_prettier import pretty_json, write_pretty_json
+
+
+def _print_settings(layers=3):
+    return {
+        "Layers": [
+            {
+                "Image settings list": [
+                    {"Layer exposure time (ms)": 250.0, "Image file": f"{i}.png"},
+                ],
+                "Position settings": {"Layer thickness (um)": 10.0},
+                "Number of duplications": 1,
+            }
+            for i in range(layers)
+        ],
+        "Custom key": {"b": 1, "a": [1, 2.5, None, True, "é"]},
+        "Header": {"Image directory": "slices", "Schema version": "0.1"},
+        "Design": {"Purpose": "", "User": "Test"},
+        "Named image settings": {},
+        "Named layer groups": [],
+        "Tuple value": ({"Image file": "x", "Comment": "y"},),
+        1: "integer key",
+    }
+
+
+def test_write_pretty_json_matches_pretty_json():
+    data = _print_settings()
+    expected = json.dumps(pretty_json(copy.deepcopy(data)), indent=2)
+
+    stream = io.StringIO()
+    write_pretty_json(data, stream, indent=2)
+
+    assert stream.getvalue() == expected
+    assert data == _print_settings()
+
+
+def test_write_pretty_json_orders_keys():
+    stream = io.StringIO()
+    write_pretty_json(_print_settings(layers=1), stream)
+
+    keys = list(json.loads(stream.getvalue()).keys())
+    assert keys[:4] == ["Header", "Design", "Named image settings", "Named layer groups"]
+    assert keys[4] == "Layers"
+
+
+def test_write_pretty_json_large_output():
+    data = _print_settings(layers=5000)
+    expected = json.dumps(pretty_json(copy.deepcopy(data)), indent=2)
+
+    stream = io.StringIO()
+    write_pretty_json(data, stream, indent=2)
+
+    assert stream.getvalue() == expected
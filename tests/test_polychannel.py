@@ -3,6 +3,8 @@ from __future__ import annotations
 import pytest
 import numpy as np
 
+from scipy.special import comb
+
 from pymfcad import Polychannel, PolychannelShape, BezierCurveShape
 
 
@@ -162,4 +164,71 @@ def test_polychannel_show_only_shapes():
     
     bezier = BezierCurveShape(control_points=[(15, 0, 0)], bezier_segments=3, shape_type="sphere", position=np.array([20, 0, 0]))
 
-    channel = Polychannel([shape1, shape2, shape3, bezier], show_only_shapes=True)
\ No newline at end of file
+    channel = Polychannel([shape1, shape2, shape3, bezier], show_only_shapes=True)
+def test_polychannel_keepouts_cover_each_segment():
+	shapes = [
+		_shape((0, 0, 0)),
+		_shape((0, 0, 0)),
+		_shape((10, 0, 0)),
+		_shape((10, 10, 0)),
+	]
+	channel = Polychannel(shapes)
+	# Coincident first pair: two cube keepouts, then each hulled pair adds
+	# both shapes' keepouts plus a bridge box.
+	assert len(channel._keepouts) == 2 + 2 * 3
+	assert channel._keepouts[4] == pytest.approx([-1, -1, -1, 11, 1, 1])
+	assert channel._keepouts[7] == pytest.approx([9, -1, -1, 11, 11, 1])
+	bbox = channel._object.bounding_box()
+	assert bbox == pytest.approx((-1, -1, -1, 11, 11, 1))
+	assert channel._object.volume() == pytest.approx(2 * 2 * 12 + 2 * 2 * 10)
+
+def test_bezier_auto_segments_follow_curvature():
+	def _count(control_points, tolerance=0.25):
+		bezier = BezierCurveShape(
+			control_points=control_points,
+			bezier_segments="auto",
+			bezier_tolerance=tolerance,
+			position=(40, 0, 0),
+		)
+		return len(bezier._generate(_shape((0, 0, 0))))
+
+	# A straight curve only needs its endpoints.
+	assert _count([(20, 0, 0)]) == 2
+	gentle = _count([(20, 5, 0)])
+	tight = _count([(20, 40, 0)])
+	assert 2 < gentle < tight
+	assert _count([(20, 40, 0)], tolerance=1) < tight
+
+
+def test_bezier_auto_segments_stay_within_tolerance():
+	bezier = BezierCurveShape(
+		control_points=[(10, 30, 0), (30, -30, 5)],
+		bezier_segments="auto",
+		bezier_tolerance=0.5,
+		position=(40, 0, 0),
+	)
+	samples = np.array([s._position for s in bezier._generate(_shape((0, 0, 0)))])
+	points = np.array(bezier._control_points, dtype=float)
+	dense = np.linspace(0, 1, 2001)
+	curve = sum(
+		comb(3, i) * ((1 - dense) ** (3 - i) * dense**i)[:, None] * p
+		for i, p in enumerate(points)
+	)
+	# Distance from each dense curve point to its polyline segment.
+	seg = np.minimum((dense * (len(samples) - 1)).astype(int), len(samples) - 2)
+	a, b = samples[seg], samples[seg + 1]
+	u = np.clip(np.einsum("ij,ij->i", curve - a, b - a) / np.einsum("ij,ij->i", b - a, b - a), 0, 1)
+	assert np.linalg.norm(curve - (a + u[:, None] * (b - a)), axis=1).max() <= 0.5
+
+
+def test_bezier_auto_segments_requires_positive_tolerance():
+	with pytest.raises(ValueError, match="Bezier curve tolerance must be positive"):
+		bezier = BezierCurveShape(
+			shape_type="cube",
+			size=(2, 2, 2),
+			control_points=[(5, 5, 0)],
+			bezier_segments="auto",
+			bezier_tolerance=0,
+			position=(10, 0, 0),
+		)
+		Polychannel([_shape((0, 0, 0)), bezier])
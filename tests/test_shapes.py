@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import math
 from pathlib import Path
 
+import numpy as np
 import pytest
 import trimesh
 
@@ -16,7 +18,11 @@ from pymfcad.backend import (
     Sphere,
     TextExtrusion,
     TPMS,
+    set_chord_error,
+    set_lazy_csg,
+    set_mesh_cache_dir,
 )
+from pymfcad.backend.slice import _is_implicit
 from tests.utils.mesh_metrics import compute_mesh_metrics, load_mesh
 
 
@@ -285,6 +291,23 @@ def test_shape_ops_add_sub_and_hull_copy():
     assert _bbox_min_max(c) == _bbox_min_max(a)
 
 
+def test_shape_copy_shares_manifold():
+    a = Cube(size=(6, 6, 6), center=False, quiet=False)
+    before = _bbox_min_max(a)
+
+    c = a.copy()
+    assert c._object is a._object
+    assert np.array_equal(c._keepouts, a._keepouts)
+    assert c._keepouts is not a._keepouts
+
+    # Operations on the copy replace its manifold and leave the original untouched.
+    c.translate((5, 0, 0))
+    c._add_bbox_to_keepout((0, 0, 0, 1, 1, 1))
+    assert c._object is not a._object
+    assert _bbox_min_max(a) == before
+    assert len(a._keepouts) == len(c._keepouts) - 1
+
+
 def test_shape_ops_translate_rotate_mirror_resize():
     shape = Cube(size=(4, 6, 8), center=False, quiet=False)
     min_x, min_y, min_z, max_x, max_y, max_z = _bbox_min_max(shape)
@@ -320,6 +343,217 @@ def test_shape_ops_translate_rotate_mirror_resize():
     assert s_max_y - s_min_y == pytest.approx(0.0001)
     assert s_max_z - s_min_z == pytest.approx(0.0001)
 
+
+def test_keepout_array_transforms_and_intersections(monkeypatch):
+    from pymfcad.backend import manifold3d
+
+    shape = Cube(size=(4, 6, 8), center=False, quiet=False)
+    assert shape._keepouts.shape == (1, 6)
+
+    shape.translate((1, 2, 3)).rotate((0, 0, 90)).mirror((False, True, False))
+    assert shape._keepouts[0] == pytest.approx([-8, -5, 3, -2, -1, 11])
+    assert shape._keepouts[0] == pytest.approx(_bbox_min_max(shape))
+
+    rng = np.random.default_rng(0)
+    lo = rng.integers(-20, 20, (60, 3)).astype(float)
+    boxes1 = np.hstack([lo, lo + rng.integers(0, 8, (60, 3))])
+    lo = rng.integers(-20, 20, (40, 3)).astype(float)
+    boxes2 = np.hstack([lo, lo + rng.integers(0, 8, (40, 3))])
+
+    # Pairwise reference, ordered by box in boxes1 then box in boxes2.
+    expected = []
+    for box1 in boxes1:
+        for box2 in boxes2:
+            inter = np.concatenate(
+                [np.maximum(box1[:3], box2[:3]), np.minimum(box1[3:], box2[3:])]
+            )
+            if np.all(inter[:3] < inter[3:]):
+                expected.append(inter)
+    expected = np.array(expected).reshape(-1, 6)
+
+    assert np.array_equal(shape._intersect_keepouts(boxes1, boxes2), expected)
+    monkeypatch.setattr(manifold3d, "_KEEPOUT_BROADCAST_LIMIT", 0)
+    assert np.array_equal(shape._intersect_keepouts(boxes1, boxes2), expected)
+
+
+def test_coalesce_keepouts_preserves_covered_region():
+    from pymfcad.backend.manifold3d import _coalesce_keepouts
+
+    boxes = np.array(
+        [
+            [0, 0, 0, 2, 1, 1],
+            [5, 5, 5, 6, 6, 6],
+            [2, 0, 0, 4, 1, 1],  # touches the first box along x
+            [1, 0, 0, 3, 1, 1],  # overlaps both
+            [0.5, 0.2, 0.2, 1, 0.8, 0.8],  # contained
+            [0, 0, 1, 4, 1, 2],  # fuses with the x run along z
+            [3, 0, 0, 4, 2, 1],  # overlaps but does not share extents
+        ],
+        dtype=float,
+    )
+    merged = _coalesce_keepouts(boxes)
+    assert np.array_equal(
+        merged,
+        [[0, 0, 0, 4, 1, 2], [5, 5, 5, 6, 6, 6], [3, 0, 0, 4, 2, 1]],
+    )
+
+    rng = np.random.default_rng(0)
+    points = rng.uniform(-1, 7, (5000, 3))
+    points[:2500] = np.round(points[:2500] * 2) / 2
+
+    def covered(b):
+        return np.any(
+            np.all((points[:, None] >= b[None, :, :3]) & (points[:, None] <= b[None, :, 3:]), axis=2),
+            axis=1,
+        )
+
+    assert np.array_equal(covered(boxes), covered(merged))
+
+    # A tolerance also merges nearly touching boxes.
+    near = np.array([[0, 0, 0, 1, 1, 1], [1.05, 0, 0, 2, 1, 1.01]])
+    assert len(_coalesce_keepouts(near)) == 2
+    assert np.array_equal(_coalesce_keepouts(near, tolerance=0.1), [[0, 0, 0, 2, 1, 1.01]])
+
+
+def test_shape_arrays_match_unioned_copies():
+    from pymfcad.backend.manifold3d import _copies_disjoint
+
+    def unioned(step, count):
+        shape = Cylinder(height=4, radius=2, fn=16, quiet=False)
+        for index in np.ndindex(*count):
+            if any(index):
+                shape + Cylinder(height=4, radius=2, fn=16, quiet=False).translate(
+                    tuple(i * s for i, s in zip(index, step))
+                )
+        return shape
+
+    # Spaced copies are stitched into one mesh, overlapping copies are unioned.
+    for step in [(6, 5, 6), (3, 5, 6)]:
+        arrayed = Cylinder(height=4, radius=2, fn=16, quiet=False).grid_array((3, 2, 2), step)
+        expected = unioned(step, (3, 2, 2))
+        assert _bbox_min_max(arrayed) == pytest.approx(_bbox_min_max(expected))
+        assert arrayed._object.volume() == pytest.approx(expected._object.volume(), rel=1e-6)
+        assert arrayed._object.num_tri() == expected._object.num_tri()
+        assert len(arrayed._keepouts) == 12
+
+    line = Cube(size=(2, 3, 4), center=False, quiet=False).linear_array(3, (5, 0, 1))
+    assert _bbox_min_max(line) == (0, 0, 0, 12, 3, 6)
+    assert np.array_equal(line._keepouts[:, 0], [0, 5, 10])
+    assert np.array_equal(line._keepouts[:, 2], [0, 1, 2])
+    with pytest.raises(ValueError):
+        Cube(size=(2, 2, 2), quiet=False).linear_array(0, (5, 0, 0))
+
+    # Copies that touch are not stitched together.
+    box = (0, 0, 0, 2, 2, 2)
+    assert _copies_disjoint(box, np.array([[0, 0, 0], [2.5, 0, 0], [0, 0, 3]]))
+    assert not _copies_disjoint(box, np.array([[0, 0, 0], [2, 2, 2]]))
+    assert not _copies_disjoint(box, np.array([[0, 0, 0], [5, 0, 0], [0, 0, 0]]))
+
+    comp = Component(size=(20, 20, 10), position=(0, 0, 0), quiet=True)
+    comp.add_label("fluidic", Color.from_name("blue", 255))
+    comp.add_void_array(
+        "pillars",
+        Cube(size=(2, 2, 10), center=False, quiet=False),
+        [(4, 4, 0), (10, 4, 0), (7, 12, 0)],
+        label="fluidic",
+    )
+    assert list(comp.shapes) == ["pillars"]
+    assert _bbox_min_max(comp.shapes["pillars"]) == (4, 4, 0, 12, 14, 10)
+    assert comp.shapes["pillars"]._object.volume() == pytest.approx(120)
+
+
+def test_primitive_cache_shares_tessellation():
+    from pymfcad.backend import manifold3d
+
+    manifold3d._primitive_cache.clear()
+    a = RoundedCube(size=(8, 8, 8), radius=(2, 2, 2), center=True, quiet=False)
+    b = RoundedCube(size=(8, 8, 8), radius=(2, 2, 2), center=True, quiet=False)
+    assert a._object is b._object
+    assert np.array_equal(a._keepouts, b._keepouts)
+
+    # Transforms apply to the shape, not to the cached primitive.
+    b.translate((5, 0, 0))
+    c = RoundedCube(size=(8, 8, 8), radius=(2, 2, 2), center=True, quiet=False)
+    assert _bbox_min_max(c) == _bbox_min_max(a)
+
+    # Cache hits and misses leave the shape in the same state.
+    manifold3d._primitive_cache.clear()
+    miss = Sphere(size=(7, 9, 5), center=False, fn=16, quiet=False)
+    hit = Sphere(size=(7, 9, 5), center=False, fn=16, quiet=False)
+    assert hit._object is miss._object
+    assert np.array_equal(hit._keepouts, miss._keepouts)
+    assert _bbox_min_max(miss) == pytest.approx((0, 0, 0, 7, 9, 5))
+
+    # Different arguments or facet counts build new primitives.
+    assert Sphere(size=(8, 8, 8), fn=16, quiet=False)._object is not Sphere(
+        size=(8, 8, 8), fn=24, quiet=False
+    )._object
+    assert Cube(size=(4, 4, 4), quiet=False)._object is not Cube(
+        size=(4, 4, 4), center=True, quiet=False
+    )._object
+
+
+def test_chord_error_scales_facets_with_radius():
+    set_chord_error(0.1)
+    try:
+        small = Cylinder(height=4, radius=2, fn=0, quiet=False)
+        large = Cylinder(height=4, radius=200, fn=0, quiet=False)
+        explicit = Cylinder(height=4, radius=200, fn=20, quiet=False)
+        sphere = Sphere(size=(40, 40, 40), quiet=False)
+    finally:
+        set_chord_error(None)
+
+    # A cylinder with n facets has 2n side triangles and n - 2 per cap.
+    assert small._object.num_tri() == 4 * 12 - 4
+    assert large._object.num_tri() == 4 * 100 - 4
+    assert explicit._object.num_tri() == 4 * 20 - 4
+    assert _bbox_min_max(small) == pytest.approx((-2, -2, 0, 2, 2, 4))
+    assert _bbox_min_max(large) == pytest.approx((-200, -200, 0, 200, 200, 4))
+    assert _bbox_min_max(sphere) == pytest.approx((-20, -20, -20, 20, 20, 20))
+
+    with pytest.raises(ValueError):
+        set_chord_error(0)
+
+
+@pytest.fixture
+def lazy_csg():
+    set_lazy_csg(True)
+    yield
+    set_lazy_csg(False)
+
+
+def _alternating_chain() -> Shape:
+    shape = Cube(size=(40, 10, 10), center=False, quiet=False)
+    for i in range(4):
+        shape - Cube(size=(4, 4, 12), center=False, quiet=False).translate((2 + 10 * i, 3, -1))
+        shape + Cube(size=(4, 4, 4), center=False, quiet=False).translate((5 + 10 * i, 3, 10))
+    # Refill the first hole, which must not be reordered before its subtraction.
+    shape + Cube(size=(2, 2, 10), center=False, quiet=False).translate((3, 4, 0))
+    return shape
+
+
+def test_lazy_csg_matches_eager(lazy_csg):
+    lazy = _alternating_chain()
+    assert lazy._pending_csg
+    lazy_volume = lazy._object.volume()
+    assert not lazy._pending_csg
+
+    set_lazy_csg(False)
+    eager = _alternating_chain()
+    assert not eager._pending_csg
+    assert lazy_volume == pytest.approx(eager._object.volume())
+    assert _bbox_min_max(lazy) == pytest.approx(_bbox_min_max(eager))
+    assert np.array_equal(lazy._keepouts, eager._keepouts)
+
+
+def test_lazy_csg_flushes_before_transforms(lazy_csg):
+    shape = Cube(size=(10, 10, 10), center=False, quiet=False)
+    shape + Cube(size=(10, 10, 10), center=False, quiet=False).translate((10, 0, 0))
+    shape.translate((5, 0, 0))
+    assert _bbox_min_max(shape)[0] == pytest.approx(5)
+    assert _bbox_min_max(shape)[3] == pytest.approx(25)
+
+
 def test_batch_boolean():
     with pytest.raises(ValueError):
         Shape._batch_boolean_add([])
@@ -333,6 +567,47 @@ def test_batch_boolean():
     diff = Shape._batch_boolean_subtract([Cube(size=(2,1,1), quiet=False), Cube(size=(1,1,1), quiet=False)])
     assert _bbox_min_max(diff)[3] - _bbox_min_max(diff)[0] == pytest.approx(1)
 
+
+def test_batch_boolean_add_then_subtract_culls_by_region():
+    from pymfcad.backend import manifold3d
+
+    # Two separate chips, a void spanning both, one per chip and one far away.
+    chips = [
+        Cube(size=(10, 10, 4), center=False, quiet=False),
+        Cube(size=(10, 10, 4), center=False, quiet=False).translate((20, 0, 0)),
+    ]
+    voids = [
+        Cube(size=(30, 2, 2), center=False, quiet=False).translate((0, 4, 1))
+        + Cube(size=(2, 2, 2), center=False, quiet=False).translate((4, 7, 1)),
+        Cube(size=(2, 2, 6), center=False, quiet=False).translate((24, 1, -1)),
+        Cube(size=(2, 2, 2), center=False, quiet=False).translate((50, 50, 50)),
+    ]
+    expected = manifold3d.Manifold.batch_boolean(
+        [
+            manifold3d.Manifold.batch_boolean([c._object for c in chips], manifold3d.OpType.Add)
+        ]
+        + [v._object for v in voids],
+        manifold3d.OpType.Subtract,
+    )
+
+    subtracted = []
+    batch_boolean = manifold3d.Manifold.batch_boolean
+
+    def recording_batch_boolean(manifolds, op):
+        if op == manifold3d.OpType.Subtract:
+            subtracted.append(len(manifolds) - 1)
+        return batch_boolean(manifolds, op)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(manifold3d.Manifold, "batch_boolean", recording_batch_boolean)
+        diff = Shape._batch_boolean_add_then_subtract(chips, voids)
+
+    # Each chip only loses the parts of the voids inside it.
+    assert subtracted == [2, 2]
+    assert diff._object.volume() == pytest.approx(expected.volume())
+    assert _bbox_min_max(diff) == pytest.approx(tuple(expected.bounding_box()))
+    assert diff._object.genus() == expected.genus()
+
 def test_cube():
     shape = Cube(size=(1, 1, 1), center=True, quiet=False)
     assert _bbox_min_max(shape) == pytest.approx((0, 0, 0, 1, 1, 1))
@@ -388,12 +663,204 @@ def test_text():
     z_min, z_max = _bbox_min_max(shape)[2], _bbox_min_max(shape)[5]
     assert z_max - z_min == pytest.approx(0.0001)
 
+def test_tpms_replicate_cells():
+    replicated = TPMS(
+        size=(4, 4, 3),
+        cells=(3, 1, 2),
+        func=TPMS.diamond,
+        refinement=8,
+        replicate_cells=True,
+    )
+    direct = TPMS(size=(4, 4, 3), cells=(3, 1, 2), func=TPMS.diamond, refinement=8)
+    assert _bbox_min_max(replicated) == pytest.approx(_bbox_min_max(direct))
+    assert np.array_equal(replicated._keepouts, direct._keepouts)
+    # Seams are unioned into a single solid; diamond at fill 0 is half full.
+    assert len(replicated._object.decompose()) == 1
+    assert replicated._object.volume() == pytest.approx(0.5 * 12 * 4 * 6, rel=1e-6)
+
+def test_tpms_vectorized_matches_level_set():
+    vectorized = TPMS(
+        size=(4, 4, 3), cells=(2, 1, 2), func=TPMS.gyroid, refinement=8, vectorized=True
+    )
+    direct = TPMS(size=(4, 4, 3), cells=(2, 1, 2), func=TPMS.gyroid, refinement=8)
+    assert _bbox_min_max(vectorized) == pytest.approx(_bbox_min_max(direct))
+    assert vectorized._object.genus() == direct._object.genus()
+    # Gyroid at fill 0 is half full.
+    assert vectorized._object.volume() == pytest.approx(0.5 * 8 * 4 * 6, rel=1e-4)
+
+
+def test_tpms_vectorized_falls_back_for_scalar_functions(capsys):
+    def scalar_schwarz_p(x, y, z):
+        a = 2 * math.pi
+        return math.cos(a * x) + math.cos(a * y) + math.cos(a * z)
+
+    shape = TPMS(size=(4, 4, 4), func=scalar_schwarz_p, refinement=6, vectorized=True)
+    assert "Falling back to Manifold.level_set" in capsys.readouterr().out
+    assert _bbox_min_max(shape) == pytest.approx((0, 0, 0, 4, 4, 4))
+
+def test_tpms_implicit_defers_mesh():
+    def build(implicit):
+        shape = TPMS(size=(4, 4, 3), cells=(2, 1, 2), func=TPMS.gyroid, refinement=8, implicit=implicit)
+        return shape.rotate((0, 0, 90)).mirror((True, False, False)).translate((1, 2, 3))
+
+    implicit = build(True)
+    meshed = build(False)
+    assert implicit._deferred_mesh is not None
+    assert np.array_equal(implicit._keepouts, meshed._keepouts)
+    assert implicit._implicit_bounds() == pytest.approx(_bbox_min_max(meshed))
+    # The mesh is built with the recorded transforms when it is first needed.
+    assert _bbox_min_max(implicit) == pytest.approx(_bbox_min_max(meshed))
+    assert implicit._object.volume() == pytest.approx(meshed._object.volume())
+    assert implicit._implicit is not None
+
+    implicit += Cube(size=(1, 1, 1))
+    assert implicit._implicit is None
+
+def test_tpms_copy_keeps_implicit_lattice():
+    shape = TPMS(size=(4, 4, 3), cells=(2, 1, 2), func=TPMS.gyroid, refinement=8, implicit=True)
+    shape.rotate((0, 0, 90)).translate((1, 2, 3))
+    copied = shape.copy()
+    assert isinstance(copied, TPMS)
+    assert _is_implicit(copied)
+    assert copied._deferred_mesh is not None
+    assert np.array_equal(copied._keepouts, shape._keepouts)
+
+    copied.translate((5, 0, 0))
+    assert _is_implicit(copied)
+    assert shape._deferred_mesh is not None
+    assert _bbox_min_max(copied)[0] == pytest.approx(_bbox_min_max(shape)[0] + 5)
+
+def test_tpms_parallel_slabs_match_single_process():
+    single = TPMS(size=(4, 4, 3), cells=(1, 2, 3), func=TPMS.gyroid, refinement=8)
+    parallel = TPMS(size=(4, 4, 3), cells=(1, 2, 3), func=TPMS.gyroid, refinement=8, workers=2)
+    assert _bbox_min_max(parallel) == pytest.approx(_bbox_min_max(single))
+    # Slabs are unioned into one solid without seams.
+    assert len(parallel._object.decompose()) == 1
+    assert parallel._object.genus() == single._object.genus()
+    assert parallel._object.volume() == pytest.approx(single._object.volume(), rel=1e-4)
+
+def test_tpms_parallel_falls_back_for_unpicklable_functions(capsys):
+    shape = TPMS(
+        size=(4, 4, 4),
+        cells=(1, 1, 2),
+        func=lambda x, y, z: TPMS.schwarz_p(x, y, z),
+        refinement=6,
+        workers=2,
+    )
+    assert "Meshing in a single process" in capsys.readouterr().out
+    assert _bbox_min_max(shape) == pytest.approx((0, 0, 0, 4, 4, 8))
+
+def test_tpms_mesh_cache(tmp_path, monkeypatch):
+    set_mesh_cache_dir(tmp_path)
+    try:
+        built = TPMS(size=(4, 4, 3), cells=(2, 1, 2), func=TPMS.gyroid, refinement=8)
+        assert len(list(tmp_path.glob("*.npy"))) == 2
+
+        # Repeat shapes load from disk; the cached mesh is resized like a new one.
+        def fail(*args, **kwargs):
+            raise AssertionError("TPMS was meshed again")
+
+        with monkeypatch.context() as m:
+            m.setattr(TPMS, "_level_set", fail)
+            loaded = TPMS(size=(8, 4, 3), cells=(2, 1, 2), func=TPMS.gyroid, refinement=8)
+        assert loaded._object.volume() == pytest.approx(2 * built._object.volume())
+        assert _bbox_min_max(loaded) == pytest.approx((0, 0, 0, 16, 4, 6))
+
+        # Other parameters or functions are stored separately.
+        TPMS(size=(4, 4, 3), cells=(2, 1, 2), func=TPMS.gyroid, fill=0.2, refinement=8)
+        TPMS(size=(4, 4, 3), cells=(2, 1, 2), func=TPMS.diamond, refinement=8)
+        assert len(list(tmp_path.glob("*.npy"))) == 6
+    finally:
+        set_mesh_cache_dir(None)
+
+def test_text_glyph_cache():
+    from pymfcad.backend import manifold3d
+
+    manifold3d._glyph_cache.clear()
+    label = TextExtrusion(text="A-A", height=2, font_size=12, quiet=False)
+    # Repeated characters share one glyph and the font file is opened once.
+    assert len(manifold3d._glyph_cache) == 2
+    assert len(manifold3d._font_faces) >= 1
+    again = TextExtrusion(text="A-A", height=2, font_size=12, quiet=False)
+    assert len(manifold3d._glyph_cache) == 2
+    assert _bbox_min_max(again) == _bbox_min_max(label)
+    assert again._object.volume() == pytest.approx(label._object.volume())
+    # Glyph outlines depend on the font size.
+    TextExtrusion(text="A", height=2, font_size=24, quiet=False)
+    assert len(manifold3d._glyph_cache) == 3
+
+
+def test_font_face_cache_is_bounded(monkeypatch):
+    from pymfcad.backend import manifold3d
+
+    monkeypatch.setattr(manifold3d, "_FONT_FACE_CACHE_SIZE", 1)
+    manifold3d._font_faces.clear()
+    manifold3d._glyph_cache.clear()
+    TextExtrusion(text="A", height=2, font_size=12, font="OpenSans-Medium", quiet=False)
+    TextExtrusion(text="A", height=2, font_size=12, font="Inconsolata-Medium", quiet=False)
+    # Only the most recently used face stays open.
+    assert len(manifold3d._font_faces) == 1
+    assert "Inconsolata" in next(iter(manifold3d._font_faces))
+
+
+def test_text_warns_when_extrusion_fails(capsys):
+    shape = TextExtrusion(text="A", height=-1, font_size=12, quiet=False)
+    assert "Extrusion failed for character 'A'" in capsys.readouterr().out
+    assert shape._object.is_empty()
+
 def test_import():
     ImportModel(filename="tests/golden_meshes/3DBenchy.stl", quiet=False)
     ImportModel(filename="tests/golden_meshes/BAD_cube.stl", quiet=False)
     with pytest.raises(ValueError):
         ImportModel(filename="tests/golden_meshes/empty_stl.stl", quiet=False)
 
+def _write_box_stl(path, size=(2, 2, 2), flip_faces=0):
+    box = trimesh.creation.box(size)
+    faces = box.faces.copy()
+    faces[:flip_faces] = faces[:flip_faces, ::-1]
+    trimesh.Trimesh(box.vertices, faces, process=False).export(path)
+    return path
+
+def test_import_repairs_inconsistent_winding(tmp_path):
+    from pymfcad.backend import manifold3d
+
+    manifold3d._import_cache.clear()
+    model = ImportModel(filename=str(_write_box_stl(tmp_path / "flipped.stl", flip_faces=2)), quiet=True)
+    assert model._object.volume() == pytest.approx(8.0)
+
+def test_import_cache(tmp_path, monkeypatch):
+    from pymfcad.backend import manifold3d
+
+    manifold3d._import_cache.clear()
+    filename = str(_write_box_stl(tmp_path / "box.stl"))
+    first = ImportModel(filename=filename, quiet=True)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Model was parsed again")
+
+    # Repeated imports within a run share the converted manifold.
+    with monkeypatch.context() as m:
+        m.setattr(trimesh, "load_mesh", fail)
+        assert ImportModel(filename=filename, quiet=True)._object is first._object
+
+    # Changed files are parsed again.
+    _write_box_stl(filename, size=(2, 2, 4))
+    assert ImportModel(filename=filename, quiet=True)._object.volume() == pytest.approx(16.0)
+
+    # With a mesh cache directory, a fresh run loads the converted mesh from disk.
+    set_mesh_cache_dir(tmp_path / "cache")
+    try:
+        manifold3d._import_cache.clear()
+        ImportModel(filename=filename, quiet=True)
+        manifold3d._import_cache.clear()
+        with monkeypatch.context() as m:
+            m.setattr(trimesh, "load_mesh", fail)
+            loaded = ImportModel(filename=filename, quiet=True)
+        assert loaded._object.volume() == pytest.approx(16.0)
+        assert _bbox_min_max(loaded) == pytest.approx((-1, -1, -2, 1, 1, 2))
+    finally:
+        set_mesh_cache_dir(None)
+
 def test_bad_fontfile():
     with pytest.raises(FileNotFoundError):
         TextExtrusion(text="AB", height=2, font="nonexistent_font.ttf", font_size=12, quiet=False)
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from pymfcad import Component
-from pymfcad.backend import Color, Cube
-from pymfcad.backend.slice import slice_component
+from pymfcad.backend import Color, Cube, TPMS
+from pymfcad.backend.slice import rle_decode_packed, slice_component
 
 def _build_parent_component(size=(40, 30, 20)) -> Component:
     comp = Component(size=size, position=(0, 0, 0), quiet=True)
@@ -54,3 +55,74 @@ def test_component_slicing(tmp_path):
         assert slice_path.exists(), f"Slice image for layer {layer} was not created"
         mask_slice_path = masks_regional_dir / f"test_component-slice{layer:04d}.png"
         assert mask_slice_path.exists(), f"Mask slice image for layer {layer} was not created"
+
+def _sliced_layers(comp: Component) -> np.ndarray:
+    data = []
+    slice_component(comp, None, [], data)
+    return np.array(
+        [rle_decode_packed(*layer["image_data"]) > 0 for layer in data[0]["slices"]]
+    )
+
+@pytest.mark.parametrize("as_void", [True, False])
+def test_implicit_tpms_slicing_matches_mesh(as_void):
+    def build(implicit):
+        comp = _build_parent_component()
+        comp._name = "test_component"
+        lattice = TPMS(
+            size=(16, 16, 8),
+            cells=(2, 1, 2),
+            func=TPMS.gyroid,
+            fill=0.3,
+            refinement=16,
+            implicit=implicit,
+        ).translate((4, 7, 2))
+        if as_void:
+            comp.add_bulk("device_bulk", Cube(size=(40, 30, 20), center=False), label="device")
+            comp.add_void("lattice", lattice, label="fluidic")
+        else:
+            comp.add_bulk("lattice", lattice, label="device")
+            comp.add_void("channel", Cube(size=(40, 4, 4)).translate((0, 13, 8)), label="fluidic")
+        return comp, lattice
+
+    meshed, _ = build(False)
+    implicit, lattice = build(True)
+    expected = _sliced_layers(meshed)
+    actual = _sliced_layers(implicit)
+
+    # The lattice is sliced from its function without being meshed.
+    assert lattice._deferred_mesh is not None
+    assert actual.shape == expected.shape
+    # Pixel centers and mesh polygons only disagree along the surface.
+    assert np.count_nonzero(actual != expected) < 0.06 * np.count_nonzero(~expected if as_void else expected)
+    if not as_void:
+        assert not actual[8:12, 30 - 17 : 30 - 13, :].any()
+
+
+def test_slice_tolerance_only_changes_edge_pixels(monkeypatch):
+    from pymfcad.backend import Cylinder, slice as slice_module
+
+    comp = _build_parent_component()
+    comp._name = "test_component"
+    comp.add_bulk("device_bulk", Cube(size=(40, 30, 20), center=False), label="device")
+    channel = Cylinder(height=12, radius=9, fn=512).translate((20, 15, 4))
+    comp.add_void("channel", channel, label="fluidic")
+
+    expected = _sliced_layers(comp)
+    with pytest.raises(ValueError):
+        slice_module.set_slice_tolerance(0)
+    monkeypatch.setattr(slice_module, "_slice_tolerance", 0.25)
+    triangles = channel._object.num_tri()
+    assert slice_module._simplify(channel)._object.num_tri() < triangles / 4
+    actual = _sliced_layers(comp)
+
+    # The user's void is left alone and only pixels along the surface change.
+    assert channel._object.num_tri() == triangles
+    assert actual.shape == expected.shape
+    changed = actual != expected
+    edge = np.zeros_like(expected)
+    edge[:, 1:, :] |= expected[:, 1:, :] != expected[:, :-1, :]
+    edge[:, :-1, :] |= expected[:, 1:, :] != expected[:, :-1, :]
+    edge[:, :, 1:] |= expected[:, :, 1:] != expected[:, :, :-1]
+    edge[:, :, :-1] |= expected[:, :, 1:] != expected[:, :, :-1]
+    assert not (changed & ~edge).any()
+    assert np.count_nonzero(changed) < 0.5 * np.count_nonzero(edge)
@@ -105,3 +105,110 @@ def test_slicer_temp_directory_creation(tmp_path, monkeypatch):
     temp_dir = slicer._generate_temp_directory()
     assert temp_dir.exists()
     assert temp_dir.is_dir()
+
+
+def _build_small_print(tmp_path, filename="small_print"):
+    from pymfcad import Device
+    from pymfcad.backend import Color, Cube
+
+    light_engine = LightEngine(
+        name="visitech",
+        px_size=0.0076,
+        px_count=(64, 40),
+        wavelengths=[365],
+    )
+    settings = Settings(
+        printer=Printer(name="TestPrinter", light_engines=[light_engine]),
+        resin=ResinType(bulk_exposure=100.0),
+        default_position_settings=PositionSettings(),
+        default_exposure_settings=ExposureSettings(),
+    )
+
+    device = Device(
+        name="small_device",
+        position=(0, 0, 0),
+        layers=10,
+        layer_size=0.01,
+        px_count=(64, 40),
+        px_size=0.0076,
+    )
+    device.add_label("bulk", Color.from_name("gray", 255))
+    device.add_label("fluidic", Color.from_name("blue", 255))
+    device.add_bulk("bulk_shape", Cube(size=(64, 40, 10), center=False), label="bulk")
+    device.add_void(
+        "channel",
+        Cube(size=(40, 8, 4), center=False).translate((12, 16, 3)),
+        label="fluidic",
+    )
+    return Slicer(
+        device=device,
+        settings=settings,
+        filename=str(tmp_path / filename),
+    )
+
+
+@pytest.mark.slow
+def test_make_print_file_records_profile(tmp_path, monkeypatch):
+    import json
+
+    monkeypatch.chdir(tmp_path)
+    slicer = _build_small_print(tmp_path)
+    assert slicer.last_profile is None
+    assert slicer.make_print_file(save_profile=True) is True
+
+    profile = slicer.last_profile
+    assert profile is not None
+    assert (tmp_path / "small_print.zip").exists()
+
+    totals = profile.totals_by_stage()
+    for stage in ["slice_component", "embed_component_slices", "combine_exposures", "write_images", "write_json", "zip_output"]:
+        assert stage in totals
+        assert totals[stage]["wall_time_s"] >= 0.0
+    assert totals["slice_component"]["count"] == 10
+    assert totals["combine_exposures"]["count"] == 10
+    assert "small_device" in profile.totals_by_device()
+
+    saved = json.loads((tmp_path / "small_print_profile.json").read_text())
+    assert saved["totals_by_stage"]["slice_component"]["count"] == 10
+    assert len(saved["stages"]) == len(profile.stages)
+
+
+def test_slicer_estimate_counts_layers_and_images(tmp_path):
+    slicer = _build_small_print(tmp_path)
+    estimate = slicer.estimate(sample_layers=3)
+
+    assert estimate["layers"] == 10
+    assert estimate["images"] == 10
+    # The channel only occupies layers 3-6, so the layers repeat.
+    assert 1 <= estimate["unique_images"] < estimate["images"]
+    assert estimate["output_size_bytes"] > 0
+    assert estimate["peak_memory_bytes"] > 0
+    assert estimate["slicing_time_s"] >= 0.0
+    assert estimate["devices"] == [
+        {"name": "small_device", "layers": 10, "tiles": 1, "instances": 1, "images": 10}
+    ]
+    assert not list(tmp_path.iterdir())
+
+
+def test_slice_layer_matches_full_range(tmp_path):
+    import numpy as np
+
+    slicer = _build_small_print(tmp_path)
+    full = slicer.slice_layers(0, 10)
+    assert [layer["layer_position"] for layer in full] == [
+        pytest.approx(10.0 * (i + 1)) for i in range(10)
+    ]
+
+    layer = slicer.slice_layer(4)
+    assert layer["layer_position"] == full[4]["layer_position"]
+    assert len(layer["images"]) == len(full[4]["images"]) == 1
+    assert np.array_equal(layer["images"][0], full[4]["images"][0])
+    assert layer["exposure_times"] == full[4]["exposure_times"]
+    # Layer 4 cuts through the channel, layer 0 is solid.
+    assert np.count_nonzero(layer["images"][0]) < np.count_nonzero(full[0]["images"][0])
+
+    with pytest.raises(ValueError):
+        slicer.slice_layer(20)
+    with pytest.raises(ValueError):
+        slicer.slice_layers(5, 5)
+    assert not list(tmp_path.iterdir())
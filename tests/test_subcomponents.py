@@ -169,6 +169,149 @@ def test_component_ops_translate_rotate_mirror():
     assert child3.get_bounding_box() == (-9, 7, 7, -1, 17, 13)
 
 
+def test_copy_shares_geometry_without_rebuilding():
+    class Block(Component):
+        builds = 0
+
+        def __init__(self, quiet: bool = True):
+            super().__init__(size=(10, 10, 10), position=(0, 0, 0), quiet=quiet)
+            Block.builds += 1
+            self.channel_width = 4
+            self.add_label("device", Color.from_name("gray", 255))
+            self.add_bulk("bulk", Cube(size=(10, 10, 10), center=False), label="device")
+            self.add_void("channel", Cube(size=(10, 4, 4), center=False), label="device")
+            self.add_port(
+                "P1",
+                Port(
+                    Port.PortType.IN,
+                    position=(0, 3, 3),
+                    size=(4, 4, 4),
+                    surface_normal=Port.SurfaceNormal.NEG_X,
+                ),
+            )
+            inner = Component(size=(2, 2, 2), position=(1, 1, 1), quiet=True)
+            inner.add_label("device", Color.from_name("gray", 255))
+            inner.add_bulk("bulk", Cube(size=(2, 2, 2), center=False), label="device")
+            self.add_subcomponent("inner", inner)
+
+    block = Block()
+    block.translate((5, 0, 0))
+    clone = block.copy()
+
+    # Nothing is rebuilt and the geometry is shared.
+    assert Block.builds == 1
+    assert type(clone) is Block and clone.channel_width == 4
+    assert clone.shapes["channel"]._object is block.shapes["channel"]._object
+    assert clone.ports["P1"] is not block.ports["P1"]
+    assert clone.subcomponents["inner"] is not block.subcomponents["inner"]
+    assert clone.subcomponents["inner"]._parent is clone
+    assert clone.subcomponents["inner"].bulk_shapes["bulk"]._parent is clone.subcomponents["inner"]
+
+    # Both components can be placed and moved independently.
+    parent = _build_parent_component(size=(50, 50, 50))
+    parent.add_subcomponent("a", block)
+    clone.translate((20, 0, 0))
+    parent.add_subcomponent("b", clone)
+    assert _bbox_min_max(block.shapes["channel"]) == pytest.approx((5, 0, 0, 15, 4, 4))
+    assert _bbox_min_max(clone.shapes["channel"]) == pytest.approx((25, 0, 0, 35, 4, 4))
+    inner = _bbox_min_max(block.subcomponents["inner"].bulk_shapes["bulk"])
+    assert _bbox_min_max(clone.subcomponents["inner"].bulk_shapes["bulk"]) == pytest.approx(
+        (inner[0] + 20, inner[1], inner[2], inner[3] + 20, inner[4], inner[5])
+    )
+    assert clone.ports["P1"].get_position() == (25, 3, 3)
+
+
+def test_copy_of_library_component_is_independent():
+    from pymfcad import ExposureSettings
+    from pymfcad.component_library import Pinhole
+
+    pinhole = Pinhole(quiet=True)
+    pinhole.exposure_steps = [ExposureSettings(bulk_exposure_multiplier=1.0)]
+    pinhole.outlet = pinhole.shapes["pinhole"]
+    pinhole.set_burn_in_exposure([1.0, 2.0])
+    pinhole.template_port = Port(
+        Port.PortType.IN,
+        position=(0, 0, 0),
+        size=(1, 1, 1),
+        surface_normal=Port.SurfaceNormal.NEG_X,
+    )
+    clone = pinhole.copy()
+    assert clone._instantiation_path == Path(__file__).resolve()
+
+    # Mutating the copy leaves the original alone.
+    clone.exposure_steps[0].bulk_exposure_multiplier = 3.0
+    clone.exposure_steps.append(ExposureSettings())
+    clone.init_kwargs["channel_size"] = (4, 4, 4)
+    clone.burnin_settings.append(2.0)
+    clone.ports["port"]._position = (0, 0, 0)
+    clone.translate((10, 0, 0))
+    assert pinhole.exposure_steps[0].bulk_exposure_multiplier == 1.0
+    assert len(pinhole.exposure_steps) == 1
+    assert pinhole.init_kwargs["channel_size"] == (8, 8, 6)
+    assert pinhole.burnin_settings == [1.0, 2.0]
+    assert pinhole.ports["port"]._position == (250, 68, 52)
+    assert pinhole._translations == [0, 0, 0]
+
+    # Attributes pointing at the component's shapes follow the copy.
+    assert clone.outlet is clone.shapes["pinhole"]
+    assert clone.outlet._object is pinhole.outlet._object
+    # Other objects, even ones with a copy method, are shared.
+    assert clone.template_port is pinhole.template_port
+
+
+def test_nested_transforms_are_applied_once_to_shapes():
+    grandchild = Component(size=(4, 4, 4), position=(0, 0, 0), quiet=True)
+    grandchild.add_label("fluidic", Color.from_name("blue", 255))
+    shape = Cube(size=(1, 2, 3), center=False)
+    grandchild.add_void("channel", shape, label="fluidic")
+    grandchild.translate((1, 0, 0))
+    grandchild.rotate(90, in_place=True)
+
+    child = Component(size=(10, 10, 10), position=(0, 0, 0), quiet=True)
+    child.add_subcomponent("grandchild", grandchild)
+    child.mirror(mirror_x=True, in_place=True)
+    child.translate((2, 3, 4))
+
+    parent = _build_parent_component(size=(30, 30, 30))
+    parent.add_subcomponent("child", child)
+
+    # Shapes are only moved once they are needed.
+    assert grandchild._shape_transform is not None
+    channel = grandchild.shapes["channel"]
+    assert grandchild._shape_transform is None
+    assert channel is shape
+
+    # Same placement as applying every transform to the shape directly.
+    expected = (7, 3, 4, 9, 4, 7)
+    assert _bbox_min_max(channel) == pytest.approx(expected)
+    assert tuple(channel._keepouts[0]) == expected
+
+
+def test_shape_ops_apply_pending_component_transform_first():
+    def placed_shape():
+        child = Component(size=(10, 10, 10), position=(0, 0, 0), quiet=True)
+        child.add_label("fluidic", Color.from_name("blue", 255))
+        shape = Cube(size=(2, 2, 2), center=False)
+        child.add_void("channel", shape, label="fluidic")
+        child.rotate(90, in_place=True)
+        child.translate((3, 0, 0))
+        parent = _build_parent_component(size=(30, 30, 30))
+        parent.add_subcomponent("child", child)
+        assert child._shape_transform is not None
+        return shape
+
+    # Keepouts are read before the manifold in booleans and transforms.
+    union = Cube(size=(1, 1, 1), center=False) + placed_shape()
+    assert tuple(union._keepouts[1]) == pytest.approx(_bbox_min_max(placed_shape()))
+    for op in (
+        lambda s: s.translate((5, 0, 0)),
+        lambda s: s.mirror((True, False, False)),
+        lambda s: s.resize((4, 4, 4)),
+    ):
+        shape = op(placed_shape())
+        assert tuple(shape._keepouts[0]) == pytest.approx(_bbox_min_max(shape))
+
+
 def test_component_no_bulk():
     comp = Component(size=(10, 10, 10), position=(0, 0, 0), quiet=True)
     comp.add_label("device", Color.from_name("gray", 255))
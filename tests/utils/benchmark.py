@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import json
+import os
+import platform
+import runpy
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+# Stage names recorded by Slicer.make_print_file grouped into benchmark metrics.
+STAGE_GROUPS = {
+    "slicing_s": ["slice_component", "slice_masks"],
+    "image_generation_s": [
+        "fill_default_settings",
+        "membrane_images",
+        "secondary_images",
+        "exposure_images",
+        "position_images",
+    ],
+    "embedding_s": ["embed_component_slices"],
+    "exposure_combination_s": ["combine_exposures"],
+    "output_s": ["write_images", "write_json", "cleanup", "zip_output", "move_output"],
+}
+
+
+def machine_info() -> Dict[str, Any]:
+    """Describe the machine the benchmark ran on."""
+    return {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run_benchmark(script: str | Path, work_dir: str | Path) -> Dict[str, Any]:
+    """Run an example script in a fresh interpreter and return its benchmark metrics.
+
+    A subprocess is used so the peak RSS belongs to this script alone, and the
+    script is copied into the work directory so routing caches start empty.
+    """
+    repo_root = Path(__file__).resolve().parents[2]
+    script = Path(shutil.copy2(script, Path(work_dir) / Path(script).name))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(repo_root), env.get("PYTHONPATH", "")]
+    ).rstrip(os.pathsep)
+    result = subprocess.run(
+        [sys.executable, "-m", "tests.utils.benchmark", str(script.resolve())],
+        cwd=work_dir,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"Benchmark of {script} failed:\n{result.stdout[-2000:]}\n{result.stderr[-2000:]}"
+        )
+    for line in reversed(result.stdout.splitlines()):
+        if line.startswith("BENCHMARK "):
+            return json.loads(line[len("BENCHMARK "):])
+    raise RuntimeError(f"Benchmark of {script} produced no results")
+
+
+def compare_to_baseline(
+    measured: Dict[str, Any],
+    baseline: Dict[str, Any],
+    time_tolerance: float = 1.5,
+    time_slack_s: float = 0.5,
+    memory_tolerance: float = 1.25,
+    memory_slack_mb: float = 50.0,
+) -> list[str]:
+    """Return a list of regressions of the measured metrics against the baseline."""
+    regressions = []
+    for key, expected in baseline.items():
+        actual = measured.get(key)
+        if actual is None or expected is None:
+            continue
+        if key.endswith("_s"):
+            limit = expected * time_tolerance + time_slack_s
+        elif key.endswith("_mb"):
+            limit = expected * memory_tolerance + memory_slack_mb
+        else:
+            continue
+        if actual > limit:
+            regressions.append(
+                f"{key}: {actual:.3f} exceeds limit {limit:.3f} (baseline {expected:.3f})"
+            )
+    return regressions
+
+
+def _main(script: str) -> None:
+    from pymfcad.slicer import Slicer
+    from pymfcad.slicer.profiling import _peak_rss_mb
+
+    profiles = []
+    make_print_file = Slicer.make_print_file
+
+    def _profiled_make_print_file(self, *args, **kwargs):
+        profile = make_print_file(self, *args, **kwargs)
+        if profile is None:
+            raise RuntimeError("make_print_file failed")
+        profiles.append(profile)
+        return profile
+
+    Slicer.make_print_file = _profiled_make_print_file
+
+    start = time.perf_counter()
+    runpy.run_path(script, run_name="__main__")
+    metrics = {"total_s": time.perf_counter() - start}
+
+    for group, stages in STAGE_GROUPS.items():
+        metrics[group] = 0.0
+        for profile in profiles:
+            totals = profile.totals_by_stage()
+            metrics[group] += sum(
+                totals[stage]["wall_time_s"] for stage in stages if stage in totals
+            )
+    metrics["layers"] = sum(
+        profile.totals_by_stage().get("combine_exposures", {}).get("count", 0)
+        for profile in profiles
+    )
+    metrics["peak_rss_mb"] = _peak_rss_mb()
+    metrics = {
+        key: round(value, 3) if isinstance(value, float) else value
+        for key, value in metrics.items()
+    }
+    print("BENCHMARK " + json.dumps(metrics))
+
+
+if __name__ == "__main__":
+    _main(sys.argv[1])